@@ -1,17 +1,30 @@
-from cfevals.benchmarks.base import (
-    AsOfSlice,
-    Benchmark,
-    ScenarioBenchmark,
-    ScenarioSample,
-    TimeSeriesBenchmark,
-    TimeSeriesDataset,
-    TimeSeriesPoint,
-    WalkForwardWindow,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cfevals.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from cfevals.benchmarks.base import (
+        AsOfSlice,
+        Benchmark,
+        PanelBenchmark,
+        ScenarioBenchmark,
+        ScenarioSample,
+        TimeSeriesBenchmark,
+        TimeSeriesDataset,
+        TimeSeriesPoint,
+        WalkForwardWindow,
+    )
+    from cfevals.benchmarks.columnar import ColumnarTimeSeriesDataset
+    from cfevals.benchmarks.panel import PanelDataset
 
 __all__ = [
     "AsOfSlice",
     "Benchmark",
+    "ColumnarTimeSeriesDataset",
+    "PanelBenchmark",
+    "PanelDataset",
     "ScenarioBenchmark",
     "ScenarioSample",
     "TimeSeriesBenchmark",
@@ -19,3 +32,25 @@ __all__ = [
     "TimeSeriesPoint",
     "WalkForwardWindow",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        **dict.fromkeys(
+            [
+                "AsOfSlice",
+                "Benchmark",
+                "PanelBenchmark",
+                "ScenarioBenchmark",
+                "ScenarioSample",
+                "TimeSeriesBenchmark",
+                "TimeSeriesDataset",
+                "TimeSeriesPoint",
+                "WalkForwardWindow",
+            ],
+            "cfevals.benchmarks.base",
+        ),
+        "ColumnarTimeSeriesDataset": "cfevals.benchmarks.columnar",
+        "PanelDataset": "cfevals.benchmarks.panel",
+    },
+)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Iterable
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from cfevals.benchmarks.columnar import ColumnarTimeSeriesDataset
+    from cfevals.benchmarks.panel import PanelDataset
 
 
 @dataclass(frozen=True)
@@ -15,20 +23,22 @@ class TimeSeriesPoint:
 
 @dataclass(frozen=True)
 class AsOfSlice:
-    history: list[float]
-    timestamps: list[datetime]
-    features: dict[str, list[float]]
+    history: list[float] | np.ndarray
+    timestamps: list[datetime] | np.ndarray
+    features: dict[str, list[float] | np.ndarray]
 
 
 @dataclass(frozen=True)
 class WalkForwardWindow:
+    # Columnar datasets fill the sequence fields with read-only ndarray views
+    # (datetime64 for timestamps); use `to_list` where plain lists are needed.
     as_of: datetime
-    history: list[float]
-    history_timestamps: list[datetime]
-    history_features: dict[str, list[float]]
-    future: list[float]
-    future_timestamps: list[datetime]
-    future_features: dict[str, list[float]]
+    history: list[float] | np.ndarray
+    history_timestamps: list[datetime] | np.ndarray
+    history_features: dict[str, list[float] | np.ndarray]
+    future: list[float] | np.ndarray
+    future_timestamps: list[datetime] | np.ndarray
+    future_features: dict[str, list[float] | np.ndarray]
     window_index: int
 
 
@@ -37,18 +47,56 @@ class TimeSeriesDataset:
     points: list[TimeSeriesPoint]
     frequency: str | None = None
     metadata: dict[str, Any] | None = None
+    _timestamps: list[datetime] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.points.sort(key=lambda point: point.timestamp)
+        timestamps = [p.timestamp for p in self.points]
+        if any(later < earlier for earlier, later in pairwise(timestamps)):
+            self.points.sort(key=lambda point: point.timestamp)
+            timestamps = [p.timestamp for p in self.points]
+        self._timestamps = timestamps
 
     def as_of(self, timestamp: datetime) -> AsOfSlice:
-        history_points = [p for p in self.points if p.timestamp <= timestamp]
-        if not history_points:
+        end = bisect_right(self._timestamps, timestamp)
+        if end == 0:
             return AsOfSlice(history=[], timestamps=[], features={})
+        history_points = self.points[:end]
         history = [p.value for p in history_points]
-        timestamps = [p.timestamp for p in history_points]
         features = _collect_feature_series(history_points)
-        return AsOfSlice(history=history, timestamps=timestamps, features=features)
+        return AsOfSlice(history=history, timestamps=self._timestamps[:end], features=features)
+
+    def as_of_many(self, timestamps: Sequence[datetime]) -> list[AsOfSlice]:
+        ends = [bisect_right(self._timestamps, timestamp) for timestamp in timestamps]
+        if not ends:
+            return []
+        history = [p.value for p in self.points[: max(ends)]]
+        features: dict[str, list[float]] = {}
+        counts: dict[int, dict[str, int]] = {}
+        position = 0
+        for end in sorted(set(ends)):
+            _extend_feature_series(features, self.points[position:end])
+            counts[end] = {key: len(values) for key, values in features.items()}
+            position = end
+        slices: list[AsOfSlice] = []
+        for end in ends:
+            if end == 0:
+                slices.append(AsOfSlice(history=[], timestamps=[], features={}))
+                continue
+            slices.append(
+                AsOfSlice(
+                    history=history[:end],
+                    timestamps=self._timestamps[:end],
+                    features={key: features[key][:count] for key, count in counts[end].items()},
+                )
+            )
+        return slices
+
+    def to_columnar(self) -> ColumnarTimeSeriesDataset:
+        from cfevals.benchmarks.columnar import ColumnarTimeSeriesDataset  # noqa: PLC0415
+
+        return ColumnarTimeSeriesDataset.from_points(
+            self.points, frequency=self.frequency, metadata=self.metadata
+        )
 
     def walk_forward_windows(
         self,
@@ -93,9 +141,10 @@ class TimeSeriesDataset:
 
 @dataclass(frozen=True)
 class ScenarioSample:
+    # history/future are read-only ndarray views for store-backed benchmarks.
     sample_id: str
-    history: list[float]
-    future: list[float]
+    history: list[float] | np.ndarray
+    future: list[float] | np.ndarray
     context_text: str | None = None
     roi: tuple[float, float] | None = None
     metadata: dict[str, Any] | None = None
@@ -113,7 +162,7 @@ class TimeSeriesBenchmark(Benchmark):
     kind = "time_series"
 
     @abc.abstractmethod
-    def load(self) -> TimeSeriesDataset:
+    def load(self) -> TimeSeriesDataset | ColumnarTimeSeriesDataset:
         raise NotImplementedError
 
 
@@ -121,15 +170,88 @@ class ScenarioBenchmark(Benchmark):
     kind = "scenario"
 
     @abc.abstractmethod
-    def load(self) -> list[ScenarioSample]:
+    def load(self) -> Sequence[ScenarioSample]:
+        raise NotImplementedError
+
+    def iter_samples(self) -> Iterator[ScenarioSample]:
+        yield from self.load()
+
+
+class PanelBenchmark(Benchmark):
+    # Many related series evaluated under one walk-forward config.
+    kind = "panel"
+
+    @abc.abstractmethod
+    def load(self) -> PanelDataset:
         raise NotImplementedError
 
 
+def to_list(values: Any) -> list[Any]:
+    if isinstance(values, list):
+        return values
+    tolist = getattr(values, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return list(values)
+
+
+class LazyList(Sequence[Any]):
+    # A read-only list view over an ndarray, for models that did not opt into arrays:
+    # items become Python scalars only as they are read, so building a request for a
+    # long expanding window copies nothing and the model pays for the points it uses.
+    __slots__ = ("_array",)
+
+    def __init__(self, array: np.ndarray) -> None:
+        self._array = array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return LazyList(self._array[index])
+        return self._array[index].item()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._array.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, LazyList)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __add__(self, other: Sequence[Any]) -> list[Any]:
+        return self.tolist() + list(other)
+
+    def __radd__(self, other: Sequence[Any]) -> list[Any]:
+        return list(other) + self.tolist()
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return self._array if dtype is None else self._array.astype(dtype, copy=False)
+
+    def tolist(self) -> list[Any]:
+        return self._array.tolist()
+
+
+def lazy_list(values: Any) -> list[Any] | LazyList:
+    # Lists pass through; anything else (ndarray views) is wrapped, not converted.
+    if isinstance(values, (list, LazyList)):
+        return values
+    return LazyList(values)
+
+
 def _collect_feature_series(points: list[TimeSeriesPoint]) -> dict[str, list[float]]:
     features: dict[str, list[float]] = {}
+    _extend_feature_series(features, points)
+    return features
+
+
+def _extend_feature_series(features: dict[str, list[float]], points: list[TimeSeriesPoint]) -> None:
     for point in points:
         if not point.features:
             continue
         for key, value in point.features.items():
             features.setdefault(key, []).append(float(value))
-    return features
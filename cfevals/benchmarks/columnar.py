@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from cfevals.benchmarks.base import AsOfSlice, TimeSeriesPoint, WalkForwardWindow
+
+TIMESTAMP_DTYPE = "datetime64[us]"
+
+
+@dataclass
+class ColumnarTimeSeriesDataset:
+    values: np.ndarray
+    timestamps: np.ndarray
+    feature_names: tuple[str, ...] = ()
+    feature_matrix: np.ndarray | None = None
+    frequency: str | None = None
+    metadata: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        values = np.ascontiguousarray(self.values, dtype=np.float64)
+        timestamps = np.ascontiguousarray(self.timestamps, dtype=TIMESTAMP_DTYPE)
+        if values.ndim != 1:
+            raise ValueError(f"values must be 1-D, got shape {values.shape}")
+        if timestamps.shape != values.shape:
+            raise ValueError(
+                f"timestamps shape {timestamps.shape} does not match values shape {values.shape}"
+            )
+        self.feature_names = tuple(self.feature_names)
+        if self.feature_matrix is None:
+            matrix = np.empty((len(self.feature_names), len(values)), dtype=np.float64)
+            matrix.fill(np.nan)
+        else:
+            matrix = np.ascontiguousarray(self.feature_matrix, dtype=np.float64)
+            if matrix.ndim == 1:
+                matrix = matrix.reshape(1, -1)
+        if matrix.shape != (len(self.feature_names), len(values)):
+            raise ValueError(
+                f"feature_matrix shape {matrix.shape} does not match "
+                f"({len(self.feature_names)}, {len(values)})"
+            )
+        if len(timestamps) > 1 and not bool(np.all(timestamps[1:] >= timestamps[:-1])):
+            order = np.argsort(timestamps, kind="stable")
+            values = values[order]
+            timestamps = timestamps[order]
+            matrix = np.ascontiguousarray(matrix[:, order])
+        self.values = _readonly(values)
+        self.timestamps = _readonly(timestamps)
+        self.feature_matrix = _readonly(matrix)
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Iterable[TimeSeriesPoint],
+        *,
+        frequency: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> "ColumnarTimeSeriesDataset":
+        points = list(points)
+        names: dict[str, int] = {}
+        for point in points:
+            for key in point.features or ():
+                names.setdefault(key, len(names))
+        matrix = np.full((len(names), len(points)), np.nan, dtype=np.float64)
+        for col, point in enumerate(points):
+            for key, value in (point.features or {}).items():
+                matrix[names[key], col] = float(value)
+        return cls(
+            values=np.fromiter((p.value for p in points), dtype=np.float64, count=len(points)),
+            timestamps=np.array([p.timestamp for p in points], dtype=TIMESTAMP_DTYPE),
+            feature_names=tuple(names),
+            feature_matrix=matrix,
+            frequency=frequency,
+            metadata=metadata,
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def features(self) -> dict[str, np.ndarray]:
+        return {name: self.feature_matrix[idx] for idx, name in enumerate(self.feature_names)}
+
+    @cached_property
+    def points(self) -> list[TimeSeriesPoint]:
+        timestamps = self.timestamps.tolist()
+        values = self.values.tolist()
+        columns = self.feature_matrix.T.tolist()
+        points: list[TimeSeriesPoint] = []
+        for ts, value, row in zip(timestamps, values, columns):
+            features = {
+                name: feature for name, feature in zip(self.feature_names, row) if feature == feature
+            }
+            points.append(TimeSeriesPoint(timestamp=ts, value=value, features=features or None))
+        return points
+
+    def as_of(self, timestamp: datetime) -> AsOfSlice:
+        end = int(np.searchsorted(self.timestamps, np.datetime64(timestamp, "us"), side="right"))
+        return self._as_of_slice(end)
+
+    def as_of_many(self, timestamps: Sequence[datetime]) -> list[AsOfSlice]:
+        queries = np.asarray(timestamps, dtype=TIMESTAMP_DTYPE)
+        ends = np.searchsorted(self.timestamps, queries, side="right")
+        return [self._as_of_slice(end) for end in ends.tolist()]
+
+    def _as_of_slice(self, end: int) -> AsOfSlice:
+        if end == 0:
+            return AsOfSlice(history=self.values[:0], timestamps=self.timestamps[:0], features={})
+        return AsOfSlice(
+            history=self.values[:end],
+            timestamps=self.timestamps[:end],
+            features=self._feature_views(0, end),
+        )
+
+    def window_at(
+        self,
+        index: int,
+        *,
+        horizon: int,
+        step: int,
+        min_train_size: int,
+        max_train_size: int | None = None,
+    ) -> WalkForwardWindow | None:
+        start = min_train_size + index * step
+        stop = start + horizon
+        if start <= 0 or horizon <= 0 or stop > len(self.values):
+            return None
+        lo = max(start - max_train_size, 0) if max_train_size else 0
+        return WalkForwardWindow(
+            as_of=self.timestamps[start - 1].item(),
+            history=self.values[lo:start],
+            history_timestamps=self.timestamps[lo:start],
+            history_features=self._feature_views(lo, start),
+            future=self.values[start:stop],
+            future_timestamps=self.timestamps[start:stop],
+            future_features=self._feature_views(start, stop),
+            window_index=index,
+        )
+
+    def walk_forward_windows(
+        self,
+        *,
+        horizon: int,
+        step: int,
+        min_train_size: int,
+        max_train_size: int | None = None,
+        max_windows: int | None = None,
+    ) -> Iterable[WalkForwardWindow]:
+        window_index = 0
+        while max_windows is None or window_index < max_windows:
+            window = self.window_at(
+                window_index,
+                horizon=horizon,
+                step=step,
+                min_train_size=min_train_size,
+                max_train_size=max_train_size,
+            )
+            if window is None:
+                break
+            yield window
+            window_index += 1
+
+    def _feature_views(self, lo: int, hi: int) -> dict[str, np.ndarray]:
+        return {name: self.feature_matrix[idx, lo:hi] for idx, name in enumerate(self.feature_names)}
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
 
 from cfevals.benchmarks.base import ScenarioBenchmark, ScenarioSample
+from cfevals.benchmarks.scenario_store import open_scenario_store, write_scenario_store
+from cfevals.paths import default_cache_dir
 
 
 @dataclass
@@ -13,44 +17,94 @@ class ContextIsKeyBenchmark(ScenarioBenchmark):
     max_samples: int | None = None
     cache_dir: str | None = None
     allow_fallback: bool = False
+    # Converts the split once into a memory-mapped local store and serves samples
+    # from it as lazy views; the HF dataset is only read to build the store.
+    use_store: bool = False
 
-    def load(self) -> list[ScenarioSample]:
-        from datasets import load_dataset  # noqa: PLC0415
-
-        cache_dir = self.cache_dir or os.environ.get("CFEVALS_CACHE")
+    def load(self) -> Sequence[ScenarioSample]:
+        if self.use_store:
+            return self._load_store()
         try:
-            ds = load_dataset(self.dataset_name, split=self.split, cache_dir=cache_dir)
+            ds = self._load_dataset()
         except Exception as exc:  # noqa: BLE001
             if self.allow_fallback:
-                return [
-                    ScenarioSample(
-                        sample_id="cik-fallback-0",
-                        history=[1.0, 2.0, 3.0],
-                        future=[3.5, 3.7],
-                        context_text="Synthetic fallback sample.",
-                        roi=(0.0, 10.0),
-                    )
-                ]
-            raise RuntimeError(
-                f"Failed to load CiK dataset {self.dataset_name!r}. "
-                "Check network access or set CFEVALS_CACHE for offline use."
-            ) from exc
-
-        samples: list[ScenarioSample] = []
+                return [_fallback_sample()]
+            raise self._load_error() from exc
+
         limit = self.max_samples or len(ds)
-        for idx, row in enumerate(ds):
-            if idx >= limit:
-                break
+        return list(self._samples(islice(ds, limit)))
+
+    def iter_samples(self) -> Iterator[ScenarioSample]:
+        if self.use_store:
+            yield from self._load_store()
+            return
+        # Uses the HF iterable dataset so rows are fetched and converted on demand.
+        try:
+            ds = self._load_dataset(streaming=True)
+        except Exception as exc:  # noqa: BLE001
+            if self.allow_fallback:
+                yield _fallback_sample()
+                return
+            raise self._load_error() from exc
+
+        yield from self._samples(islice(ds, self.max_samples or None))
+
+    def store_path(self) -> str:
+        name = self.dataset_name.replace("/", "__").lower()
+        return os.path.join(self.cache_dir or default_cache_dir(), f"cik_store_{name}_{self.split}")
+
+    def _load_store(self) -> Sequence[ScenarioSample]:
+        path = self.store_path()
+        expected = {"dataset_name": self.dataset_name, "split": self.split}
+        store = open_scenario_store(path, expected)
+        if store is None:
+            try:
+                ds = self._load_dataset()
+            except Exception as exc:  # noqa: BLE001
+                if self.allow_fallback:
+                    return [_fallback_sample()]
+                raise self._load_error() from exc
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # The whole split is stored; max_samples only limits what is served.
+            write_scenario_store(
+                path, self._samples(ds), expected, sample_metadata={"dataset": self.dataset_name}
+            )
+            store = open_scenario_store(path, expected)
+            if store is None:
+                raise RuntimeError(f"failed to read back the CiK store at {path}")
+        return store[: self.max_samples] if self.max_samples else store
+
+    def _load_dataset(self, **kwargs: Any) -> Any:
+        from datasets import load_dataset  # noqa: PLC0415
+
+        cache_dir = self.cache_dir or os.environ.get("CFEVALS_CACHE")
+        return load_dataset(self.dataset_name, split=self.split, cache_dir=cache_dir, **kwargs)
+
+    def _load_error(self) -> RuntimeError:
+        return RuntimeError(
+            f"Failed to load CiK dataset {self.dataset_name!r}. "
+            "Check network access or set CFEVALS_CACHE for offline use."
+        )
+
+    def _samples(self, rows: Iterable[dict[str, Any]]) -> Iterator[ScenarioSample]:
+        for idx, row in enumerate(rows):
             roi = row.get("roi")
             roi_tuple = tuple(roi) if roi else None
-            samples.append(
-                ScenarioSample(
-                    sample_id=row.get("sample_id", f"cik-{idx}"),
-                    history=list(row.get("history") or []),
-                    future=list(row.get("future") or []),
-                    context_text=row.get("context"),
-                    roi=roi_tuple,
-                    metadata={"dataset": self.dataset_name},
-                )
+            yield ScenarioSample(
+                sample_id=row.get("sample_id", f"cik-{idx}"),
+                history=list(row.get("history") or []),
+                future=list(row.get("future") or []),
+                context_text=row.get("context"),
+                roi=roi_tuple,
+                metadata={"dataset": self.dataset_name},
             )
-        return samples
+
+
+def _fallback_sample() -> ScenarioSample:
+    return ScenarioSample(
+        sample_id="cik-fallback-0",
+        history=[1.0, 2.0, 3.0],
+        future=[3.5, 3.7],
+        context_text="Synthetic fallback sample.",
+        roi=(0.0, 10.0),
+    )
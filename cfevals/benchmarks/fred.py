@@ -2,17 +2,23 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from typing import Any
 
-import pandas as pd
+import numpy as np
 
-from cfevals.benchmarks.base import TimeSeriesBenchmark, TimeSeriesDataset, TimeSeriesPoint
+from cfevals.benchmarks.base import PanelBenchmark, TimeSeriesBenchmark
+from cfevals.benchmarks.columnar import TIMESTAMP_DTYPE, ColumnarTimeSeriesDataset
+from cfevals.benchmarks.panel import PanelDataset
+from cfevals.paths import default_cache_dir, replace_directory
 
+# Bump when the on-disk layout changes; older caches are then refetched.
+# 2: missing observations are dropped rather than stored as NaN.
+CACHE_FORMAT_VERSION = 2
 
-def default_cache_dir() -> str:
-    return os.environ.get("CFEVALS_CACHE", os.path.expanduser("~/.cfevals/cache"))
+# (timestamps, target, covariate) as stored in the cache.
+_Arrays = tuple[np.ndarray, np.ndarray, "np.ndarray | None"]
 
 
 @dataclass
@@ -21,58 +27,180 @@ class FredUnrateBenchmark(TimeSeriesBenchmark):
     covariate_series: str | None = None
     start_date: str = "1976-01-01"
     frequency: str | None = "M"
+    # Refetch when the cached series is older than this; None reuses it indefinitely.
+    max_age_days: float | None = None
 
-    def load(self) -> TimeSeriesDataset:
+    def load(self) -> ColumnarTimeSeriesDataset:
         cache_dir = default_cache_dir()
         os.makedirs(cache_dir, exist_ok=True)
-        cache_key = self.target_series.lower()
-        cache_path = os.path.join(cache_dir, f"fred_{cache_key}.json")
-
-        if os.path.exists(cache_path):
-            with open(cache_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-            target = pd.Series(payload["target"], index=pd.to_datetime(payload["index"]))
-            covariate = None
-            if self.covariate_series and payload.get("covariate"):
-                covariate = pd.Series(payload["covariate"], index=pd.to_datetime(payload["index"]))
-        else:
-            from pandas_datareader import data as web  # noqa: PLC0415
-
-            target = web.DataReader(self.target_series, "fred", self.start_date)[self.target_series]
-            covariate = None
-            if self.covariate_series:
-                covariate = web.DataReader(self.covariate_series, "fred", self.start_date)[
-                    self.covariate_series
-                ]
-                covariate = covariate.reindex(target.index).ffill()
-            payload = {
-                "index": [str(ts.date()) for ts in target.index],
-                "target": target.tolist(),
-                "covariate": covariate.tolist() if covariate is not None else None,
-            }
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f)
-
-        points: list[TimeSeriesPoint] = []
-        for ts, val in target.items():
-            features: dict[str, float] | None = None
-            if covariate is not None and ts in covariate.index:
-                features = {"covariate": float(covariate.loc[ts])}
-            points.append(
-                TimeSeriesPoint(
-                    timestamp=_normalize_timestamp(ts),
-                    value=float(val) if val is not None else float("nan"),
-                    features=features,
-                )
-            )
+        cache_path = os.path.join(cache_dir, self.cache_key())
+        expected = _cache_metadata(self.target_series, self.covariate_series, self.start_date)
+
+        arrays = _read_cache(cache_path, expected, self.max_age_days)
+        if arrays is None:
+            legacy = self._read_legacy_cache(cache_dir)
+            if legacy is not None:
+                arrays, fetched_at = legacy
+            else:
+                arrays, fetched_at = self._fetch(), time.time()
+            _write_cache(cache_path, arrays, {**expected, "fetched_at": fetched_at}, self.max_age_days)
+
+        timestamps, target, covariate = arrays
         metadata: dict[str, Any] = {
             "target_series": self.target_series,
             "covariate_series": self.covariate_series,
         }
-        return TimeSeriesDataset(points=points, frequency=self.frequency, metadata=metadata)
+        return ColumnarTimeSeriesDataset(
+            values=target,
+            timestamps=timestamps,
+            feature_names=("covariate",) if covariate is not None else (),
+            feature_matrix=covariate,
+            frequency=self.frequency,
+            metadata=metadata,
+        )
+
+    def cache_key(self) -> str:
+        return _cache_key(self.target_series, self.covariate_series, self.start_date)
+
+    def _read_legacy_cache(self, cache_dir: str) -> tuple[_Arrays, float] | None:
+        # fred_<target>.json predates the binary cache and was keyed on the target
+        # series alone: it does not say which covariate it holds or which start date
+        # it was fetched from. It is only migrated without a covariate, and only when
+        # it reaches back to start_date, trimmed to it; anything else is refetched.
+        path = os.path.join(cache_dir, f"fred_{self.target_series.lower()}.json")
+        if self.covariate_series or not os.path.exists(path):
+            return None
+        fetched_at = os.path.getmtime(path)
+        if _expired(fetched_at, self.max_age_days):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        timestamps = np.array(payload["index"], dtype=TIMESTAMP_DTYPE)
+        start = np.datetime64(self.start_date, "us")
+        if not timestamps.size or timestamps[0] > start:
+            return None
+        target = np.array(payload["target"], dtype=np.float64)
+        keep = (timestamps >= start) & ~np.isnan(target)
+        return (timestamps[keep], target[keep], None), fetched_at
+
+    def _fetch(self) -> _Arrays:
+        series_ids = [self.target_series]
+        if self.covariate_series and self.covariate_series != self.target_series:
+            series_ids.append(self.covariate_series)
+        fetched = _fetch_series(series_ids, self.start_date)
+        timestamps, target = fetched[self.target_series]
+        covariate = None
+        if self.covariate_series:
+            # Aligned to the target's dates, carrying the last value over missing ones.
+            import pandas as pd  # noqa: PLC0415
+
+            covariate_timestamps, covariate_values = fetched[self.covariate_series]
+            series = pd.Series(covariate_values, index=covariate_timestamps)
+            covariate = series.reindex(timestamps).ffill().to_numpy(dtype=np.float64)
+        return timestamps, target, covariate
+
+
+@dataclass
+class FredPanelBenchmark(PanelBenchmark):
+    series: list[str] = field(default_factory=list)
+    start_date: str = "1976-01-01"
+    frequency: str | None = "M"
+    max_age_days: float | None = None
+
+    def load(self) -> PanelDataset:
+        # Each member shares its cache entry with FredUnrateBenchmark(target_series=...).
+        cache_dir = default_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        series_ids = list(dict.fromkeys(self.series))
+        paths = {
+            series_id: os.path.join(cache_dir, _cache_key(series_id, None, self.start_date))
+            for series_id in series_ids
+        }
+        arrays: dict[str, _Arrays] = {}
+        for series_id in series_ids:
+            expected = _cache_metadata(series_id, None, self.start_date)
+            cached = _read_cache(paths[series_id], expected, self.max_age_days)
+            if cached is not None:
+                arrays[series_id] = cached
+        missing = [series_id for series_id in series_ids if series_id not in arrays]
+        if missing:
+            fetched_at = time.time()
+            for series_id, fetched in self._fetch(missing).items():
+                metadata = {**_cache_metadata(series_id, None, self.start_date), "fetched_at": fetched_at}
+                _write_cache(paths[series_id], fetched, metadata, self.max_age_days)
+                arrays[series_id] = fetched
+        return PanelDataset.from_series(
+            {series_id: (arrays[series_id][0], arrays[series_id][1]) for series_id in series_ids},
+            frequency=self.frequency,
+            metadata={"source": "fred"},
+        )
+
+    def _fetch(self, series_ids: list[str]) -> dict[str, _Arrays]:
+        fetched = _fetch_series(series_ids, self.start_date)
+        return {series_id: (*fetched[series_id], None) for series_id in series_ids}
+
+
+def _fetch_series(series_ids: list[str], start_date: str) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    # One request for every series; FRED returns them as columns on a shared date
+    # index, so each column is trimmed back to its own observations.
+    from pandas_datareader import data as web  # noqa: PLC0415
+
+    frame = web.DataReader(series_ids, "fred", start_date)
+    fetched: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    for series_id in series_ids:
+        column = frame[series_id].dropna()
+        fetched[series_id] = (column.index.to_numpy(dtype=TIMESTAMP_DTYPE), column.to_numpy(dtype=np.float64))
+    return fetched
+
+
+def _cache_key(target_series: str, covariate_series: str | None, start_date: str) -> str:
+    covariate = (covariate_series or "none").lower()
+    return f"fred_{target_series.lower()}_{covariate}_{start_date}"
+
+
+def _cache_metadata(target_series: str, covariate_series: str | None, start_date: str) -> dict[str, Any]:
+    return {
+        "format_version": CACHE_FORMAT_VERSION,
+        "target_series": target_series,
+        "covariate_series": covariate_series,
+        "start_date": start_date,
+    }
+
+
+def _read_cache(path: str, expected: dict[str, Any], max_age_days: float | None) -> _Arrays | None:
+    try:
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if any(meta.get(key) != value for key, value in expected.items()):
+        return None
+    if _expired(meta["fetched_at"], max_age_days):
+        return None
+    # Memory-mapped: the arrays are paged in on first access, not parsed.
+    timestamps = np.load(os.path.join(path, "timestamps.npy"), mmap_mode="r")
+    target = np.load(os.path.join(path, "target.npy"), mmap_mode="r")
+    covariate = None
+    if expected["covariate_series"]:
+        covariate = np.load(os.path.join(path, "covariate.npy"), mmap_mode="r")
+    return timestamps, target, covariate
+
+
+def _expired(fetched_at: float, max_age_days: float | None) -> bool:
+    return max_age_days is not None and time.time() - fetched_at > max_age_days * 86400
+
+
+def _write_cache(path: str, arrays: _Arrays, metadata: dict[str, Any], max_age_days: float | None) -> None:
+    timestamps, target, covariate = arrays
+    expected = {key: value for key, value in metadata.items() if key != "fetched_at"}
 
+    def write(tmp_path: str) -> None:
+        np.save(os.path.join(tmp_path, "timestamps.npy"), np.asarray(timestamps, dtype=TIMESTAMP_DTYPE))
+        np.save(os.path.join(tmp_path, "target.npy"), np.asarray(target, dtype=np.float64))
+        if covariate is not None:
+            np.save(os.path.join(tmp_path, "covariate.npy"), np.asarray(covariate, dtype=np.float64))
+        with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({**metadata, "length": len(target)}, f)
 
-def _normalize_timestamp(ts: Any) -> datetime:
-    if isinstance(ts, datetime):
-        return ts
-    return pd.to_datetime(ts).to_pydatetime()
+    # A concurrent writer's fresh entry for the same request is as good as ours.
+    replace_directory(path, write, lambda existing: _read_cache(existing, expected, max_age_days) is not None)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+
+from cfevals.benchmarks.columnar import TIMESTAMP_DTYPE, ColumnarTimeSeriesDataset, _readonly
+
+
+@dataclass
+class PanelDataset:
+    # Every series is stored end to end in one values array and one timestamps
+    # array: series i spans [offsets[i], offsets[i + 1]) with its own dates, so
+    # series on different grids (or with gaps) carry no NaN padding.
+    series_ids: tuple[str, ...]
+    values: np.ndarray
+    timestamps: np.ndarray
+    offsets: np.ndarray
+    frequency: str | None = None
+    metadata: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        self.series_ids = tuple(self.series_ids)
+        values = np.ascontiguousarray(self.values, dtype=np.float64)
+        timestamps = np.ascontiguousarray(self.timestamps, dtype=TIMESTAMP_DTYPE)
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        count = len(self.series_ids)
+        if values.ndim != 1 or values.shape != timestamps.shape:
+            raise ValueError(f"values shape {values.shape} does not match timestamps {timestamps.shape}")
+        if offsets.shape != (count + 1,):
+            raise ValueError(f"offsets must have shape ({count + 1},), got {offsets.shape}")
+        if offsets[0] != 0 or offsets[-1] != len(values) or np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must increase from 0 to the number of observations")
+        self.values = _readonly(values)
+        self.timestamps = _readonly(timestamps)
+        self.offsets = _readonly(offsets)
+
+    @classmethod
+    def from_series(
+        cls,
+        series: Mapping[str, tuple[np.ndarray, np.ndarray]],
+        *,
+        frequency: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> "PanelDataset":
+        # series maps id -> (timestamps, values), each already in time order.
+        parts = list(series.values())
+        offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+        np.cumsum([len(series_values) for _, series_values in parts], out=offsets[1:])
+        if parts:
+            timestamps = np.concatenate([np.asarray(ts, dtype=TIMESTAMP_DTYPE) for ts, _ in parts])
+            values = np.concatenate([np.asarray(vals, dtype=np.float64) for _, vals in parts])
+        else:
+            timestamps = np.empty(0, dtype=TIMESTAMP_DTYPE)
+            values = np.empty(0, dtype=np.float64)
+        return cls(
+            series_ids=tuple(series),
+            values=values,
+            timestamps=timestamps,
+            offsets=offsets,
+            frequency=frequency,
+            metadata=metadata,
+        )
+
+    def __len__(self) -> int:
+        return len(self.series_ids)
+
+    def series(self, index: int) -> ColumnarTimeSeriesDataset:
+        # Slices of the panel: windows of every series are views into one array.
+        lo, hi = int(self.offsets[index]), int(self.offsets[index + 1])
+        return ColumnarTimeSeriesDataset(
+            values=self.values[lo:hi],
+            timestamps=self.timestamps[lo:hi],
+            frequency=self.frequency,
+            metadata={**(self.metadata or {}), "series_id": self.series_ids[index]},
+        )
+
+    def items(self) -> Iterator[tuple[str, ColumnarTimeSeriesDataset]]:
+        for index, series_id in enumerate(self.series_ids):
+            yield series_id, self.series(index)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+import numpy as np
+
+from cfevals.benchmarks.base import ScenarioSample
+from cfevals.paths import replace_directory
+
+# Bump when the on-disk layout changes; older stores are then rebuilt.
+STORE_FORMAT_VERSION = 1
+
+_ARRAYS = (
+    "history",
+    "history_offsets",
+    "future",
+    "future_offsets",
+    "roi",
+    "sample_ids",
+    "sample_id_offsets",
+    "contexts",
+    "context_offsets",
+    "has_context",
+)
+
+
+class ScenarioStore(Sequence[ScenarioSample]):
+    # Scenario samples over memory-mapped columns: histories and futures are
+    # concatenated float arrays indexed by offsets, and ids and context texts are
+    # UTF-8 string tables. Samples are built on access, with history/future as
+    # read-only views, so opening a store costs neither parsing nor private memory.
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        sample_metadata: dict[str, Any] | None = None,
+        indices: range | None = None,
+    ) -> None:
+        self._arrays = arrays
+        self._sample_metadata = sample_metadata
+        self._indices = indices if indices is not None else range(len(arrays["history_offsets"]) - 1)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> ScenarioSample: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ScenarioStore": ...
+
+    def __getitem__(self, index: int | slice) -> ScenarioSample | "ScenarioStore":
+        if isinstance(index, slice):
+            return ScenarioStore(self._arrays, self._sample_metadata, self._indices[index])
+        return self._sample(self._indices[index])
+
+    def __iter__(self) -> Iterator[ScenarioSample]:
+        for row in self._indices:
+            yield self._sample(row)
+
+    def _sample(self, row: int) -> ScenarioSample:
+        arrays = self._arrays
+        roi = arrays["roi"][row]
+        has_context = bool(arrays["has_context"][row])
+        return ScenarioSample(
+            sample_id=_text(arrays["sample_ids"], arrays["sample_id_offsets"], row),
+            history=_span(arrays["history"], arrays["history_offsets"], row),
+            future=_span(arrays["future"], arrays["future_offsets"], row),
+            context_text=_text(arrays["contexts"], arrays["context_offsets"], row) if has_context else None,
+            roi=None if np.isnan(roi[0]) else (float(roi[0]), float(roi[1])),
+            # One dict shared by every sample rather than a copy per row.
+            metadata=self._sample_metadata,
+        )
+
+
+def open_scenario_store(path: str, expected: dict[str, Any]) -> ScenarioStore | None:
+    try:
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format_version") != STORE_FORMAT_VERSION:
+        return None
+    if any(meta.get(key) != value for key, value in expected.items()):
+        return None
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in _ARRAYS}
+    return ScenarioStore(arrays, meta.get("sample_metadata"))
+
+
+def write_scenario_store(
+    path: str,
+    samples: Iterable[ScenarioSample],
+    metadata: dict[str, Any],
+    sample_metadata: dict[str, Any] | None = None,
+) -> None:
+    columns: dict[str, list[Any]] = {"history": [], "future": [], "roi": [], "has_context": []}
+    sample_ids: list[bytes] = []
+    contexts: list[bytes] = []
+    for sample in samples:
+        columns["history"].append(np.asarray(sample.history, dtype=np.float64))
+        columns["future"].append(np.asarray(sample.future, dtype=np.float64))
+        columns["roi"].append(sample.roi if sample.roi is not None else (np.nan, np.nan))
+        columns["has_context"].append(sample.context_text is not None)
+        sample_ids.append(sample.sample_id.encode("utf-8"))
+        contexts.append((sample.context_text or "").encode("utf-8"))
+    arrays = {
+        **_concat("history", columns["history"], np.float64),
+        **_concat("future", columns["future"], np.float64),
+        "roi": np.asarray(columns["roi"], dtype=np.float64).reshape(-1, 2),
+        **_strings("sample_ids", "sample_id_offsets", sample_ids),
+        **_strings("contexts", "context_offsets", contexts),
+        "has_context": np.asarray(columns["has_context"], dtype=bool),
+    }
+    meta = {
+        **metadata,
+        "format_version": STORE_FORMAT_VERSION,
+        "count": len(sample_ids),
+        "created_at": time.time(),
+        "sample_metadata": sample_metadata,
+    }
+
+    def write(tmp_path: str) -> None:
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+        with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    # Another process converting the same split at the same time produces the same store.
+    replace_directory(path, write, lambda existing: open_scenario_store(existing, metadata) is not None)
+
+
+def _concat(name: str, parts: list[np.ndarray], dtype: Any) -> dict[str, np.ndarray]:
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum([len(part) for part in parts], out=offsets[1:])
+    values = np.concatenate(parts).astype(dtype, copy=False) if parts else np.empty(0, dtype=dtype)
+    return {name: values, f"{name}_offsets": offsets}
+
+
+def _strings(name: str, offsets_name: str, parts: list[bytes]) -> dict[str, np.ndarray]:
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum([len(part) for part in parts], out=offsets[1:])
+    return {name: np.frombuffer(b"".join(parts), dtype=np.uint8), offsets_name: offsets}
+
+
+def _span(values: np.ndarray, offsets: np.ndarray, row: int) -> np.ndarray:
+    return values[int(offsets[row]) : int(offsets[row + 1])]
+
+
+def _text(table: np.ndarray, offsets: np.ndarray, row: int) -> str:
+    return table[int(offsets[row]) : int(offsets[row + 1])].tobytes().decode("utf-8")
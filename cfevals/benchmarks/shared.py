@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, is_dataclass
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from cfevals.benchmarks.base import Benchmark
+from cfevals.benchmarks.columnar import ColumnarTimeSeriesDataset
+from cfevals.paths import default_cache_dir
+
+# Per-process attachments, kept open for the life of the process so arrays built
+# on their buffers stay valid.
+_ATTACHED: dict[str, shared_memory.SharedMemory] = {}
+_ATTACHED_DATASETS: dict[str, ColumnarTimeSeriesDataset] = {}
+
+
+@dataclass
+class DatasetCache:
+    # Loaded benchmark data keyed by benchmark class and load args, so registry
+    # entries that point at the same data (e.g. FRED variants with different
+    # backtest configs) load it once per process. Least recently used entries are
+    # dropped beyond max_entries.
+    max_entries: int = 8
+    hits: int = 0
+    misses: int = 0
+    _entries: OrderedDict[str, Any] = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _loading: dict[str, threading.Lock] = field(default_factory=dict, init=False, repr=False)
+
+    def load(self, benchmark: Benchmark) -> Any:
+        key = dataset_key(benchmark)
+        if key is None:
+            return benchmark.load()
+        with self._lock:
+            data = self._lookup(key)
+            if data is not None:
+                return _fresh(data)
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        # One lock per key: concurrent callers of the same data wait for one load
+        # rather than repeat it, while loads of other data proceed in parallel.
+        with key_lock:
+            with self._lock:
+                data = self._lookup(key)
+                if data is not None:
+                    return _fresh(data)
+                self.misses += 1
+            try:
+                data = benchmark.load()
+                with self._lock:
+                    self._entries[key] = data
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+        return _fresh(data)
+
+    def _lookup(self, key: str) -> Any:
+        # Called with _lock held.
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_PROCESS_CACHE = DatasetCache()
+
+
+def process_dataset_cache() -> DatasetCache:
+    return _PROCESS_CACHE
+
+
+def dataset_key(benchmark: Benchmark) -> str | None:
+    # Only dataclass benchmarks declare their load args; others load every time.
+    # CFEVALS_CACHE is part of the key since most loaders read from it.
+    if not is_dataclass(benchmark):
+        return None
+    cls = type(benchmark)
+    payload = {
+        "class": f"{cls.__module__}:{cls.__qualname__}",
+        "args": {item.name: getattr(benchmark, item.name) for item in fields(benchmark)},
+        "cache_dir": default_cache_dir(),
+    }
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def _fresh(data: Any) -> Any:
+    # Scenario lists are copied (not their frozen samples) so a caller that
+    # reorders or extends its list does not change what later loads see.
+    return list(data) if isinstance(data, list) else data
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    @classmethod
+    def create(cls, array: np.ndarray) -> tuple["SharedArray", shared_memory.SharedMemory]:
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        del view
+        return cls(name=block.name, shape=tuple(array.shape), dtype=array.dtype.str), block
+
+    def attach(self) -> np.ndarray:
+        block = _ATTACHED.get(self.name)
+        if block is None:
+            # Only the exporting process unlinks; attachments are not tracked.
+            block = shared_memory.SharedMemory(name=self.name, track=False)
+            _ATTACHED[self.name] = block
+        return np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=block.buf)
+
+
+@dataclass
+class SharedColumnar:
+    # A ColumnarTimeSeriesDataset exported to shared memory. The handle pickles as
+    # block names, so process workers attach to the exporter's arrays instead of
+    # receiving copies. The exporter unlinks the blocks on close().
+    values: SharedArray
+    timestamps: SharedArray
+    feature_matrix: SharedArray
+    feature_names: tuple[str, ...]
+    frequency: str | None = None
+    metadata: dict[str, Any] | None = None
+    _blocks: list[shared_memory.SharedMemory] = field(default_factory=list, repr=False, compare=False)
+
+    @classmethod
+    def export(cls, dataset: ColumnarTimeSeriesDataset) -> "SharedColumnar":
+        values, values_block = SharedArray.create(dataset.values)
+        timestamps, timestamps_block = SharedArray.create(dataset.timestamps)
+        matrix, matrix_block = SharedArray.create(dataset.feature_matrix)
+        return cls(
+            values=values,
+            timestamps=timestamps,
+            feature_matrix=matrix,
+            feature_names=dataset.feature_names,
+            frequency=dataset.frequency,
+            metadata=dataset.metadata,
+            _blocks=[values_block, timestamps_block, matrix_block],
+        )
+
+    def attach(self) -> ColumnarTimeSeriesDataset:
+        dataset = _ATTACHED_DATASETS.get(self.values.name)
+        if dataset is None:
+            dataset = ColumnarTimeSeriesDataset(
+                values=self.values.attach(),
+                timestamps=self.timestamps.attach(),
+                feature_names=self.feature_names,
+                feature_matrix=self.feature_matrix.attach(),
+                frequency=self.frequency,
+                metadata=self.metadata,
+            )
+            _ATTACHED_DATASETS[self.values.name] = dataset
+        return dataset
+
+    def close(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "SharedColumnar":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_blocks"] = []
+        return state
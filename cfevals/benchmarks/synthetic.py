@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+from cfevals.benchmarks.base import ScenarioBenchmark, ScenarioSample, TimeSeriesBenchmark
+from cfevals.benchmarks.columnar import TIMESTAMP_DTYPE, ColumnarTimeSeriesDataset
+
+
+@dataclass
+class SyntheticTimeSeriesBenchmark(TimeSeriesBenchmark):
+    # Seeded random walk with a weekly cycle; needs no network or cache, so it
+    # serves offline runs and the harness performance suite at any size.
+    num_points: int = 1000
+    num_features: int = 0
+    seed: int = 0
+    start_date: str = "2000-01-01"
+    frequency: str | None = "D"
+
+    def load(self) -> ColumnarTimeSeriesDataset:
+        rng = np.random.default_rng(self.seed)
+        steps = np.arange(self.num_points)
+        values = np.cumsum(rng.normal(size=self.num_points)) + 3.0 * np.sin(2.0 * np.pi * steps / 7.0)
+        timestamps = (np.datetime64(self.start_date, "D") + steps).astype(TIMESTAMP_DTYPE)
+        features = rng.normal(size=(self.num_features, self.num_points))
+        return ColumnarTimeSeriesDataset(
+            values=values,
+            timestamps=timestamps,
+            feature_names=tuple(f"feature_{idx}" for idx in range(self.num_features)),
+            feature_matrix=features,
+            frequency=self.frequency,
+            metadata={"synthetic": True, "seed": self.seed},
+        )
+
+
+@dataclass
+class SyntheticScenarioBenchmark(ScenarioBenchmark):
+    num_samples: int = 100
+    history_length: int = 48
+    horizon: int = 12
+    seed: int = 0
+
+    def load(self) -> list[ScenarioSample]:
+        return list(self.iter_samples())
+
+    def iter_samples(self) -> Iterator[ScenarioSample]:
+        rng = np.random.default_rng(self.seed)
+        length = self.history_length + self.horizon
+        for idx in range(self.num_samples):
+            series = np.cumsum(rng.normal(size=length)).tolist()
+            future = series[self.history_length :]
+            yield ScenarioSample(
+                sample_id=f"synthetic-{idx}",
+                history=series[: self.history_length],
+                future=future,
+                context_text=f"Synthetic random walk {idx}.",
+                roi=(min(future), max(future)),
+                metadata={"synthetic": True},
+            )
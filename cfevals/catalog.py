@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Sequence
+
+from cfevals.record import iter_events, json_default
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+# Bump when the schema changes; stored as PRAGMA user_version.
+CATALOG_VERSION = 1
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS runs (run_key INTEGER PRIMARY KEY, output_dir TEXT NOT NULL UNIQUE, "
+    "benchmark_id TEXT NOT NULL, model_id TEXT NOT NULL, run_id TEXT NOT NULL, created_at REAL NOT NULL, "
+    "num_samples INTEGER NOT NULL, results TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS runs_benchmark ON runs (benchmark_id, model_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS runs_model ON runs (model_id)",
+    "CREATE INDEX IF NOT EXISTS runs_run_id ON runs (run_id)",
+    "CREATE INDEX IF NOT EXISTS runs_created_at ON runs (created_at)",
+    "CREATE TABLE IF NOT EXISTS metrics (run_key INTEGER NOT NULL, metric TEXT NOT NULL, value REAL, "
+    "lower REAL, upper REAL, PRIMARY KEY (run_key, metric)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS scores (run_key INTEGER NOT NULL, metric TEXT NOT NULL, "
+    "sample_id TEXT NOT NULL, value REAL, PRIMARY KEY (run_key, metric, sample_id)) WITHOUT ROWID",
+)
+
+# Latest run per model for one benchmark, optionally within one run_id.
+_LATEST = (
+    "SELECT run_key, model_id, run_id, created_at, num_samples FROM ("
+    "SELECT *, ROW_NUMBER() OVER (PARTITION BY model_id ORDER BY created_at DESC) AS position "
+    "FROM runs WHERE benchmark_id = ? AND (? IS NULL OR run_id = ?)) WHERE position = 1"
+)
+
+
+def default_catalog_path(output_root: str | Path = "outputs") -> str:
+    return os.path.join(output_root, CATALOG_FILENAME)
+
+
+@dataclass
+class ResultsCatalog:
+    # One row per run directory (outputs/<benchmark_id>/<run_id>/<model_id>) with its
+    # aggregated metrics and per-window/per-sample scores, so leaderboards and diffs
+    # are indexed queries instead of a walk over every results.json and events file.
+    path: str = field(default_factory=default_catalog_path)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections do not survive pickling; worker processes reopen lazily.
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self.__post_init__()
+
+    def record_run(
+        self,
+        output_dir: Path,
+        payload: Mapping[str, Any],
+        scores: Mapping[str, Sequence[float]] | None = None,
+        sample_ids: Sequence[str] | None = None,
+        *,
+        created_at: float | None = None,
+    ) -> None:
+        # Replaces any earlier entry for the same directory (e.g. a resumed run).
+        # run_id is the parent directory name, as laid out by cfeval and cfevalset.
+        output_dir = Path(output_dir).resolve()
+        created_at = created_at if created_at is not None else datetime.now().timestamp()
+        intervals = payload.get("intervals", {})
+        metric_rows = [
+            (key, value, intervals.get(key, {}).get("lower"), intervals.get(key, {}).get("upper"))
+            for key, value in payload["metrics"].items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._delete(conn, str(output_dir))
+                cursor = conn.execute(
+                    "INSERT INTO runs (output_dir, benchmark_id, model_id, run_id, created_at, num_samples, "
+                    "results) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        str(output_dir),
+                        payload["benchmark_id"],
+                        payload["model_id"],
+                        output_dir.parent.name,
+                        created_at,
+                        payload["num_samples"],
+                        json.dumps(payload, default=json_default),
+                    ),
+                )
+                run_key = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO metrics (run_key, metric, value, lower, upper) VALUES (?, ?, ?, ?, ?)",
+                    [(run_key, *row) for row in metric_rows],
+                )
+                if scores and sample_ids is not None:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO scores (run_key, metric, sample_id, value) "
+                        "VALUES (?, ?, ?, ?)",
+                        _score_rows(run_key, scores, sample_ids),
+                    )
+
+    def metrics(self, benchmark_id: str) -> list[str]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT DISTINCT metric FROM metrics JOIN runs USING (run_key) WHERE benchmark_id = ? "
+                "ORDER BY metric",
+                (benchmark_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def leaderboard(
+        self, benchmark_id: str, metric: str, *, run_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        # Each model's latest run, best (lowest) metric first.
+        query = (
+            "SELECT latest.model_id, latest.run_id, latest.created_at, latest.num_samples, "
+            f"metrics.value, metrics.lower, metrics.upper FROM ({_LATEST}) AS latest "
+            "JOIN metrics ON metrics.run_key = latest.run_key AND metrics.metric = ? "
+            "ORDER BY metrics.value ASC"
+        )
+        with self._lock:
+            rows = self._connect().execute(query, (benchmark_id, run_id, run_id, metric)).fetchall()
+        columns = ("model_id", "run_id", "created_at", "num_samples", "value", "lower", "upper")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def sample_diff(
+        self,
+        benchmark_id: str,
+        metric: str,
+        base_model: str,
+        other_model: str,
+        *,
+        run_id: str | None = None,
+        limit: int | None = 20,
+    ) -> list[dict[str, Any]]:
+        # Paired per-sample scores of two models' latest runs, largest |other - base| first.
+        with self._lock:
+            conn = self._connect()
+            latest = {row[1]: row[0] for row in conn.execute(_LATEST, (benchmark_id, run_id, run_id))}
+            missing = [model for model in (base_model, other_model) if model not in latest]
+            if missing:
+                raise KeyError(f"no catalogued runs of {missing} on {benchmark_id}")
+            rows = conn.execute(
+                "SELECT base.sample_id, base.value, other.value, other.value - base.value AS diff "
+                "FROM scores AS base JOIN scores AS other "
+                "ON other.run_key = ? AND other.metric = base.metric AND other.sample_id = base.sample_id "
+                "WHERE base.run_key = ? AND base.metric = ? ORDER BY ABS(diff) DESC LIMIT ?",
+                (latest[other_model], latest[base_model], metric, -1 if limit is None else limit),
+            ).fetchall()
+        return [dict(zip(("sample_id", "base", "other", "diff"), row)) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # cfevalset workers write concurrently; WAL plus a long busy timeout serializes them.
+            conn = sqlite3.connect(self.path, timeout=60.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, CATALOG_VERSION):
+                conn.close()
+                raise RuntimeError(
+                    f"results catalog {self.path} has schema version {version}, expected {CATALOG_VERSION}; "
+                    "move it aside and run cfeval backfill"
+                )
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, output_dir: str) -> None:
+        row = conn.execute("SELECT run_key FROM runs WHERE output_dir = ?", (output_dir,)).fetchone()
+        if row is None:
+            return
+        for table in ("scores", "metrics", "runs"):
+            conn.execute(f"DELETE FROM {table} WHERE run_key = ?", row)
+
+
+def backfill(catalog: ResultsCatalog, root: Path) -> int:
+    # Catalogues every completed run under root (<benchmark_id>/<run_id>/<model_id>),
+    # reading per-sample scores back from its events file.
+    from cfevals.engine.runner import COMPLETION_MARKER  # noqa: PLC0415
+
+    count = 0
+    for results_path in sorted(Path(root).glob("*/*/*/results.json")):
+        output_dir = results_path.parent
+        marker = output_dir / COMPLETION_MARKER
+        if not marker.exists():
+            continue
+        payload = json.loads(results_path.read_text())
+        scores, sample_ids = _scores_from_events(output_dir)
+        catalog.record_run(output_dir, payload, scores, sample_ids, created_at=_completed_at(marker))
+        count += 1
+    return count
+
+
+def _score_rows(
+    run_key: int, scores: Mapping[str, Sequence[float]], sample_ids: Sequence[str]
+) -> Iterator[tuple[int, str, str, float]]:
+    for metric, values in scores.items():
+        if len(values) != len(sample_ids):
+            continue
+        for sample_id, value in zip(sample_ids, values):
+            yield run_key, metric, sample_id, float(value)
+
+
+def _scores_from_events(output_dir: Path) -> tuple[dict[str, list[float]], list[str]]:
+    events_paths = sorted(output_dir.glob("events.jsonl*"))
+    scores: dict[str, list[float]] = {}
+    sample_ids: list[str] = []
+    if not events_paths:
+        return scores, sample_ids
+    for event in iter_events(events_paths[0]):
+        payload = event["payload"]
+        if event["event_type"] == "walk_forward_window":
+            metrics = payload["metrics"]
+            series_id = payload.get("series_id")
+            sample_ids.append(f"{series_id}/{payload['sample_id']}" if series_id else payload["sample_id"])
+        elif event["event_type"] == "scenario_result":
+            metrics = {key: value for key, value in payload.items() if key != "sample_id"}
+            sample_ids.append(payload["sample_id"])
+        else:
+            continue
+        for key, value in metrics.items():
+            scores.setdefault(key, []).append(value)
+    return scores, sample_ids
+
+
+def _completed_at(marker: Path) -> float:
+    try:
+        return datetime.fromisoformat(marker.read_text().strip()).timestamp()
+    except ValueError:
+        return marker.stat().st_mtime
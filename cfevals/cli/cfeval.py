@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
+import sys
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from cfevals.engine import Runner, WalkForwardConfig
+from cfevals.models.cache import CACHE_MODES
+from cfevals.record import COMPRESSIONS, RecorderConfig
 from cfevals.registry import Registry
 
+if TYPE_CHECKING:
+    from cfevals.catalog import ResultsCatalog
+    from cfevals.engine import ScenarioConfig, WalkForwardConfig
+    from cfevals.metrics.significance import BootstrapConfig
+
+# The engine (and with it numpy) and the results catalog (sqlite3) are imported only
+# once a run starts, so --list and --help stay fast; models and benchmarks load
+# through their registry class paths.
+
 
 def load_class(path: str):
     module_name, class_name = path.split(":")
@@ -19,14 +32,22 @@ def build_benchmark(spec: dict[str, Any]):
     return benchmark_cls(**spec.get("args", {}))
 
 
-def build_model(spec: dict[str, Any]):
+def build_model(spec: dict[str, Any], *, cache: str = "off", cache_max_bytes: int | None = None):
     model_cls = load_class(spec["class"])
-    return model_cls(**spec.get("args", {}))
+    model = model_cls(**spec.get("args", {}))
+    if cache == "off":
+        return model
+    from cfevals.models.cache import CachedModel, ForecastCache  # noqa: PLC0415
+
+    forecast_cache = ForecastCache(max_bytes=cache_max_bytes, read_only=cache == "read")
+    return CachedModel(model=model, spec=spec, cache=forecast_cache, mode=cache)
 
 
 def build_backtest_config(spec: dict[str, Any], overrides: dict[str, Any]) -> WalkForwardConfig | None:
     if spec.get("kind") == "scenario":
         return None
+    from cfevals.engine import WalkForwardConfig  # noqa: PLC0415
+
     base = spec.get("backtest", {})
     payload = {**base, **{k: v for k, v in overrides.items() if v is not None}}
     if not payload:
@@ -34,13 +55,30 @@ def build_backtest_config(spec: dict[str, Any], overrides: dict[str, Any]) -> Wa
     return WalkForwardConfig(**payload)
 
 
+def build_scenario_config(spec: dict[str, Any], overrides: dict[str, Any]) -> ScenarioConfig | None:
+    if spec.get("kind") != "scenario":
+        return None
+    from cfevals.engine import ScenarioConfig  # noqa: PLC0415
+
+    base = spec.get("evaluation", {})
+    payload = {**base, **{k: v for k, v in overrides.items() if v is not None}}
+    return ScenarioConfig(**payload)
+
+
 def run_eval(args: argparse.Namespace) -> None:
+    from cfevals.benchmarks.shared import process_dataset_cache  # noqa: PLC0415
+    from cfevals.engine import Runner  # noqa: PLC0415
+
     registry = Registry().load()
     benchmark_spec = registry.get_benchmark(args.benchmark_id)
-    model_spec = registry.get_model(args.model_id)
+    model_ids = list(dict.fromkeys(args.model_ids))
+    model_specs = {model_id: registry.get_model(model_id) for model_id in model_ids}
 
     benchmark = build_benchmark(benchmark_spec)
-    model = build_model(model_spec)
+    models = {
+        model_id: build_model(spec, cache=args.cache, cache_max_bytes=args.cache_max_bytes)
+        for model_id, spec in model_specs.items()
+    }
 
     overrides = {
         "horizon": args.horizon,
@@ -50,25 +88,198 @@ def run_eval(args: argparse.Namespace) -> None:
         "allow_retrain": args.allow_retrain,
         "retrain_frequency": args.retrain_frequency,
         "max_windows": args.max_windows,
+        "executor": args.executor,
+        "workers": args.workers,
+        "batch_size": args.batch_size,
+        "max_concurrency": args.max_concurrency,
     }
     backtest_config = build_backtest_config(benchmark_spec, overrides)
+    scenario_config = build_scenario_config(
+        benchmark_spec,
+        {
+            "batch_size": args.batch_size,
+            "max_concurrency": args.max_concurrency,
+            "streaming": args.streaming,
+            "scoring": args.scoring,
+        },
+    )
 
-    output_dir = Path("outputs") / args.benchmark_id / args.run_id / args.model_id
-    Runner().run(
-        benchmark_id=args.benchmark_id,
-        benchmark=benchmark,
-        model_id=args.model_id,
-        model=model,
-        output_dir=output_dir,
-        backtest_config=backtest_config,
+    runner = Runner(
+        recorder_config=build_recorder_config(args),
+        dataset_cache=process_dataset_cache(),
+        bootstrap=build_bootstrap_config(args),
+        catalog=build_catalog(args),
     )
+    run_root = Path("outputs") / args.benchmark_id / args.run_id
+    common = {
+        "benchmark_id": args.benchmark_id,
+        "benchmark": benchmark,
+        "backtest_config": backtest_config,
+        "scenario_config": scenario_config,
+        "resume": args.resume,
+    }
+    if len(models) == 1:
+        [(model_id, model)] = models.items()
+        output_dir = run_root / model_id
+        run = partial(runner.run, model_id=model_id, model=model, output_dir=output_dir, **common)
+    else:
+        # Several models share one load and one pass over the windows or samples;
+        # comparison.json/.md land next to the per-model directories.
+        output_dir = run_root
+        run = partial(
+            runner.run_many, models=models, output_root=run_root, workers=args.model_workers, **common
+        )
+    if not args.profile:
+        run()
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run)
+    finally:
+        # Dumped even when the run fails, since that is often when it is needed.
+        output_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(output_dir / "profile.prof"))
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Run a time-series benchmark")
+def list_registry() -> None:
+    registry = Registry().load()
+    for title, specs in (
+        ("benchmarks", registry.benchmarks),
+        ("models", registry.models),
+        ("benchmark sets", registry.benchmark_sets),
+    ):
+        print(f"{title}:")
+        for spec_id in sorted(specs):
+            kind = specs[spec_id].get("kind")
+            print(f"  {spec_id}" + (f" ({kind})" if kind else ""))
+
+
+def build_recorder_config(args: argparse.Namespace) -> RecorderConfig:
+    return RecorderConfig(
+        flush_every=args.events_flush_every or None,
+        flush_interval=args.events_flush_interval,
+        background=args.events_background,
+        compression=args.events_compression,
+    )
+
+
+def build_catalog(args: argparse.Namespace) -> ResultsCatalog | None:
+    from cfevals.catalog import ResultsCatalog, default_catalog_path  # noqa: PLC0415
+
+    return None if args.no_catalog else ResultsCatalog(args.catalog or default_catalog_path())
+
+
+def add_catalog_arguments(parser: argparse.ArgumentParser) -> None:
+    # None resolves to outputs/catalog.sqlite in build_catalog.
+    parser.add_argument("--catalog", default=None)
+    parser.add_argument("--no-catalog", action="store_true")
+
+
+def build_bootstrap_config(args: argparse.Namespace) -> BootstrapConfig | None:
+    if not args.bootstrap_resamples:
+        return None
+    from cfevals.metrics.significance import BootstrapConfig  # noqa: PLC0415
+
+    return BootstrapConfig(
+        resamples=args.bootstrap_resamples, confidence=args.confidence, block_length=args.block_length
+    )
+
+
+def add_bootstrap_arguments(parser: argparse.ArgumentParser) -> None:
+    # 0 skips the confidence intervals in results.json.
+    parser.add_argument("--bootstrap-resamples", type=int, default=1000)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--block-length", type=int, default=None)
+
+
+def add_recorder_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--events-compression", choices=COMPRESSIONS, default=None)
+    # 0 defers flushing to --events-flush-interval or the end of the run.
+    parser.add_argument("--events-flush-every", type=int, default=1)
+    parser.add_argument("--events-flush-interval", type=float, default=None)
+    parser.add_argument("--events-background", action="store_true")
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--cache", choices=CACHE_MODES, default="off")
+    parser.add_argument("--cache-max-bytes", type=int, default=None)
+
+
+def report(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="cfeval report", description="Query the results catalog")
     parser.add_argument("benchmark_id")
-    parser.add_argument("--model", dest="model_id", required=True)
+    # Defaults to rcrps when present, otherwise the first catalogued metric.
+    parser.add_argument("--metric", default=None)
+    parser.add_argument("--run-id", dest="run_id", default=None)
+    # Per-sample scores of OTHER minus BASE instead of the leaderboard.
+    parser.add_argument("--diff", nargs=2, metavar=("BASE", "OTHER"), default=None)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--catalog", default=None)
+    args = parser.parse_args(argv)
+
+    from cfevals.catalog import ResultsCatalog, default_catalog_path  # noqa: PLC0415
+
+    args.catalog = args.catalog or default_catalog_path()
+    if not Path(args.catalog).exists():
+        parser.error(f"no results catalog at {args.catalog}; run `cfeval backfill` to build one")
+    catalog = ResultsCatalog(args.catalog)
+    available = catalog.metrics(args.benchmark_id)
+    if not available:
+        parser.error(f"no catalogued runs for {args.benchmark_id} in {args.catalog}")
+    metric = args.metric or ("rcrps" if "rcrps" in available else available[0])
+    if args.diff:
+        base, other = args.diff
+        try:
+            rows = catalog.sample_diff(
+                args.benchmark_id, metric, base, other, run_id=args.run_id, limit=args.limit
+            )
+        except KeyError as exc:
+            parser.error(str(exc.args[0]))
+        print(f"{'sample':<32} {base[:16]:>16} {other[:16]:>16} {'diff':>10}")
+        for row in rows:
+            print(f"{row['sample_id']:<32} {row['base']:>16.4f} {row['other']:>16.4f} {row['diff']:>+10.4f}")
+        return
+    print(f"{'model':<40} {'run_id':<20} {'samples':>8} {metric:>12}  interval")
+    for row in catalog.leaderboard(args.benchmark_id, metric, run_id=args.run_id)[: args.limit]:
+        interval = f"[{row['lower']:.4f}, {row['upper']:.4f}]" if row["lower"] is not None else ""
+        print(
+            f"{row['model_id']:<40} {row['run_id']:<20} {row['num_samples']:>8} "
+            f"{row['value']:>12.4f}  {interval}"
+        )
+
+
+def backfill_catalog(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="cfeval backfill", description="Add existing output directories to the results catalog"
+    )
+    parser.add_argument("root", nargs="?", default="outputs")
+    parser.add_argument("--catalog", default=None)
+    args = parser.parse_args(argv)
+    from cfevals.catalog import ResultsCatalog, backfill, default_catalog_path  # noqa: PLC0415
+
+    catalog = ResultsCatalog(args.catalog or default_catalog_path(args.root))
+    count = backfill(catalog, Path(args.root))
+    print(f"catalogued {count} runs from {args.root} into {catalog.path}")
+
+
+SUBCOMMANDS = {"report": report, "backfill": backfill_catalog}
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        SUBCOMMANDS[argv[0]](argv[1:])
+        return
+    parser = argparse.ArgumentParser(description="Run a time-series benchmark")
+    parser.add_argument("benchmark_id", nargs="?")
+    # Repeat to compare several models on one pass over the benchmark.
+    parser.add_argument("--model", dest="model_ids", action="append", default=None)
+    parser.add_argument("--model-workers", type=int, default=1)
+    # Prints registry ids and exits; served from the registry index without the engine.
+    parser.add_argument("--list", action="store_true")
     parser.add_argument("--run-id", dest="run_id", default=None)
+    # Continues an interrupted --run-id from the windows/samples already in events.jsonl.
+    parser.add_argument("--resume", action="store_true")
     parser.add_argument("--horizon", type=int, default=None)
     parser.add_argument("--step", type=int, default=None)
     parser.add_argument("--min-train-size", type=int, default=None)
@@ -78,8 +289,25 @@ def main() -> None:
     parser.add_argument("--no-retrain", dest="allow_retrain", action="store_false")
     parser.set_defaults(allow_retrain=None)
     parser.add_argument("--retrain-frequency", type=int, default=None)
-    args = parser.parse_args()
+    parser.add_argument("--executor", choices=["serial", "threads", "processes"], default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--streaming", action="store_true", default=None)
+    parser.add_argument("--scoring", choices=["samples", "quantiles"], default=None)
+    # Writes profile.prof (cProfile) next to results.json.
+    parser.add_argument("--profile", action="store_true")
+    add_cache_arguments(parser)
+    add_recorder_arguments(parser)
+    add_bootstrap_arguments(parser)
+    add_catalog_arguments(parser)
+    args = parser.parse_args(argv)
 
+    if args.list:
+        list_registry()
+        return
+    if args.benchmark_id is None or not args.model_ids:
+        parser.error("benchmark_id and --model are required unless --list is given")
     if args.run_id is None:
         from cfevals.engine.runner import default_run_id
 
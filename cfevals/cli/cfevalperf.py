@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from cfevals.perf import CASES, PRESETS, compare, resolve_sizes, run_suite
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure the harness's own overhead on synthetic data")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--points", type=int, default=None)
+    parser.add_argument("--windows", type=int, default=None)
+    parser.add_argument("--scenarios", type=int, default=None)
+    parser.add_argument("--samples", type=int, default=None)
+    parser.add_argument("--horizon", type=int, default=None)
+    parser.add_argument("--events", type=int, default=None)
+    parser.add_argument("--case", dest="cases", action="append", choices=sorted(CASES), default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    # Without --output the JSON goes to stdout and the summary to stderr.
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    # Allowed slowdown per op against the baseline before a case counts as regressed.
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes = resolve_sizes(
+        args.preset,
+        {
+            "points": args.points,
+            "windows": args.windows,
+            "scenarios": args.scenarios,
+            "samples": args.samples,
+            "horizon": args.horizon,
+            "events": args.events,
+        },
+    )
+    report = run_suite(sizes, repeat=args.repeat, cases=args.cases)
+    report["preset"] = args.preset
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n")
+
+    for name, case in report["cases"].items():
+        print(f"{name:<22} {case['ops']:>9} ops  best {case['best']:.4f}s", file=sys.stderr)
+    if args.baseline is None:
+        return
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("sizes") != report["sizes"]:
+        print("warning: baseline was taken at different sizes; per-op times may not compare", file=sys.stderr)
+    comparisons = compare(report, baseline, tolerance=args.tolerance)
+    for item in comparisons:
+        flag = "REGRESSED" if item.regressed else "ok"
+        print(f"{item.name:<22} x{item.ratio:.2f} vs baseline  {flag}", file=sys.stderr)
+    if any(item.regressed for item in comparisons):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
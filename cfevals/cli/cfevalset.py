@@ -1,44 +1,136 @@
 from __future__ import annotations
 
 import argparse
+import sys
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from cfevals.cli.cfeval import build_backtest_config, build_benchmark, build_model
+from cfevals.benchmarks.shared import process_dataset_cache
+from cfevals.cli.cfeval import (
+    add_bootstrap_arguments,
+    add_cache_arguments,
+    add_catalog_arguments,
+    add_recorder_arguments,
+    build_backtest_config,
+    build_benchmark,
+    build_bootstrap_config,
+    build_catalog,
+    build_model,
+    build_recorder_config,
+    build_scenario_config,
+)
 from cfevals.engine import Runner
-from cfevals.engine.runner import default_run_id
+from cfevals.engine.runner import RunOutput, default_run_id
+from cfevals.engine.scheduler import Job, JobOutcome, JobScheduler, Progress
+from cfevals.metrics.significance import BootstrapConfig
+from cfevals.record import RecorderConfig
 from cfevals.registry import Registry
 
+if TYPE_CHECKING:
+    from cfevals.catalog import ResultsCatalog
+
+# Per-process model instances, so a worker that runs several jobs for the same
+# model loads it once (as the serial loop used to).
+_MODELS: dict[tuple[str, str, int | None], Any] = {}
+
+
+@lru_cache(maxsize=1)
+def _registry() -> Registry:
+    return Registry().load()
+
+
+def run_job(
+    job: Job,
+    *,
+    cache: str = "off",
+    cache_max_bytes: int | None = None,
+    recorder_config: RecorderConfig | None = None,
+    resume: bool = False,
+    bootstrap: BootstrapConfig | None = None,
+    catalog: ResultsCatalog | None = None,
+) -> RunOutput:
+    registry = _registry()
+    model_key = (job.model_id, cache, cache_max_bytes)
+    if model_key not in _MODELS:
+        _MODELS[model_key] = build_model(
+            registry.get_model(job.model_id), cache=cache, cache_max_bytes=cache_max_bytes
+        )
+    benchmark_spec = registry.get_benchmark(job.benchmark_id)
+    # Benchmarks sharing data (same class and args) load it once per process.
+    runner = Runner(
+        recorder_config=recorder_config or RecorderConfig(),
+        dataset_cache=process_dataset_cache(),
+        bootstrap=bootstrap,
+        catalog=catalog,
+    )
+    return runner.run(
+        benchmark_id=job.benchmark_id,
+        benchmark=build_benchmark(benchmark_spec),
+        model_id=job.model_id,
+        model=_MODELS[model_key],
+        output_dir=job.output_dir,
+        backtest_config=build_backtest_config(benchmark_spec, {}),
+        scenario_config=build_scenario_config(benchmark_spec, {}),
+        resume=resume,
+    )
+
+
+def build_jobs(benchmark_ids: list[str], model_ids: list[str], run_id: str, root: Path) -> list[Job]:
+    return [
+        Job(benchmark_id=benchmark_id, model_id=model_id, output_dir=root / benchmark_id / run_id / model_id)
+        for benchmark_id in benchmark_ids
+        for model_id in model_ids
+    ]
+
+
+def print_progress(outcome: JobOutcome, progress: Progress) -> None:
+    detail = f"{outcome.elapsed:.1f}s" if outcome.status != "skipped" else "already complete"
+    if outcome.error is not None:
+        detail = f"{detail}: {outcome.error}"
+    print(f"{progress.summary()} {outcome.status} {outcome.job.name} ({detail})", flush=True)
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run a benchmark set")
     parser.add_argument("benchmark_set_id")
-    parser.add_argument("--model", dest="model_id", required=True)
+    parser.add_argument("--model", dest="model_ids", action="append", required=True)
     parser.add_argument("--run-id", dest="run_id", default=None)
     parser.add_argument("--resume", action="store_true")
+    parser.add_argument("--jobs", type=int, default=1)
+    add_cache_arguments(parser)
+    add_recorder_arguments(parser)
+    add_bootstrap_arguments(parser)
+    add_catalog_arguments(parser)
     args = parser.parse_args()
 
-    registry = Registry().load()
+    registry = _registry()
     benchmark_set = registry.get_benchmark_set(args.benchmark_set_id)
-    model_spec = registry.get_model(args.model_id)
-    model = build_model(model_spec)
+    for model_id in args.model_ids:
+        registry.get_model(model_id)
 
     run_id = args.run_id or default_run_id()
-
-    for benchmark_id in benchmark_set["benchmarks"]:
-        output_dir = Path("outputs") / benchmark_id / run_id / args.model_id
-        if args.resume and output_dir.exists():
-            continue
-        benchmark_spec = registry.get_benchmark(benchmark_id)
-        benchmark = build_benchmark(benchmark_spec)
-        backtest_config = build_backtest_config(benchmark_spec, {})
-        Runner().run(
-            benchmark_id=benchmark_id,
-            benchmark=benchmark,
-            model_id=args.model_id,
-            model=model,
-            output_dir=output_dir,
-            backtest_config=backtest_config,
-        )
+    model_ids = list(dict.fromkeys(args.model_ids))
+    jobs = build_jobs(list(benchmark_set["benchmarks"]), model_ids, run_id, Path("outputs"))
+    scheduler = JobScheduler(
+        run_job=partial(
+            run_job,
+            cache=args.cache,
+            cache_max_bytes=args.cache_max_bytes,
+            recorder_config=build_recorder_config(args),
+            resume=args.resume,
+            bootstrap=build_bootstrap_config(args),
+            catalog=build_catalog(args),
+        ),
+        workers=args.jobs,
+        resume=args.resume,
+    )
+    outcomes = scheduler.run(jobs, on_outcome=print_progress)
+    failed = [outcome for outcome in outcomes if outcome.status == "failed"]
+    if failed:
+        names = ", ".join(outcome.job.name for outcome in failed)
+        print(f"{len(failed)} of {len(outcomes)} jobs failed: {names}", file=sys.stderr)
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,13 @@
-from cfevals.engine.backtest import BacktestResult, WalkForwardBacktester, WalkForwardConfig
-from cfevals.engine.runner import RunOutput, Runner
-from cfevals.engine.scenario import ScenarioEvaluator, ScenarioResult
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cfevals.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from cfevals.engine.backtest import BacktestResult, WalkForwardBacktester, WalkForwardConfig
+    from cfevals.engine.runner import RunOutput, Runner
+    from cfevals.engine.scenario import ScenarioConfig, ScenarioEvaluator, ScenarioResult
 
 __all__ = [
     "BacktestResult",
@@ -8,6 +15,21 @@ __all__ = [
     "WalkForwardConfig",
     "RunOutput",
     "Runner",
+    "ScenarioConfig",
     "ScenarioEvaluator",
     "ScenarioResult",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "BacktestResult": "cfevals.engine.backtest",
+        "WalkForwardBacktester": "cfevals.engine.backtest",
+        "WalkForwardConfig": "cfevals.engine.backtest",
+        "RunOutput": "cfevals.engine.runner",
+        "Runner": "cfevals.engine.runner",
+        "ScenarioConfig": "cfevals.engine.scenario",
+        "ScenarioEvaluator": "cfevals.engine.scenario",
+        "ScenarioResult": "cfevals.engine.scenario",
+    },
+)
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Mapping, Sequence, TypeVar
 
-from cfevals.benchmarks.base import TimeSeriesDataset, WalkForwardWindow
+import numpy as np
+
+from cfevals.benchmarks.base import TimeSeriesDataset, WalkForwardWindow, lazy_list, to_list
+from cfevals.benchmarks.columnar import ColumnarTimeSeriesDataset
+from cfevals.benchmarks.shared import SharedColumnar
+from cfevals.engine.concurrency import predict_requests
+from cfevals.engine.timing import StageTimer
 from cfevals.engine.validation import validate_forecast_result
-from cfevals.metrics.point import mae, mase, rmse, smape
+from cfevals.metrics.point import MaseScale, point_metrics
 from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.models.cache import CachedModel, CacheStats
 from cfevals.record import RecorderBase
 
+EXECUTORS = ("serial", "threads", "processes")
+
+# Each worker gets a few chunks so a slow segment does not leave the pool idle.
+_CHUNKS_PER_WORKER = 4
+
+# Windows scored per vectorized pass in serial runs; results (and their events)
+# trail predictions by at most this many windows, which is what a killed process
+# can lose. Interrupts and errors flush the buffer first.
+_SCORE_BLOCK = 16
+
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class WalkForwardConfig:
@@ -19,6 +41,23 @@ class WalkForwardConfig:
     allow_retrain: bool = True
     retrain_frequency: int = 1
     max_windows: int | None = None
+    executor: str = "serial"
+    workers: int | None = None
+    batch_size: int = 1
+    max_concurrency: int = 1
+
+    def __post_init__(self) -> None:
+        if self.executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {self.executor!r}")
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {self.max_concurrency}")
+
+    @property
+    def gather_size(self) -> int:
+        # Concurrent dispatch needs at least max_concurrency requests in flight.
+        return max(self.batch_size, self.max_concurrency)
 
 
 @dataclass(frozen=True)
@@ -30,57 +69,420 @@ class BacktestResult:
     metrics: dict[str, float]
 
 
+@dataclass
+class _ScoreBuffer:
+    # Scoring does not depend on model state, so it is batched across refits:
+    # forecasts accumulate and are scored _SCORE_BLOCK windows at a time.
+    config: WalkForwardConfig
+    scale: MaseScale
+    timer: StageTimer
+    windows: list[WalkForwardWindow] = field(default_factory=list)
+    forecasts: list[ForecastResult] = field(default_factory=list)
+
+    def add(self, windows: list[WalkForwardWindow], forecasts: list[ForecastResult]) -> list[BacktestResult]:
+        self.windows.extend(windows)
+        self.forecasts.extend(forecasts)
+        if len(self.windows) >= _SCORE_BLOCK:
+            return self.flush()
+        return []
+
+    def flush(self) -> list[BacktestResult]:
+        windows, forecasts = self.windows, self.forecasts
+        if not windows:
+            return []
+        self.windows, self.forecasts = [], []
+        with self.timer.stage("score"):
+            return _score_windows(windows, forecasts, self.config, self.scale)
+
+
+@dataclass(frozen=True)
+class _Segment:
+    # Windows between two refits; the model is fitted on `fit_window` (when set)
+    # before the first of them is predicted.
+    fit_window: WalkForwardWindow | None
+    windows: list[WalkForwardWindow]
+
+
+@dataclass(frozen=True)
+class _SegmentRef:
+    # A _Segment by window index, for process workers that rebuild the windows from
+    # a dataset in shared memory instead of receiving pickled history slices.
+    fit_index: int | None
+    indices: list[int]
+
+
+@dataclass(frozen=True)
+class PreparedBacktest:
+    # Windows and MASE scales built once, so several models can be evaluated on the
+    # same inputs without regenerating them.
+    windows: Iterable[WalkForwardWindow]
+    scale: MaseScale
+
+
+@dataclass(frozen=True)
+class _WindowSource:
+    # Re-iterable windows of a list-backed dataset. Each of its windows copies its
+    # history, so keeping all of them would hold O(N^2) values; they are generated
+    # again for every model instead.
+    dataset: TimeSeriesDataset
+    config: WalkForwardConfig
+
+    def __iter__(self) -> Iterator[WalkForwardWindow]:
+        return iter(_windows(self.dataset, self.config))
+
+
 class WalkForwardBacktester:
+    def prepare(
+        self,
+        dataset: TimeSeriesDataset | ColumnarTimeSeriesDataset,
+        config: WalkForwardConfig,
+    ) -> PreparedBacktest:
+        windows: Iterable[WalkForwardWindow]
+        if isinstance(dataset, ColumnarTimeSeriesDataset):
+            # Columnar windows are views into the dataset, so keeping them is cheap.
+            windows = list(_windows(dataset, config))
+        else:
+            windows = _WindowSource(dataset, config)
+        return PreparedBacktest(windows=windows, scale=MaseScale.from_series(_series_values(dataset)))
+
     def run(
         self,
-        dataset: TimeSeriesDataset,
+        dataset: TimeSeriesDataset | ColumnarTimeSeriesDataset,
         model: Model,
         config: WalkForwardConfig,
         *,
         recorder: RecorderBase,
+        completed: Mapping[str, BacktestResult] | None = None,
+        series_id: str | None = None,
+        timer: StageTimer | None = None,
+        prepared: PreparedBacktest | None = None,
     ) -> list[BacktestResult]:
+        # `completed` holds results recovered from an interrupted run; those windows
+        # are not predicted or recorded again, and the model is refitted exactly as
+        # an uninterrupted run would have it for the remaining windows. `series_id`
+        # tags recorded events when several series share one events file. `prepared`
+        # (from prepare() with the same dataset and config) replaces window generation.
+        completed = completed or {}
+        timer = timer if timer is not None else StageTimer()
         results: list[BacktestResult] = []
         model.reset()
-        trained_once = False
+        windows: Iterable[WalkForwardWindow]
+        if prepared is not None:
+            windows, scale = prepared.windows, prepared.scale
+        else:
+            windows = _windows(dataset, config)
+            scale = MaseScale.from_series(_series_values(dataset))
+        if config.executor == "serial":
+            evaluated = _run_serial(windows, model, config, completed, scale, timer)
+        else:
+            evaluated = _run_parallel(windows, model, config, completed, scale, timer, dataset=dataset)
 
-        for window in _windows(dataset, config):
-            if _should_retrain(window, config, trained_once):
-                train_request = _build_request(window, config.horizon)
-                model.fit(train_request)
-                trained_once = True
-
-            request = _build_request(window, config.horizon)
-            forecast_result = model.predict(request)
-            validate_forecast_result(
-                forecast_result,
-                config.horizon,
-                context=f"backtest window {window.window_index}",
-            )
-            metrics = _compute_metrics(window, forecast_result)
-            sample_id = f"{window.window_index:05d}-{window.as_of.date()}"
-            result = BacktestResult(
-                sample_id=sample_id,
-                as_of=window.as_of.isoformat(),
-                forecast=forecast_result.point_forecast,
-                actual=window.future,
-                metrics=metrics,
-            )
-            recorder.record_event(
-                "walk_forward_window",
-                {
-                    "sample_id": sample_id,
+        for result in evaluated:
+            if result.sample_id not in completed:
+                payload = {
+                    "sample_id": result.sample_id,
                     "as_of": result.as_of,
                     "forecast": result.forecast,
                     "actual": result.actual,
                     "metrics": result.metrics,
-                },
-                sample_id=sample_id,
-            )
+                }
+                event_sample_id = result.sample_id
+                if series_id is not None:
+                    payload["series_id"] = series_id
+                    event_sample_id = f"{series_id}/{result.sample_id}"
+                recorder.record_event("walk_forward_window", payload, sample_id=event_sample_id)
             results.append(result)
         return results
 
 
-def _windows(dataset: TimeSeriesDataset, config: WalkForwardConfig) -> Iterable[WalkForwardWindow]:
+def _run_serial(
+    windows: Iterable[WalkForwardWindow],
+    model: Model,
+    config: WalkForwardConfig,
+    completed: Mapping[str, BacktestResult],
+    scale: MaseScale,
+    timer: StageTimer,
+) -> Iterator[BacktestResult]:
+    trained_once = False
+    as_lists = not model.accepts_arrays
+    pending: list[WalkForwardWindow] = []
+    scores = _ScoreBuffer(config, scale, timer)
+    # A refit is deferred until the first window that actually needs predicting.
+    fit_window: WalkForwardWindow | None = None
+    fitted_on: WalkForwardWindow | None = None
+
+    def predict(batch: list[WalkForwardWindow]) -> list[BacktestResult]:
+        if not batch:
+            return []
+        return scores.add(batch, _predict_windows(model, batch, config, timer, as_lists=as_lists))
+
+    try:
+        for window in windows:
+            if _should_retrain(window, config, trained_once):
+                fit_window = window
+                trained_once = True
+            done = completed.get(_sample_id(window))
+            if done is not None:
+                yield from predict(pending)
+                pending = []
+                yield from scores.flush()
+                yield done
+                continue
+            if fit_window is not None:
+                # Windows gathered before a refit must be predicted by the old model.
+                yield from predict(pending)
+                pending = []
+                _refit(model, fit_window, fitted_on, config, timer, as_lists=as_lists)
+                fitted_on, fit_window = fit_window, None
+            pending.append(window)
+            if len(pending) >= config.gather_size:
+                yield from predict(pending)
+                pending = []
+        yield from predict(pending)
+    except GeneratorExit:
+        # The consumer stopped iterating; nothing can be yielded to it any more.
+        raise
+    except BaseException:
+        # Forecasts made before a failure or KeyboardInterrupt are still scored and
+        # recorded, so a resumed run does not request them again.
+        yield from scores.flush()
+        raise
+    yield from scores.flush()
+
+
+def _run_parallel(
+    windows: Iterable[WalkForwardWindow],
+    model: Model,
+    config: WalkForwardConfig,
+    completed: Mapping[str, BacktestResult],
+    scale: MaseScale,
+    timer: StageTimer,
+    *,
+    dataset: TimeSeriesDataset | ColumnarTimeSeriesDataset,
+) -> Iterator[BacktestResult]:
+    workers = config.workers or os.cpu_count() or 1
+    as_lists = not model.accepts_arrays
+    all_segments = _segments(windows, config)
+    order = [_sample_id(window) for segment in all_segments for window in segment.windows]
+    segments = _pending_segments(all_segments, completed)
+    if not config.allow_retrain and segments:
+        # A single fit covers every window: train once here and hand each chunk a
+        # copy of the fitted model.
+        with timer.stage("fit"):
+            model.fit(_build_request(all_segments[0].windows[0], config.horizon, as_lists=as_lists))
+        segments = [
+            _Segment(fit_window=None, windows=part)
+            for part in _split(segments[0].windows, workers * _CHUNKS_PER_WORKER)
+        ]
+    chunks: list[list[_Segment]] | list[list[_SegmentRef]] = _split(segments, workers * _CHUNKS_PER_WORKER)
+    clone = config.executor == "threads"
+    shared: SharedColumnar | None = None
+    executor: Executor
+    if clone:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        # Expanding windows overlap, so pickling each window's history would copy the
+        # series once per window; workers attach to one shared copy instead.
+        if isinstance(dataset, ColumnarTimeSeriesDataset):
+            shared = SharedColumnar.export(dataset)
+            chunks = [[_segment_ref(segment) for segment in chunk] for chunk in chunks]
+        # forkserver avoids forking a parent that may already be running threads.
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+        )
+    try:
+        futures = [
+            executor.submit(_run_chunk, model, chunk, config, scale, as_lists, clone, shared)
+            for chunk in chunks
+        ]
+        # Futures are consumed in submission order, which is window order; recovered
+        # results are slotted back in at their original positions.
+        fresh = (result for future in futures for result in _merge_chunk(future.result(), timer, model))
+        for sample_id in order:
+            yield completed[sample_id] if sample_id in completed else next(fresh)
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+    finally:
+        if shared is not None:
+            shared.close()
+
+
+def _run_chunk(
+    model: Model,
+    segments: list[_Segment] | list[_SegmentRef],
+    config: WalkForwardConfig,
+    scale: MaseScale,
+    as_lists: bool,
+    clone: bool,
+    shared: SharedColumnar | None = None,
+) -> tuple[list[BacktestResult], StageTimer, CacheStats | None]:
+    if clone:
+        model = model.clone()
+    # A process worker holds its own unpickled cache, so its counts are handed back
+    # with the results; thread clones share the caller's cache.
+    cache_before = model.stats.copy() if isinstance(model, CachedModel) and not clone else None
+    if shared is not None:
+        segments = _resolve_segments(segments, shared.attach(), config)
+    timer = StageTimer()
+    windows: list[WalkForwardWindow] = []
+    forecasts: list[ForecastResult] = []
+    fitted_on: WalkForwardWindow | None = None
+    for segment in segments:
+        if segment.fit_window is not None:
+            _refit(model, segment.fit_window, fitted_on, config, timer, as_lists=as_lists)
+            fitted_on = segment.fit_window
+        for start in range(0, len(segment.windows), config.gather_size):
+            batch = segment.windows[start : start + config.gather_size]
+            forecasts.extend(_predict_windows(model, batch, config, timer, as_lists=as_lists))
+            windows.extend(batch)
+    # The whole chunk is returned at once, so it is scored in a single pass.
+    with timer.stage("score"):
+        results = _score_windows(windows, forecasts, config, scale)
+    if cache_before is None:
+        return results, timer, None
+    model.cache.flush()
+    return results, timer, CacheStats(**model.stats.since(cache_before))
+
+
+def _segment_ref(segment: _Segment) -> _SegmentRef:
+    fit_index = segment.fit_window.window_index if segment.fit_window is not None else None
+    return _SegmentRef(fit_index=fit_index, indices=[window.window_index for window in segment.windows])
+
+
+def _resolve_segments(
+    refs: list[_SegmentRef], dataset: ColumnarTimeSeriesDataset, config: WalkForwardConfig
+) -> list[_Segment]:
+    def window(index: int) -> WalkForwardWindow:
+        resolved = dataset.window_at(
+            index,
+            horizon=config.horizon,
+            step=config.step,
+            min_train_size=config.min_train_size,
+            max_train_size=config.max_train_size,
+        )
+        if resolved is None:
+            raise ValueError(f"window {index} is outside the shared dataset")
+        return resolved
+
+    return [
+        _Segment(
+            fit_window=window(ref.fit_index) if ref.fit_index is not None else None,
+            windows=[window(index) for index in ref.indices],
+        )
+        for ref in refs
+    ]
+
+
+def _merge_chunk(
+    chunk: tuple[list[BacktestResult], StageTimer, CacheStats | None], timer: StageTimer, model: Model
+) -> list[BacktestResult]:
+    results, chunk_timer, cache_stats = chunk
+    timer.merge(chunk_timer)
+    if cache_stats is not None and isinstance(model, CachedModel):
+        model.stats.merge(cache_stats)
+    return results
+
+
+def _segments(windows: Iterable[WalkForwardWindow], config: WalkForwardConfig) -> list[_Segment]:
+    segments: list[_Segment] = []
+    trained_once = False
+    for window in windows:
+        if _should_retrain(window, config, trained_once):
+            segments.append(_Segment(fit_window=window, windows=[window]))
+            trained_once = True
+        elif segments:
+            segments[-1].windows.append(window)
+        else:
+            segments.append(_Segment(fit_window=None, windows=[window]))
+    return segments
+
+
+def _pending_segments(segments: list[_Segment], completed: Mapping[str, BacktestResult]) -> list[_Segment]:
+    if not completed:
+        return segments
+    pending: list[_Segment] = []
+    for segment in segments:
+        windows = [window for window in segment.windows if _sample_id(window) not in completed]
+        if windows:
+            pending.append(_Segment(fit_window=segment.fit_window, windows=windows))
+    return pending
+
+
+def _split(items: Sequence[T], parts: int) -> list[list[T]]:
+    parts = max(min(parts, len(items)), 1)
+    size, extra = divmod(len(items), parts)
+    chunks: list[list[T]] = []
+    start = 0
+    for idx in range(parts):
+        stop = start + size + (1 if idx < extra else 0)
+        if stop > start:
+            chunks.append(list(items[start:stop]))
+        start = stop
+    return chunks
+
+
+def _predict_windows(
+    model: Model,
+    windows: list[WalkForwardWindow],
+    config: WalkForwardConfig,
+    timer: StageTimer,
+    *,
+    as_lists: bool,
+) -> list[ForecastResult]:
+    requests = [_build_request(window, config.horizon, as_lists=as_lists) for window in windows]
+    # Recorded per window: a batched call is split evenly across its windows.
+    with timer.stage("predict", count=len(windows)):
+        forecasts = predict_requests(
+            model, requests, context="backtest batch", max_concurrency=config.max_concurrency
+        )
+    with timer.stage("validate"):
+        for window, forecast in zip(windows, forecasts):
+            validate_forecast_result(
+                forecast, config.horizon, context=f"backtest window {window.window_index}"
+            )
+    return forecasts
+
+
+def _score_windows(
+    windows: list[WalkForwardWindow],
+    forecasts: list[ForecastResult],
+    config: WalkForwardConfig,
+    scale: MaseScale,
+) -> list[BacktestResult]:
+    if not windows:
+        return []
+    # Window i's history is series[hi - len(history) : hi], with hi its forecast origin.
+    hi = config.min_train_size + config.step * np.array([window.window_index for window in windows])
+    lo = hi - np.array([len(window.history) for window in windows])
+    actual = np.array([window.future for window in windows], dtype=float)
+    predicted = np.array([forecast.point_forecast for forecast in forecasts], dtype=float)
+    metrics = point_metrics(actual, predicted, scale.between(lo, hi))
+    columns = {name: values.tolist() for name, values in metrics.items()}
+    return [
+        BacktestResult(
+            sample_id=_sample_id(window),
+            as_of=window.as_of.isoformat(),
+            forecast=to_list(forecast.point_forecast),
+            actual=to_list(window.future),
+            metrics={name: values[row] for name, values in columns.items()},
+        )
+        for row, (window, forecast) in enumerate(zip(windows, forecasts))
+    ]
+
+
+def _series_values(dataset: TimeSeriesDataset | ColumnarTimeSeriesDataset) -> list[float] | np.ndarray:
+    if isinstance(dataset, ColumnarTimeSeriesDataset):
+        return dataset.values
+    return [point.value for point in dataset.points]
+
+
+def _windows(
+    dataset: TimeSeriesDataset | ColumnarTimeSeriesDataset,
+    config: WalkForwardConfig,
+) -> Iterable[WalkForwardWindow]:
     return dataset.walk_forward_windows(
         horizon=config.horizon,
         step=config.step,
@@ -90,26 +492,58 @@ def _windows(dataset: TimeSeriesDataset, config: WalkForwardConfig) -> Iterable[
     )
 
 
+def _sample_id(window: WalkForwardWindow) -> str:
+    return f"{window.window_index:05d}-{window.as_of.date()}"
+
+
 def _should_retrain(window: WalkForwardWindow, config: WalkForwardConfig, trained_once: bool) -> bool:
     if not config.allow_retrain:
         return not trained_once
     return window.window_index % max(config.retrain_frequency, 1) == 0
 
 
-def _build_request(window: WalkForwardWindow, horizon: int) -> ForecastRequest:
+def _refit(
+    model: Model,
+    window: WalkForwardWindow,
+    fitted_on: WalkForwardWindow | None,
+    config: WalkForwardConfig,
+    timer: StageTimer,
+    *,
+    as_lists: bool,
+) -> None:
+    # An expanding window's training set extends the previous one, so models that
+    # support it are updated with the appended points instead of refitted from
+    # scratch. Bounded windows drop old points and always need a full fit.
+    if model.supports_update and fitted_on is not None and config.max_train_size is None:
+        start = len(fitted_on.history)
+        request = _build_request(window, config.horizon, as_lists=as_lists, start=start)
+        with timer.stage("update"):
+            model.update(request)
+    else:
+        request = _build_request(window, config.horizon, as_lists=as_lists)
+        with timer.stage("fit"):
+            model.fit(request)
+
+
+def _build_request(
+    window: WalkForwardWindow,
+    horizon: int,
+    *,
+    as_lists: bool,
+    start: int = 0,
+) -> ForecastRequest:
+    history = window.history[start:] if start else window.history
+    timestamps = window.history_timestamps[start:] if start else window.history_timestamps
+    features = window.history_features
+    if start:
+        features = {key: values[start:] for key, values in features.items()}
+    if not as_lists:
+        return ForecastRequest(history=history, horizon=horizon, timestamps=timestamps, features=features)
+    # List-only models get lazy list views rather than converted copies of every
+    # window's (overlapping) history.
     return ForecastRequest(
-        history=window.history,
+        history=lazy_list(history),
         horizon=horizon,
-        timestamps=window.history_timestamps,
-        features=window.history_features,
+        timestamps=lazy_list(timestamps),
+        features={key: lazy_list(values) for key, values in features.items()},
     )
-
-
-def _compute_metrics(window: WalkForwardWindow, result: ForecastResult) -> dict[str, float]:
-    metrics = {
-        "mae": mae(window.future, result.point_forecast),
-        "rmse": rmse(window.future, result.point_forecast),
-        "smape": smape(window.future, result.point_forecast),
-        "mase": mase(window.future, result.point_forecast, window.history),
-    }
-    return metrics
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def predict_requests(
+    model: Model,
+    requests: list[ForecastRequest],
+    *,
+    context: str,
+    max_concurrency: int = 1,
+) -> list[ForecastResult]:
+    if max_concurrency > 1 and len(requests) > 1:
+        results = run_coroutine(gather_predictions(model, requests, max_concurrency))
+    else:
+        results = model.predict_batch(requests)
+    if len(results) != len(requests):
+        raise ValueError(
+            f"{context}: predict_batch returned {len(results)} results for {len(requests)} requests"
+        )
+    return results
+
+
+async def gather_predictions(
+    model: Model,
+    requests: list[ForecastRequest],
+    max_concurrency: int,
+) -> list[ForecastResult]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def predict_one(request: ForecastRequest) -> ForecastResult:
+        async with semaphore:
+            return await model.apredict(request)
+
+    outcomes = await asyncio.gather(*(predict_one(r) for r in requests), return_exceptions=True)
+    # Surface the earliest failing request so errors do not depend on completion order.
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return list(outcomes)
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    # All coroutines share one long-lived loop so async clients and rate limiters
+    # created on first use stay bound to a live loop across batches.
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="cfevals-async", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
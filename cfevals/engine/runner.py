@@ -1,16 +1,39 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import partial
+from itertools import combinations, islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
 
-from cfevals.benchmarks.base import ScenarioBenchmark, TimeSeriesBenchmark
-from cfevals.engine.backtest import WalkForwardBacktester, WalkForwardConfig
-from cfevals.engine.scenario import ScenarioEvaluator
+import numpy as np
+
+from cfevals.benchmarks.base import PanelBenchmark, ScenarioBenchmark, ScenarioSample, TimeSeriesBenchmark
+from cfevals.benchmarks.shared import DatasetCache
+from cfevals.engine.backtest import BacktestResult, WalkForwardBacktester, WalkForwardConfig
+from cfevals.engine.scenario import ScenarioConfig, ScenarioEvaluator, ScenarioResult
+from cfevals.engine.timing import StageTimer, TimedRecorder
+from cfevals.metrics.aggregate import RunningStats
+from cfevals.metrics.quantile import QUANTILE_METRICS
+from cfevals.metrics.significance import BootstrapConfig, bootstrap_intervals, diebold_mariano
 from cfevals.models.base import Model
-from cfevals.record import LocalRecorder
+from cfevals.models.cache import CachedModel, CacheStats
+from cfevals.record import RecorderConfig, json_default, recover_events, rewrite_events
+
+if TYPE_CHECKING:
+    from cfevals.catalog import ResultsCatalog
+
+# Written last, so a directory without it holds an interrupted or failed run.
+COMPLETION_MARKER = ".complete"
+
+# Results each model produces per round when several models share one sample stream;
+# at most this many samples (plus one batch) are held at a time.
+_LOCKSTEP_ROUND = 64
 
 
 @dataclass(frozen=True)
@@ -19,48 +42,528 @@ class RunOutput:
     model_id: str
     metrics: dict[str, float]
     num_samples: int
+    # Per-window (or per-sample) scores in evaluation order, for paired tests.
+    scores: dict[str, np.ndarray] | None = field(default=None, repr=False, compare=False)
 
 
+@dataclass
+class _Target:
+    # One model's side of a run: its output directory, recorder, timings and the
+    # results recovered from an interrupted run.
+    model_id: str
+    model: Model
+    output_dir: Path
+    recorder: TimedRecorder
+    timer: StageTimer
+    completed_windows: dict[str | None, dict[str, BacktestResult]]
+    completed_samples: dict[str, ScenarioResult]
+    cache_before: CacheStats | None
+    started: float
+
+
+@dataclass
 class Runner:
+    recorder_config: RecorderConfig = field(default_factory=RecorderConfig)
+    # Serves repeated loads of the same benchmark data from memory (see
+    # process_dataset_cache); streamed scenario samples always bypass it.
+    dataset_cache: DatasetCache | None = None
+    # Block-bootstrap confidence intervals for every aggregated metric.
+    bootstrap: BootstrapConfig | None = None
+    # Every finished run is also appended here, with its per-window/per-sample scores.
+    catalog: ResultsCatalog | None = None
+
     def run(
         self,
         *,
         benchmark_id: str,
-        benchmark: TimeSeriesBenchmark | ScenarioBenchmark,
+        benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark,
         model_id: str,
         model: Model,
         output_dir: Path,
         backtest_config: WalkForwardConfig | None = None,
+        scenario_config: ScenarioConfig | None = None,
+        resume: bool = False,
     ) -> RunOutput:
+        outputs = self._run_targets(
+            benchmark_id,
+            benchmark,
+            [(model_id, model, output_dir)],
+            backtest_config=backtest_config,
+            scenario_config=scenario_config,
+            resume=resume,
+            workers=1,
+        )
+        return outputs[model_id]
+
+    def run_many(
+        self,
+        *,
+        benchmark_id: str,
+        benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark,
+        models: Mapping[str, Model],
+        output_root: Path,
+        backtest_config: WalkForwardConfig | None = None,
+        scenario_config: ScenarioConfig | None = None,
+        resume: bool = False,
+        workers: int = 1,
+    ) -> dict[str, RunOutput]:
+        # The benchmark is loaded and its windows (or samples) built once, then shared
+        # by every model; up to `workers` models are evaluated concurrently in threads.
+        # Each model gets output_root/<model_id> as a single run would, and
+        # output_root holds comparison.json/comparison.md.
+        outputs = self._run_targets(
+            benchmark_id,
+            benchmark,
+            [(model_id, model, output_root / model_id) for model_id, model in models.items()],
+            backtest_config=backtest_config,
+            scenario_config=scenario_config,
+            resume=resume,
+            workers=workers,
+        )
+        write_comparison(output_root, benchmark_id, outputs)
+        return outputs
+
+    def _run_targets(
+        self,
+        benchmark_id: str,
+        benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark,
+        models: list[tuple[str, Model, Path]],
+        *,
+        backtest_config: WalkForwardConfig | None,
+        scenario_config: ScenarioConfig | None,
+        resume: bool,
+        workers: int,
+    ) -> dict[str, RunOutput]:
+        targets: list[_Target] = []
+        # Closing on failure flushes buffered events, so an interrupted run can be resumed.
+        try:
+            for model_id, model, output_dir in models:
+                targets.append(self._open_target(model_id, model, output_dir, resume))
+            shared = StageTimer()
+            shared_data = _load_shared(
+                benchmark,
+                backtest_config,
+                scenario_config,
+                shared,
+                prepare=len(targets) > 1,
+                cache=self.dataset_cache,
+            )
+            for target in targets:
+                target.timer.merge(shared)
+            evaluate = partial(
+                _evaluate,
+                benchmark_id=benchmark_id,
+                benchmark=benchmark,
+                data=shared_data,
+                backtest_config=backtest_config,
+                scenario_config=scenario_config,
+                bootstrap=self.bootstrap,
+            )
+            if _streams_scenarios(benchmark, scenario_config) and len(targets) > 1:
+                payloads = _evaluate_lockstep(
+                    targets,
+                    shared_data,
+                    benchmark_id=benchmark_id,
+                    scenario_config=scenario_config,
+                    bootstrap=self.bootstrap,
+                    workers=workers,
+                )
+            elif workers > 1 and len(targets) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    payloads = list(executor.map(evaluate, targets))
+            else:
+                payloads = [evaluate(target) for target in targets]
+        finally:
+            for target in targets:
+                target.recorder.close()
+                if isinstance(target.model, CachedModel):
+                    # Cache hits record their access times in batches; the rest are written here.
+                    target.model.cache.flush()
+
+        outputs = {}
+        for target, (payload, scores, sample_ids) in zip(targets, payloads):
+            outputs[target.model_id] = _finish(target, payload, scores, resume=resume)
+            if self.catalog is not None:
+                self.catalog.record_run(target.output_dir, payload, scores, sample_ids)
+        return outputs
+
+    def _open_target(self, model_id: str, model: Model, output_dir: Path, resume: bool) -> _Target:
         output_dir.mkdir(parents=True, exist_ok=True)
-        recorder = LocalRecorder(str(output_dir / "events.jsonl"))
-
-        if isinstance(benchmark, TimeSeriesBenchmark):
-            dataset = benchmark.load()
-            config = backtest_config or WalkForwardConfig(horizon=1)
-            results = WalkForwardBacktester().run(dataset, model, config, recorder=recorder)
-            metrics = _aggregate_metrics([result.metrics for result in results])
-            payload = {
-                "benchmark_id": benchmark_id,
-                "model_id": model_id,
-                "metrics": metrics,
-                "num_samples": len(results),
+        (output_dir / COMPLETION_MARKER).unlink(missing_ok=True)
+        events_path = self.recorder_config.events_path(output_dir)
+        recovered: list[dict[str, Any]] = []
+        if not resume:
+            events_path.unlink(missing_ok=True)
+        elif events_path.exists():
+            recovered = recover_events(events_path)
+            # Drops a partially written tail so appended events start on a clean line.
+            rewrite_events(events_path, recovered)
+        completed_windows, completed_samples = _completed_results(recovered)
+        timer = StageTimer()
+        return _Target(
+            model_id=model_id,
+            model=model,
+            output_dir=output_dir,
+            recorder=TimedRecorder(self.recorder_config.open(output_dir), timer),
+            timer=timer,
+            completed_windows=completed_windows,
+            completed_samples=completed_samples,
+            cache_before=model.stats.copy() if isinstance(model, CachedModel) else None,
+            started=time.perf_counter(),
+        )
+
+
+def _load_shared(
+    benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark,
+    backtest_config: WalkForwardConfig | None,
+    scenario_config: ScenarioConfig | None,
+    timer: StageTimer,
+    *,
+    prepare: bool,
+    cache: DatasetCache | None,
+) -> Any:
+    # Everything models have in common, paid for once. Windows are only prepared
+    # up front when several models share them; a single run generates them lazily.
+    backtester = WalkForwardBacktester()
+    if isinstance(benchmark, TimeSeriesBenchmark):
+        with timer.stage("load"):
+            dataset = _load(benchmark, cache)
+        if not prepare:
+            return dataset, None
+        with timer.stage("windows"):
+            return dataset, backtester.prepare(dataset, backtest_config or WalkForwardConfig(horizon=1))
+    if isinstance(benchmark, PanelBenchmark):
+        with timer.stage("load"):
+            panel = _load(benchmark, cache)
+        if not prepare:
+            return panel, {}
+        config = backtest_config or WalkForwardConfig(horizon=1)
+        with timer.stage("windows"):
+            prepared = {
+                series_id: backtester.prepare(dataset, config) for series_id, dataset in panel.items()
             }
-        else:
-            samples = benchmark.load()
-            results = ScenarioEvaluator().run(samples, model, recorder=recorder)
-            metrics = {"rcrps": sum(r.metric for r in results) / len(results) if results else 0.0}
-            payload = {
-                "benchmark_id": benchmark_id,
-                "model_id": model_id,
-                "metrics": metrics,
+        return panel, prepared
+    config = scenario_config or ScenarioConfig()
+    # Streamed samples are fetched lazily, so their loading shows up in the stages
+    # that consume them rather than under "load"; several models share one pass
+    # through _evaluate_lockstep.
+    if config.streaming:
+        return benchmark.iter_samples()
+    with timer.stage("load"):
+        return _load(benchmark, cache)
+
+
+def _load(
+    benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark, cache: DatasetCache | None
+) -> Any:
+    return cache.load(benchmark) if cache is not None else benchmark.load()
+
+
+def _evaluate(
+    target: _Target,
+    *,
+    benchmark_id: str,
+    benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark,
+    data: Any,
+    backtest_config: WalkForwardConfig | None,
+    scenario_config: ScenarioConfig | None,
+    bootstrap: BootstrapConfig | None,
+) -> tuple[dict[str, Any], dict[str, np.ndarray], list[str]]:
+    model, recorder, timer = target.model, target.recorder, target.timer
+    if isinstance(benchmark, TimeSeriesBenchmark):
+        dataset, prepared = data
+        config = backtest_config or WalkForwardConfig(horizon=1)
+        results = WalkForwardBacktester().run(
+            dataset,
+            model,
+            config,
+            recorder=recorder,
+            completed=target.completed_windows.get(None),
+            timer=timer,
+            prepared=prepared,
+        )
+        scores = _score_columns([result.metrics for result in results])
+        sample_ids = [result.sample_id for result in results]
+        metrics = _aggregate_metrics([result.metrics for result in results])
+        payload = {
+            "benchmark_id": benchmark_id,
+            "model_id": target.model_id,
+            "metrics": metrics,
+            "num_samples": len(results),
+        }
+    elif isinstance(benchmark, PanelBenchmark):
+        panel, prepared_series = data
+        config = backtest_config or WalkForwardConfig(horizon=1)
+        pooled: list[dict[str, float]] = []
+        sample_ids = []
+        series: dict[str, dict[str, Any]] = {}
+        for series_id, dataset in panel.items():
+            results = WalkForwardBacktester().run(
+                dataset,
+                model,
+                config,
+                recorder=recorder,
+                completed=target.completed_windows.get(series_id),
+                series_id=series_id,
+                timer=timer,
+                prepared=prepared_series.get(series_id),
+            )
+            series_metrics = [result.metrics for result in results]
+            series[series_id] = {
+                "metrics": _aggregate_metrics(series_metrics),
                 "num_samples": len(results),
             }
+            pooled.extend(series_metrics)
+            sample_ids.extend(f"{series_id}/{result.sample_id}" for result in results)
+        # Pooled metrics weight every window equally, across all series.
+        scores = _score_columns(pooled)
+        payload = {
+            "benchmark_id": benchmark_id,
+            "model_id": target.model_id,
+            "metrics": _aggregate_metrics(pooled),
+            "num_samples": len(pooled),
+            "num_series": len(panel),
+            "series": series,
+        }
+    else:
+        config = scenario_config or ScenarioConfig()
+        accumulator = _ScenarioScores(benchmark_id, target.model_id, config)
+        evaluated = ScenarioEvaluator().iter_run(
+            data, model, recorder=recorder, config=config, completed=target.completed_samples, timer=timer
+        )
+        for result in evaluated:
+            accumulator.add(result)
+        payload, scores, sample_ids = accumulator.result()
+    return _finalize(target, payload, scores, sample_ids, bootstrap)
+
+
+def _finalize(
+    target: _Target,
+    payload: dict[str, Any],
+    scores: dict[str, np.ndarray],
+    sample_ids: list[str],
+    bootstrap: BootstrapConfig | None,
+) -> tuple[dict[str, Any], dict[str, np.ndarray], list[str]]:
+    recorder, timer = target.recorder, target.timer
+    if bootstrap is not None:
+        with timer.stage("bootstrap"):
+            payload["intervals"] = bootstrap_intervals(scores, bootstrap)
+    payload["timings"] = {**timer.summary(), "wall_seconds": time.perf_counter() - target.started}
+    recorder.record_event("timings", payload["timings"])
+    return payload, scores, sample_ids
+
+
+def _streams_scenarios(
+    benchmark: TimeSeriesBenchmark | PanelBenchmark | ScenarioBenchmark,
+    scenario_config: ScenarioConfig | None,
+) -> bool:
+    return isinstance(benchmark, ScenarioBenchmark) and (scenario_config or ScenarioConfig()).streaming
+
+
+class _ScenarioScores:
+    # Running metrics and per-sample score columns of one model's scenario run.
+    def __init__(self, benchmark_id: str, model_id: str, config: ScenarioConfig) -> None:
+        self.benchmark_id = benchmark_id
+        self.model_id = model_id
+        self.config = config
+        self.stats = {"rcrps": RunningStats()}
+        self.columns: dict[str, list[float]] = {"rcrps": []}
+        self.sample_ids: list[str] = []
 
-        recorder.close()
-        (output_dir / "results.json").write_text(json.dumps(payload, indent=2))
-        (output_dir / "results.md").write_text(_render_markdown(payload))
-        return RunOutput(**payload)
+    def add(self, result: ScenarioResult) -> None:
+        self.stats["rcrps"].update(result.metric)
+        self.columns["rcrps"].append(result.metric)
+        self.sample_ids.append(result.sample_id)
+        for key, value in (result.quantile_metrics or {}).items():
+            self.stats.setdefault(key, RunningStats()).update(value)
+            self.columns.setdefault(key, []).append(value)
+
+    def result(self) -> tuple[dict[str, Any], dict[str, np.ndarray], list[str]]:
+        scores = {key: np.asarray(values, dtype=np.float64) for key, values in self.columns.items()}
+        payload = {
+            "benchmark_id": self.benchmark_id,
+            "model_id": self.model_id,
+            "metrics": {key: item.mean for key, item in self.stats.items()},
+            "num_samples": self.stats["rcrps"].count,
+        }
+        if self.config.track_variance:
+            payload["metric_stats"] = {key: item.as_dict() for key, item in self.stats.items()}
+        return payload, scores, self.sample_ids
+
+
+class _Fanout:
+    # Copies one pass over a sample stream into a queue per consumer. The caller
+    # fills the queues ahead of what consumers need, so a branch only runs dry
+    # once the stream is exhausted.
+    def __init__(self, samples: Iterable[ScenarioSample], count: int) -> None:
+        self._source = iter(samples)
+        self._queues: list[deque[ScenarioSample]] = [deque() for _ in range(count)]
+        self.fed = 0
+        self.exhausted = False
+
+    def fill(self, total: int) -> None:
+        while self.fed < total and not self.exhausted:
+            sample = next(self._source, None)
+            if sample is None:
+                self.exhausted = True
+                return
+            for queue in self._queues:
+                queue.append(sample)
+            self.fed += 1
+
+    def branch(self, index: int) -> Iterator[ScenarioSample]:
+        queue = self._queues[index]
+        while queue:
+            yield queue.popleft()
+
+
+def _evaluate_lockstep(
+    targets: list[_Target],
+    samples: Iterable[ScenarioSample],
+    *,
+    benchmark_id: str,
+    scenario_config: ScenarioConfig | None,
+    bootstrap: BootstrapConfig | None,
+    workers: int,
+) -> list[tuple[dict[str, Any], dict[str, np.ndarray], list[str]]]:
+    # Streamed samples are read once and shared: every model advances by one round
+    # of results before more samples are pulled, so memory stays bounded by a round
+    # rather than the whole stream. A model that has yielded k results has consumed
+    # fewer than k + gather_size samples, which is how far ahead the queues are kept.
+    config = scenario_config or ScenarioConfig()
+    fanout = _Fanout(samples, len(targets))
+    accumulators = [_ScenarioScores(benchmark_id, target.model_id, config) for target in targets]
+    runs = [
+        ScenarioEvaluator().iter_run(
+            fanout.branch(index),
+            target.model,
+            recorder=target.recorder,
+            config=config,
+            completed=target.completed_samples,
+            timer=target.timer,
+        )
+        for index, target in enumerate(targets)
+    ]
+
+    def advance(index: int) -> int:
+        produced = 0
+        for result in islice(runs[index], _LOCKSTEP_ROUND):
+            accumulators[index].add(result)
+            produced += 1
+        return produced
+
+    load = StageTimer()
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        done = 0
+        while True:
+            with load.stage("load"):
+                fanout.fill(done + _LOCKSTEP_ROUND + config.gather_size)
+            if executor is not None:
+                produced = list(executor.map(advance, range(len(targets))))
+            else:
+                produced = [advance(index) for index in range(len(targets))]
+            done += _LOCKSTEP_ROUND
+            if max(produced) < _LOCKSTEP_ROUND:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    results = []
+    for target, accumulator in zip(targets, accumulators):
+        target.timer.merge(load)
+        results.append(_finalize(target, *accumulator.result(), bootstrap))
+    return results
+
+
+def _finish(
+    target: _Target, payload: dict[str, Any], scores: dict[str, np.ndarray], *, resume: bool
+) -> RunOutput:
+    if resume:
+        resumed_windows = sum(len(windows) for windows in target.completed_windows.values())
+        payload["resumed_samples"] = resumed_windows + len(target.completed_samples)
+    if target.cache_before is not None:
+        payload["cache"] = target.model.stats.since(target.cache_before)
+
+    output_dir = target.output_dir
+    (output_dir / "results.json").write_text(json.dumps(payload, indent=2, default=json_default))
+    (output_dir / "results.md").write_text(_render_markdown(payload))
+    (output_dir / COMPLETION_MARKER).write_text(datetime.now(UTC).isoformat() + "\n")
+    return RunOutput(
+        benchmark_id=payload["benchmark_id"],
+        model_id=target.model_id,
+        metrics=payload["metrics"],
+        num_samples=payload["num_samples"],
+        scores=scores,
+    )
+
+
+def write_comparison(
+    output_root: Path, benchmark_id: str, outputs: Mapping[str, RunOutput]
+) -> dict[str, Any]:
+    # Each pair is listed once, in model order, as other minus base: lower-is-better
+    # metrics are negative where the later model wins.
+    # Paired Diebold-Mariano tests need both models' scores over the same windows.
+    deltas: dict[str, dict[str, dict[str, float]]] = {}
+    tests: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+    for base, other in combinations(outputs, 2):
+        shared = outputs[base].metrics.keys() & outputs[other].metrics.keys()
+        deltas.setdefault(base, {})[other] = {
+            key: outputs[other].metrics[key] - outputs[base].metrics[key] for key in sorted(shared)
+        }
+        base_scores, other_scores = outputs[base].scores or {}, outputs[other].scores or {}
+        paired = {
+            key: diebold_mariano(base_scores[key], other_scores[key])
+            for key in sorted(base_scores.keys() & other_scores.keys())
+            if len(base_scores[key]) == len(other_scores[key]) >= 2
+        }
+        if paired:
+            tests.setdefault(base, {})[other] = paired
+    comparison = {
+        "benchmark_id": benchmark_id,
+        "models": {
+            model_id: {"metrics": output.metrics, "num_samples": output.num_samples}
+            for model_id, output in outputs.items()
+        },
+        "deltas": deltas,
+        "tests": tests,
+    }
+    output_root.mkdir(parents=True, exist_ok=True)
+    (output_root / "comparison.json").write_text(json.dumps(comparison, indent=2, default=json_default))
+    (output_root / "comparison.md").write_text(_render_comparison(comparison))
+    return comparison
+
+
+def is_complete(output_dir: Path) -> bool:
+    return (output_dir / COMPLETION_MARKER).exists()
+
+
+def _completed_results(
+    events: list[dict[str, Any]],
+) -> tuple[dict[str | None, dict[str, BacktestResult]], dict[str, ScenarioResult]]:
+    # Windows are grouped by series_id (None outside panel benchmarks).
+    windows: dict[str | None, dict[str, BacktestResult]] = {}
+    samples: dict[str, ScenarioResult] = {}
+    for event in events:
+        payload = dict(event["payload"])
+        if event["event_type"] == "walk_forward_window":
+            series_id = payload.pop("series_id", None)
+            windows.setdefault(series_id, {})[payload["sample_id"]] = BacktestResult(**payload)
+        elif event["event_type"] == "scenario_result":
+            sample_id = payload["sample_id"]
+            quantile_metrics = {key: payload[key] for key in QUANTILE_METRICS if key in payload}
+            samples[sample_id] = ScenarioResult(
+                sample_id=sample_id, metric=payload["rcrps"], quantile_metrics=quantile_metrics or None
+            )
+    return windows, samples
+
+
+def _score_columns(metrics_list: list[dict[str, float]]) -> dict[str, np.ndarray]:
+    columns: dict[str, list[float]] = {}
+    for metrics in metrics_list:
+        for key, value in metrics.items():
+            columns.setdefault(key, []).append(float(value))
+    return {key: np.asarray(values, dtype=np.float64) for key, values in columns.items()}
 
 
 def _aggregate_metrics(metrics_list: list[dict[str, float]]) -> dict[str, float]:
@@ -77,9 +580,62 @@ def _render_markdown(payload: dict[str, Any]) -> str:
         "",
         "## Metrics",
     ]
+    intervals = payload.get("intervals", {})
     for key in sorted(payload["metrics"].keys()):
         value = payload["metrics"][key]
-        lines.append(f"- **{key}**: {value:.4f}")
+        line = f"- **{key}**: {value:.4f}"
+        if key in intervals:
+            interval = intervals[key]
+            line += f" ({interval['confidence']:.0%} CI {interval['lower']:.4f} to {interval['upper']:.4f})"
+        lines.append(line)
+    series = payload.get("series")
+    if series:
+        keys = sorted(payload["metrics"].keys())
+        lines.extend(["", "## Per series", "", "| series | windows | " + " | ".join(keys) + " |"])
+        lines.append("|" + " --- |" * (len(keys) + 2))
+        for series_id, entry in series.items():
+            values = " | ".join(f"{entry['metrics'].get(key, float('nan')):.4f}" for key in keys)
+            lines.append(f"| {series_id} | {entry['num_samples']} | {values} |")
+    return "\n".join(lines)
+
+
+def _render_comparison(comparison: dict[str, Any]) -> str:
+    models = comparison["models"]
+    keys = sorted({key for entry in models.values() for key in entry["metrics"]})
+    lines = [
+        f"# {comparison['benchmark_id']} comparison",
+        "",
+        "## Metrics",
+        "",
+        "| model | samples | " + " | ".join(keys) + " |",
+        "|" + " --- |" * (len(keys) + 2),
+    ]
+    for model_id, entry in models.items():
+        values = " | ".join(f"{entry['metrics'].get(key, float('nan')):.4f}" for key in keys)
+        lines.append(f"| {model_id} | {entry['num_samples']} | {values} |")
+    lines.extend(["", "## Pairwise deltas (other - base)", "", "| base | other | " + " | ".join(keys) + " |"])
+    lines.append("|" + " --- |" * (len(keys) + 2))
+    for base, others in comparison["deltas"].items():
+        for other, delta in others.items():
+            values = " | ".join(f"{delta[key]:+.4f}" if key in delta else "" for key in keys)
+            lines.append(f"| {base} | {other} | {values} |")
+    if comparison.get("tests"):
+        lines.extend(
+            [
+                "",
+                "## Diebold-Mariano tests (other - base)",
+                "",
+                "| base | other | metric | mean diff | statistic | p-value |",
+                "| --- | --- | --- | --- | --- | --- |",
+            ]
+        )
+        for base, others in comparison["tests"].items():
+            for other, paired in others.items():
+                for key, test in paired.items():
+                    lines.append(
+                        f"| {base} | {other} | {key} | {test['mean_diff']:+.4f} | "
+                        f"{test['statistic']:.3f} | {test['p_value']:.4f} |"
+                    )
     return "\n".join(lines)
 
 
@@ -1,69 +1,178 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping
 
-from cfevals.benchmarks.base import ScenarioSample
+import numpy as np
+
+from cfevals.benchmarks.base import ScenarioSample, to_list
+from cfevals.engine.concurrency import predict_requests
+from cfevals.engine.timing import StageTimer
 from cfevals.engine.validation import normalize_samples, validate_forecast_result
-from cfevals.metrics.probabilistic import rcrps
+from cfevals.metrics.probabilistic import rcrps_matrix, roi_penalty
+from cfevals.metrics.quantile import QuantileLevels, parse_quantile_keys, score_quantiles
 from cfevals.models.base import ForecastRequest, ForecastResult, Model
 from cfevals.record import RecorderBase
 
+SCORING_MODES = ("samples", "quantiles")
+
+
+@dataclass(frozen=True)
+class ScenarioConfig:
+    batch_size: int = 1
+    max_concurrency: int = 1
+    streaming: bool = False
+    track_variance: bool = False
+    # "samples" scores every forecast by sample RCRPS, treating quantile-only
+    # forecasts as equally weighted samples. "quantiles" scores quantile-only
+    # forecasts directly (RCRPS from quantile CRPS) and reports pinball loss, WIS and
+    # quantile CRPS for every sample; sample and point forecasts are summarized at
+    # quantile_levels for those.
+    scoring: str = "samples"
+    quantile_levels: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95)
+    _levels: QuantileLevels = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.scoring not in SCORING_MODES:
+            raise ValueError(f"scoring must be one of {SCORING_MODES}, got {self.scoring!r}")
+        # Registry specs give a list; keep the frozen config hashable.
+        object.__setattr__(self, "quantile_levels", tuple(self.quantile_levels))
+        object.__setattr__(self, "_levels", QuantileLevels.from_levels(self.quantile_levels))
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {self.max_concurrency}")
+
+    @property
+    def gather_size(self) -> int:
+        # Concurrent dispatch needs at least max_concurrency requests in flight.
+        return max(self.batch_size, self.max_concurrency)
+
 
 @dataclass(frozen=True)
 class ScenarioResult:
     sample_id: str
     metric: float
+    # pinball / wis / quantile_crps under scoring="quantiles".
+    quantile_metrics: dict[str, float] | None = None
 
 
 class ScenarioEvaluator:
-    def run(self, samples: list[ScenarioSample], model: Model, *, recorder: RecorderBase) -> list[ScenarioResult]:
-        results: list[ScenarioResult] = []
+    def run(
+        self,
+        samples: list[ScenarioSample],
+        model: Model,
+        *,
+        recorder: RecorderBase,
+        config: ScenarioConfig | None = None,
+        completed: Mapping[str, ScenarioResult] | None = None,
+        timer: StageTimer | None = None,
+    ) -> list[ScenarioResult]:
+        return list(
+            self.iter_run(samples, model, recorder=recorder, config=config, completed=completed, timer=timer)
+        )
+
+    def iter_run(
+        self,
+        samples: Iterable[ScenarioSample],
+        model: Model,
+        *,
+        recorder: RecorderBase,
+        config: ScenarioConfig | None = None,
+        completed: Mapping[str, ScenarioResult] | None = None,
+        timer: StageTimer | None = None,
+    ) -> Iterator[ScenarioResult]:
+        # Pulls at most one batch of samples ahead of the results it yields, so
+        # streamed benchmarks never materialize in full. Samples in `completed`
+        # (recovered from an interrupted run) are yielded in place, unscored.
+        config = config or ScenarioConfig()
+        completed = completed or {}
+        timer = timer if timer is not None else StageTimer()
         model.reset()
-        for sample in samples:
-            request = ForecastRequest(
-                history=sample.history,
-                horizon=len(sample.future),
-                context_text=sample.context_text,
-                metadata=sample.metadata,
-            )
-            result = model.predict(request)
-            context = f"scenario sample {sample.sample_id}"
-            validate_forecast_result(result, len(sample.future), context=context)
-            samples_matrix = _expand_samples(result, len(sample.future), context=context)
-            if not samples_matrix:
-                raise ValueError(f"{context}: no samples available for RCRPS scoring")
-            for idx, sample_set in enumerate(samples_matrix):
-                if not sample_set:
-                    raise ValueError(f"{context}: empty sample set at horizon index {idx}")
-            roi = sample.roi
-            scores = [
-                rcrps(sample_set, target, roi=roi, penalty_weight=1.0)
-                for sample_set, target in zip(samples_matrix, sample.future)
+        iterator = iter(samples)
+        while batch := list(islice(iterator, config.gather_size)):
+            fresh = [sample for sample in batch if sample.sample_id not in completed]
+            requests = [
+                ForecastRequest(
+                    history=sample.history if model.accepts_arrays else to_list(sample.history),
+                    horizon=len(sample.future),
+                    context_text=sample.context_text,
+                    metadata=sample.metadata,
+                )
+                for sample in fresh
             ]
-            metric_value = float(sum(scores) / len(scores))
-            recorder.record_event(
-                "scenario_result",
-                {"sample_id": sample.sample_id, "rcrps": metric_value},
-                sample_id=sample.sample_id,
-            )
-            results.append(ScenarioResult(sample_id=sample.sample_id, metric=metric_value))
-        return results
+            forecasts: Iterator[ForecastResult] = iter(())
+            if requests:
+                # Recorded per sample: a batched call is split evenly across its samples.
+                with timer.stage("predict", count=len(requests)):
+                    predicted = predict_requests(
+                        model, requests, context="scenario batch", max_concurrency=config.max_concurrency
+                    )
+                forecasts = iter(predicted)
+            for sample in batch:
+                if sample.sample_id in completed:
+                    yield completed[sample.sample_id]
+                    continue
+                result = next(forecasts)
+                with timer.stage("validate"):
+                    validate_forecast_result(result, len(sample.future), context=_context(sample))
+                with timer.stage("score"):
+                    metric_value, quantile_metrics = _score_sample(sample, result, config)
+                recorder.record_event(
+                    "scenario_result",
+                    {"sample_id": sample.sample_id, "rcrps": metric_value, **(quantile_metrics or {})},
+                    sample_id=sample.sample_id,
+                )
+                yield ScenarioResult(
+                    sample_id=sample.sample_id, metric=metric_value, quantile_metrics=quantile_metrics
+                )
+
+
+def _context(sample: ScenarioSample) -> str:
+    return f"scenario sample {sample.sample_id}"
+
+
+def _score_sample(
+    sample: ScenarioSample, result: ForecastResult, config: ScenarioConfig
+) -> tuple[float, dict[str, float] | None]:
+    # Expects a result that already passed validate_forecast_result.
+    context = _context(sample)
+    if config.scoring == "quantiles" and result.samples is None and result.quantiles:
+        try:
+            levels = parse_quantile_keys(result.quantiles)
+            values = np.asarray([result.quantiles[key] for key in levels.keys], dtype=np.float64)
+            metrics = score_quantiles(values, levels, sample.future)
+        except ValueError as exc:
+            raise ValueError(f"{context}: {exc}") from exc
+        penalty = np.mean(roi_penalty(sample.future, sample.roi))
+        return metrics["quantile_crps"] + float(penalty), metrics
+    matrix = _expand_samples(result, len(sample.future), context=context)
+    if matrix.shape[1] == 0:
+        raise ValueError(f"{context}: no samples available for RCRPS scoring")
+    scores = rcrps_matrix(matrix, sample.future, roi=sample.roi, penalty_weight=1.0)
+    if config.scoring != "quantiles":
+        return float(np.mean(scores)), None
+    levels = config._levels
+    values = np.quantile(matrix, levels.levels, axis=1)
+    return float(np.mean(scores)), score_quantiles(values, levels, sample.future)
 
 
-def _expand_samples(result: ForecastResult, horizon: int, *, context: str) -> list[list[float]]:
+def _expand_samples(result: ForecastResult, horizon: int, *, context: str) -> np.ndarray:
+    # A [H, S] view over the forecast: samples and quantile levels are transposed,
+    # not copied, and a point forecast is a single sample per step.
     if result.samples is None and result.quantiles:
         keys = _sorted_quantile_keys(result.quantiles)
-        quantiles = [result.quantiles[key] for key in keys]
-        return [list(map(float, vals)) for vals in zip(*quantiles)]
-    if result.samples is None:
-        return [[float(val)] for val in result.point_forecast]
+        return np.asarray([result.quantiles[key] for key in keys], dtype=np.float64).T
     samples = normalize_samples(result, horizon, context=context)
     if samples is None:
-        return [[float(val)] for val in result.point_forecast]
-    return [list(map(float, vals)) for vals in zip(*samples)]
+        return np.asarray(result.point_forecast, dtype=np.float64).reshape(horizon, 1)
+    return samples.T
 
 
-def _sorted_quantile_keys(quantiles: dict[str, list[float]]) -> list[str]:
+def _sorted_quantile_keys(quantiles: dict[str, Any]) -> list[str]:
+    # Sample scoring only needs an order, so keys such as "10" or "p10" are kept;
+    # levels in (0, 1) are required only by scoring="quantiles".
     def sort_key(key: str) -> tuple[int, float | str]:
         try:
             return (0, float(key))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from cfevals.engine.runner import RunOutput, is_complete
+
+JOB_STATUSES = ("done", "skipped", "failed")
+
+
+@dataclass(frozen=True)
+class Job:
+    benchmark_id: str
+    model_id: str
+    output_dir: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.benchmark_id} x {self.model_id}"
+
+
+@dataclass(frozen=True)
+class JobOutcome:
+    job: Job
+    status: str
+    elapsed: float = 0.0
+    output: RunOutput | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class Progress:
+    total: int
+    done: int
+    skipped: int
+    failed: int
+    running: int
+
+    @property
+    def finished(self) -> int:
+        return self.done + self.skipped + self.failed
+
+    def summary(self) -> str:
+        return (
+            f"[{self.finished}/{self.total}] done={self.done} skipped={self.skipped} "
+            f"failed={self.failed} running={self.running}"
+        )
+
+
+@dataclass
+class JobScheduler:
+    # run_job must be picklable (a module-level function or a partial of one)
+    # when workers > 1, since jobs are executed in a process pool.
+    run_job: Callable[[Job], RunOutput]
+    workers: int = 1
+    resume: bool = False
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError(f"workers must be >= 1, got {self.workers}")
+
+    def run(
+        self,
+        jobs: Iterable[Job],
+        on_outcome: Callable[[JobOutcome, Progress], None] | None = None,
+    ) -> list[JobOutcome]:
+        jobs = list(jobs)
+        pending: list[Job] = []
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        outcomes: dict[Job, JobOutcome] = {}
+
+        def report(outcome: JobOutcome, running: int) -> None:
+            outcomes[outcome.job] = outcome
+            counts[outcome.status] += 1
+            if on_outcome is not None:
+                on_outcome(outcome, Progress(total=len(jobs), running=running, **counts))
+
+        for job in jobs:
+            if self.resume and is_complete(job.output_dir):
+                report(JobOutcome(job=job, status="skipped"), running=0)
+            else:
+                pending.append(job)
+
+        if self.workers == 1 or len(pending) <= 1:
+            for job in pending:
+                report(_run_timed(self.run_job, job), running=0)
+        else:
+            for outcome, running in self._run_pool(pending):
+                report(outcome, running)
+        return [outcomes[job] for job in jobs]
+
+    def _run_pool(self, jobs: list[Job]) -> Iterator[tuple[JobOutcome, int]]:
+        workers = min(self.workers, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("forkserver")) as pool:
+            futures: dict[Future[JobOutcome], Job] = {
+                pool.submit(_run_timed, self.run_job, job): job for job in jobs
+            }
+            remaining = set(futures)
+            while remaining:
+                finished, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    error = future.exception()
+                    if error is None:
+                        outcome = future.result()
+                    else:
+                        # The worker itself died (e.g. it was killed); the job did not finish.
+                        outcome = JobOutcome(job=futures[future], status="failed", error=repr(error))
+                    yield outcome, min(workers, len(remaining))
+
+
+def _run_timed(run_job: Callable[[Job], RunOutput], job: Job) -> JobOutcome:
+    started = time.perf_counter()
+    try:
+        output = run_job(job)
+    except Exception as exc:  # noqa: BLE001
+        return JobOutcome(job=job, status="failed", elapsed=time.perf_counter() - started, error=repr(exc))
+    return JobOutcome(job=job, status="done", elapsed=time.perf_counter() - started, output=output)
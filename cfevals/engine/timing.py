@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import numpy as np
+
+from cfevals.record import RecorderBase
+
+
+@dataclass
+class StageTimer:
+    # Wall and CPU seconds per call, per stage. CPU time is the calling thread's,
+    # so threaded backtests do not count each other's work.
+    wall: dict[str, list[float]] = field(default_factory=dict)
+    cpu: dict[str, list[float]] = field(default_factory=dict)
+
+    @contextmanager
+    def stage(self, name: str, count: int = 1) -> Iterator[None]:
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall_start, time.thread_time() - cpu_start, count)
+
+    def add(self, name: str, wall: float, cpu: float, count: int = 1) -> None:
+        # count > 1 splits one measurement evenly, e.g. a batch into per-window latencies.
+        self.wall.setdefault(name, []).extend([wall / count] * count)
+        self.cpu.setdefault(name, []).extend([cpu / count] * count)
+
+    def merge(self, other: "StageTimer") -> None:
+        for name, values in other.wall.items():
+            self.wall.setdefault(name, []).extend(values)
+        for name, values in other.cpu.items():
+            self.cpu.setdefault(name, []).extend(values)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "stages": {
+                name: {
+                    "count": len(values),
+                    "wall": _distribution(values),
+                    "cpu": _distribution(self.cpu.get(name, [])),
+                }
+                for name, values in self.wall.items()
+            },
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+
+
+class TimedRecorder(RecorderBase):
+    def __init__(self, recorder: RecorderBase, timer: StageTimer) -> None:
+        super().__init__()
+        self.recorder = recorder
+        self.timer = timer
+
+    def set_sample_id(self, sample_id: str) -> None:
+        self.recorder.set_sample_id(sample_id)
+
+    def record_event(self, event_type: str, payload: dict[str, Any], *, sample_id: str | None = None) -> None:
+        with self.timer.stage("record"):
+            self.recorder.record_event(event_type, payload, sample_id=sample_id)
+
+    def close(self) -> None:
+        with self.timer.stage("record_close"):
+            self.recorder.close()
+
+
+def peak_rss_bytes() -> int | None:
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"total": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    arr = np.asarray(values, dtype=float)
+    p50, p95 = np.percentile(arr, [50, 95]).tolist()
+    return {"total": float(arr.sum()), "p50": p50, "p95": p95, "max": float(arr.max())}
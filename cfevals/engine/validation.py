@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any
+
+import numpy as np
 
 from cfevals.models.base import ForecastResult
 
@@ -21,32 +23,28 @@ def normalize_samples(
     horizon: int,
     *,
     context: str,
-) -> list[list[float]] | None:
+) -> np.ndarray | None:
+    # Samples as a float [S, H] array; float64 ndarrays come back as-is (no copy),
+    # and a flat length-H sequence is a single sample.
     if result.samples is None:
         return None
-    samples = result.samples
-    if not isinstance(samples, list):
-        raise TypeError(f"{context}: samples must be a list")
-    if not samples:
+    _validate_samples(result.samples, horizon, context=context)
+    samples = np.asarray(result.samples, dtype=np.float64)
+    if samples.size == 0:
         raise ValueError(f"{context}: samples is empty")
-    if isinstance(samples[0], list):
-        for idx, sample in enumerate(samples):
-            if len(sample) != horizon:
-                raise ValueError(
-                    f"{context}: sample[{idx}] length {len(sample)} does not match horizon {horizon}"
-                )
-        return [[float(v) for v in sample] for sample in samples]
-    if len(samples) != horizon:
-        raise ValueError(f"{context}: samples length {len(samples)} does not match horizon {horizon}")
-    return [[float(v) for v in samples]]
+    return samples.reshape(-1, horizon)
 
 
-def _validate_samples(samples: list[float] | list[list[float]], horizon: int, *, context: str) -> None:
+def _validate_samples(samples: Any, horizon: int, *, context: str) -> None:
+    if isinstance(samples, np.ndarray):
+        if samples.ndim not in (1, 2) or (samples.size and samples.shape[-1] != horizon):
+            raise ValueError(f"{context}: samples shape {samples.shape} does not match horizon {horizon}")
+        return
     if not isinstance(samples, list):
-        raise TypeError(f"{context}: samples must be a list")
+        raise TypeError(f"{context}: samples must be a list or ndarray")
     if not samples:
         return
-    if isinstance(samples[0], list):
+    if isinstance(samples[0], (list, np.ndarray)):
         for idx, sample in enumerate(samples):
             if len(sample) != horizon:
                 raise ValueError(
@@ -56,13 +54,13 @@ def _validate_samples(samples: list[float] | list[list[float]], horizon: int, *,
         raise ValueError(f"{context}: samples length {len(samples)} does not match horizon {horizon}")
 
 
-def _validate_quantiles(quantiles: dict[str, list[float]], horizon: int, *, context: str) -> None:
+def _validate_quantiles(quantiles: dict[str, Any], horizon: int, *, context: str) -> None:
     if not isinstance(quantiles, dict):
         raise TypeError(f"{context}: quantiles must be a dict")
     if not quantiles:
         raise ValueError(f"{context}: quantiles is empty")
     for key, series in quantiles.items():
-        if not isinstance(series, Iterable):
+        if np.ndim(series) != 1:
             raise TypeError(f"{context}: quantile {key} is not a sequence")
         if len(series) != horizon:
             raise ValueError(
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass
+class RunningStats:
+    # The mean is total / count so it matches a plain average exactly; the
+    # variance uses Welford's update to stay stable over long streams.
+    count: int = 0
+    total: float = 0.0
+    _welford_mean: float = 0.0
+    _m2: float = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        delta = value - self._welford_mean
+        self._welford_mean += delta / self.count
+        self._m2 += delta * (value - self._welford_mean)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "std": math.sqrt(self.variance),
+        }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 
 
@@ -32,3 +34,57 @@ def mase(y_true: list[float], y_pred: list[float], insample: list[float]) -> flo
     scale = np.mean(np.abs(np.diff(insample_arr)))
     scale = scale if scale != 0 else 1.0
     return float(np.mean(np.abs(arr_true - arr_pred)) / scale)
+
+
+def point_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    mase_scale: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    # Row-wise mae/rmse/smape (and mase when scales are given) for stacked [W, H]
+    # windows in one pass; each row matches the scalar functions above.
+    arr_true = np.asarray(y_true, dtype=float)
+    arr_pred = np.asarray(y_pred, dtype=float)
+    if arr_true.ndim != 2 or arr_true.shape != arr_pred.shape:
+        raise ValueError(f"y_true shape {arr_true.shape} and y_pred shape {arr_pred.shape} must match [W, H]")
+    errors = arr_true - arr_pred
+    abs_errors = np.abs(errors)
+    denom = (np.abs(arr_true) + np.abs(arr_pred)) / 2.0
+    denom = np.where(denom == 0, 1.0, denom)
+    metrics = {
+        "mae": np.mean(abs_errors, axis=1),
+        "rmse": np.sqrt(np.mean(errors**2, axis=1)),
+        "smape": np.mean(abs_errors / denom, axis=1),
+    }
+    if mase_scale is not None:
+        metrics["mase"] = metrics["mae"] / mase_scale
+    return metrics
+
+
+@dataclass(frozen=True)
+class MaseScale:
+    # Prefix sums of |y[t+1] - y[t]| over a whole series, so the in-sample MASE
+    # denominator of any history slice [lo, hi) costs O(1) instead of O(hi - lo).
+    abs_diff_sums: np.ndarray
+    nan_counts: np.ndarray
+
+    @classmethod
+    def from_series(cls, values: list[float] | np.ndarray) -> "MaseScale":
+        diffs = np.abs(np.diff(np.asarray(values, dtype=float)))
+        missing = np.isnan(diffs)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, diffs))))
+        counts = np.concatenate(([0], np.cumsum(missing)))
+        return cls(abs_diff_sums=sums, nan_counts=counts)
+
+    def between(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        lo = np.asarray(lo, dtype=np.int64)
+        last = np.asarray(hi, dtype=np.int64) - 1
+        count = last - lo
+        valid = count > 0
+        lo, last = np.where(valid, lo, 0), np.where(valid, last, 0)
+        total = self.abs_diff_sums[last] - self.abs_diff_sums[lo]
+        scale = total / np.where(valid, count, 1)
+        # Same conventions as mase(): NaN for short or gappy histories, 1.0 for flat ones.
+        scale = np.where(scale == 0, 1.0, scale)
+        has_nan = self.nan_counts[last] - self.nan_counts[lo] > 0
+        return np.where(valid & ~has_nan, scale, np.nan)
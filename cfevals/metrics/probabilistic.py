@@ -1,14 +1,40 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 import numpy as np
 
+from cfevals.metrics.quantile import pinball_loss
+
 
 def crps(samples: list[float], target: float) -> float:
     arr = np.asarray(samples, dtype=float)
-    target_val = float(target)
-    term1 = np.mean(np.abs(arr - target_val))
-    term2 = 0.5 * np.mean(np.abs(arr[:, None] - arr[None, :]))
-    return float(term1 - term2)
+    return float(crps_matrix(arr[None, :], np.asarray([target], dtype=float))[0])
+
+
+def crps_matrix(samples: np.ndarray, targets: Sequence[float] | np.ndarray) -> np.ndarray:
+    # Sample CRPS per horizon step: E|X - y| - 0.5 E|X - X'|. With the samples
+    # sorted, the pairwise term reduces to a weighted sum of order statistics,
+    # so a [H, S] forecast costs O(H * S log S) instead of O(H * S^2).
+    arr = np.sort(np.asarray(samples, dtype=float), axis=-1)
+    target_arr = np.asarray(targets, dtype=float)
+    if arr.ndim != 2 or target_arr.shape != arr.shape[:1]:
+        raise ValueError(f"samples shape {arr.shape} does not match targets shape {target_arr.shape}")
+    size = arr.shape[1]
+    term1 = np.mean(np.abs(arr - target_arr[:, None]), axis=1)
+    weights = (2.0 * np.arange(1, size + 1) - size - 1) / float(size * size)
+    term2 = arr @ weights
+    return term1 - term2
+
+
+def quantile_crps(
+    quantile_values: np.ndarray,
+    levels: Sequence[float] | np.ndarray,
+    targets: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    # CRPS approximated as twice the mean pinball loss over the provided levels,
+    # for forecasts that only carry quantiles. quantile_values is [Q, H].
+    return 2.0 * np.mean(pinball_loss(quantile_values, levels, targets), axis=0)
 
 
 def rcrps(
@@ -17,14 +43,24 @@ def rcrps(
     roi: tuple[float, float] | None = None,
     penalty_weight: float = 1.0,
 ) -> float:
+    arr = np.asarray(samples, dtype=float)
+    return float(rcrps_matrix(arr[None, :], [target], roi=roi, penalty_weight=penalty_weight)[0])
+
+
+def rcrps_matrix(
+    samples: np.ndarray,
+    targets: Sequence[float] | np.ndarray,
+    roi: tuple[float, float] | None = None,
+    penalty_weight: float = 1.0,
+) -> np.ndarray:
     # Minimal adaptation of the CiK (Context is Key) RCRPS definition.
-    base = crps(samples, target)
+    base = crps_matrix(samples, targets)
+    return base + penalty_weight * roi_penalty(targets, roi)
+
+
+def roi_penalty(targets: Sequence[float] | np.ndarray, roi: tuple[float, float] | None) -> np.ndarray | float:
     if roi is None:
-        return base
+        return 0.0
     lower, upper = roi
-    penalty = 0.0
-    if target < lower:
-        penalty = lower - target
-    elif target > upper:
-        penalty = target - upper
-    return float(base + penalty_weight * penalty)
+    target_arr = np.asarray(targets, dtype=float)
+    return np.maximum(lower - target_arr, 0.0) + np.maximum(target_arr - upper, 0.0)
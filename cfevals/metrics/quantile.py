@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+import numpy as np
+
+# Per-sample metrics reported by score_quantiles.
+QUANTILE_METRICS = ("pinball", "wis", "quantile_crps")
+
+# Levels are treated as a symmetric pair when they sum to 1 within this tolerance.
+_PAIR_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True, eq=False)
+class QuantileLevels:
+    # Quantile keys sorted by numeric level, with the rows that make up the weighted
+    # interval score: each central interval (levels a/2 and 1 - a/2) plus the median.
+    keys: tuple[str, ...]
+    levels: np.ndarray
+    wis_rows: np.ndarray
+    wis_denominator: float
+
+    @classmethod
+    def from_levels(cls, levels: Sequence[float], keys: Sequence[str] | None = None) -> "QuantileLevels":
+        keys = tuple(keys) if keys is not None else tuple(str(level) for level in levels)
+        if len(keys) != len(levels) or not keys:
+            raise ValueError("quantile levels must be non-empty and match their keys")
+        level_arr = np.asarray(levels, dtype=np.float64)
+        if not np.all((level_arr > 0.0) & (level_arr < 1.0)):
+            raise ValueError(f"quantile levels must lie in (0, 1), got {level_arr.tolist()}")
+        order = np.argsort(level_arr, kind="stable")
+        level_arr = level_arr[order]
+        if np.any(np.diff(level_arr) == 0.0):
+            raise ValueError(f"duplicate quantile levels {level_arr.tolist()}")
+
+        rows: list[int] = []
+        pairs = 0
+        for row, level in enumerate(level_arr):
+            if level >= 0.5:
+                break
+            partner = np.flatnonzero(np.abs(level_arr - (1.0 - level)) <= _PAIR_TOLERANCE)
+            if partner.size:
+                rows.extend((row, int(partner[0])))
+                pairs += 1
+        median = np.flatnonzero(np.abs(level_arr - 0.5) <= _PAIR_TOLERANCE)
+        rows.extend(int(row) for row in median)
+        return cls(
+            keys=tuple(keys[idx] for idx in order),
+            levels=level_arr,
+            wis_rows=np.asarray(sorted(rows), dtype=np.intp),
+            wis_denominator=pairs + 0.5 * median.size,
+        )
+
+
+def parse_quantile_keys(keys: Iterable[str]) -> QuantileLevels:
+    # Forecasts from one model repeat the same key set, so parsing and sorting is
+    # done once per distinct set rather than once per sample.
+    return _parse_keys(frozenset(keys))
+
+
+@lru_cache(maxsize=256)
+def _parse_keys(keys: frozenset[str]) -> QuantileLevels:
+    ordered = tuple(keys)
+    try:
+        levels = [float(key) for key in ordered]
+    except ValueError as exc:
+        raise ValueError(f"quantile keys must be numeric levels, got {sorted(ordered)}") from exc
+    return QuantileLevels.from_levels(levels, ordered)
+
+
+def pinball_loss(
+    quantile_values: np.ndarray,
+    levels: Sequence[float] | np.ndarray,
+    targets: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    # Pinball (quantile) loss per level and horizon step, [Q, H].
+    values = np.asarray(quantile_values, dtype=np.float64)
+    level_arr = np.asarray(levels, dtype=np.float64)
+    target_arr = np.asarray(targets, dtype=np.float64)
+    if values.shape != (len(level_arr), len(target_arr)):
+        raise ValueError(
+            f"quantile values shape {values.shape} does not match ({len(level_arr)}, {len(target_arr)})"
+        )
+    diff = target_arr[None, :] - values
+    return np.maximum(level_arr[:, None] * diff, (level_arr[:, None] - 1.0) * diff)
+
+
+def weighted_interval_score(
+    quantile_values: np.ndarray,
+    levels: QuantileLevels | Sequence[float],
+    targets: Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    # WIS per horizon step (Bracher et al., 2021). a/2 * IS_a equals the pinball
+    # losses of the interval's two bounds, so WIS is their sum plus the median's,
+    # over K + 1/2.
+    values = np.asarray(quantile_values, dtype=np.float64)
+    if isinstance(levels, QuantileLevels):
+        spec = levels
+    else:
+        # Rows are reordered along with the levels they belong to.
+        spec = QuantileLevels.from_levels(levels)
+        values = values[np.argsort(np.asarray(levels, dtype=np.float64), kind="stable")]
+    return _wis(pinball_loss(values, spec.levels, targets), spec)
+
+
+def score_quantiles(
+    quantile_values: np.ndarray,
+    levels: QuantileLevels,
+    targets: Sequence[float] | np.ndarray,
+) -> dict[str, float]:
+    # Horizon-averaged pinball loss, WIS and quantile CRPS (twice the mean pinball
+    # loss over levels) from one pinball matrix. quantile_values rows follow levels.
+    loss = pinball_loss(quantile_values, levels.levels, targets)
+    return {
+        "pinball": float(np.mean(loss)),
+        "wis": float(np.mean(_wis(loss, levels))),
+        "quantile_crps": float(2.0 * np.mean(loss)),
+    }
+
+
+def _wis(loss: np.ndarray, spec: QuantileLevels) -> np.ndarray:
+    if not spec.wis_rows.size:
+        raise ValueError(f"quantile levels {spec.levels.tolist()} have no central interval or median for WIS")
+    return loss[spec.wis_rows].sum(axis=0) / spec.wis_denominator
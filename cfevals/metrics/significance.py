@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+# Random block starts drawn per chunk; bounds memory at large resample counts.
+_CHUNK_ELEMENTS = 4_000_000
+
+
+@dataclass(frozen=True)
+class BootstrapConfig:
+    resamples: int = 1000
+    confidence: float = 0.95
+    # None picks ceil(n ** (1/3)), the usual rate for block bootstraps of a mean.
+    block_length: int | None = None
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.resamples < 1:
+            raise ValueError(f"resamples must be >= 1, got {self.resamples}")
+        if not 0.0 < self.confidence < 1.0:
+            raise ValueError(f"confidence must lie in (0, 1), got {self.confidence}")
+        if self.block_length is not None and self.block_length < 1:
+            raise ValueError(f"block_length must be >= 1, got {self.block_length}")
+
+
+def default_block_length(count: int) -> int:
+    return max(1, math.ceil(count ** (1.0 / 3.0)))
+
+
+def block_bootstrap_means(
+    scores: Sequence[float] | np.ndarray,
+    *,
+    resamples: int,
+    block_length: int,
+    seed: int = 0,
+) -> np.ndarray:
+    # Circular block bootstrap of the mean. Consecutive scores (walk-forward windows)
+    # are resampled in blocks to keep their dependence. Every block sum is
+    # precomputed from a cumulative sum, so a resample costs one gather of
+    # ceil(n / block_length) block sums rather than n scores.
+    values = np.asarray(scores, dtype=np.float64)
+    count = values.size
+    if count == 0:
+        raise ValueError("cannot bootstrap an empty score array")
+    length = min(block_length, count)
+    wrapped = np.concatenate([values, values[: length - 1]])
+    cumulative = np.concatenate([[0.0], np.cumsum(wrapped)])
+    block_sums = cumulative[length : length + count] - cumulative[:count]
+    blocks = math.ceil(count / length)
+
+    rng = np.random.default_rng(seed)
+    means = np.empty(resamples, dtype=np.float64)
+    chunk = max(1, _CHUNK_ELEMENTS // blocks)
+    for start in range(0, resamples, chunk):
+        stop = min(start + chunk, resamples)
+        starts = rng.integers(0, count, size=(stop - start, blocks))
+        means[start:stop] = block_sums[starts].sum(axis=1) / (blocks * length)
+    return means
+
+
+def bootstrap_interval(scores: Sequence[float] | np.ndarray, config: BootstrapConfig) -> dict[str, Any]:
+    values = np.asarray(scores, dtype=np.float64)
+    block_length = config.block_length or default_block_length(values.size)
+    means = block_bootstrap_means(
+        values, resamples=config.resamples, block_length=block_length, seed=config.seed
+    )
+    tail = (1.0 - config.confidence) / 2.0
+    lower, upper = np.quantile(means, [tail, 1.0 - tail])
+    return {
+        "mean": float(np.mean(values)),
+        "lower": float(lower),
+        "upper": float(upper),
+        "confidence": config.confidence,
+        "block_length": min(block_length, values.size),
+        "resamples": config.resamples,
+    }
+
+
+def bootstrap_intervals(
+    scores: Mapping[str, Sequence[float] | np.ndarray], config: BootstrapConfig
+) -> dict[str, dict[str, Any]]:
+    return {key: bootstrap_interval(values, config) for key, values in scores.items() if len(values)}
+
+
+def diebold_mariano(
+    base: Sequence[float] | np.ndarray,
+    other: Sequence[float] | np.ndarray,
+    *,
+    lag: int | None = None,
+) -> dict[str, Any]:
+    # Paired test of equal mean loss on per-window (or per-sample) scores of two
+    # models over the same windows. The long-run variance of the loss differential
+    # uses Newey-West (Bartlett) weights up to `lag` autocovariances, defaulting to
+    # ceil(n ** (1/3)); the p-value is two-sided against a standard normal.
+    diff = np.asarray(other, dtype=np.float64) - np.asarray(base, dtype=np.float64)
+    if diff.ndim != 1 or diff.size < 2:
+        raise ValueError(f"need two paired score arrays of equal length >= 2, got shape {diff.shape}")
+    count = diff.size
+    lag = default_block_length(count) if lag is None else min(lag, count - 1)
+    centered = diff - diff.mean()
+    variance = float(centered @ centered) / count
+    for k in range(1, lag + 1):
+        weight = 1.0 - k / (lag + 1.0)
+        variance += 2.0 * weight * float(centered[k:] @ centered[:-k]) / count
+    mean = float(diff.mean())
+    if variance <= 0.0:
+        statistic = 0.0 if mean == 0.0 else math.copysign(math.inf, mean)
+    else:
+        statistic = mean / math.sqrt(variance / count)
+    return {
+        "mean_diff": mean,
+        "statistic": statistic,
+        "p_value": math.erfc(abs(statistic) / math.sqrt(2.0)),
+        "lag": lag,
+        "count": count,
+    }
@@ -1,8 +1,17 @@
-from cfevals.models.base import ForecastRequest, ForecastResult, Model
-from cfevals.models.llm import OpenAIModel, parse_json_response
-from cfevals.models.naive import LastValueModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cfevals.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from cfevals.models.base import ForecastRequest, ForecastResult, Model
+    from cfevals.models.llm import OpenAIModel, parse_json_response
+    from cfevals.models.naive import LastValueModel
+    from cfevals.models.smoothing import ExponentialSmoothingModel
 
 __all__ = [
+    "ExponentialSmoothingModel",
     "ForecastRequest",
     "ForecastResult",
     "Model",
@@ -10,3 +19,16 @@ __all__ = [
     "parse_json_response",
     "LastValueModel",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ExponentialSmoothingModel": "cfevals.models.smoothing",
+        "ForecastRequest": "cfevals.models.base",
+        "ForecastResult": "cfevals.models.base",
+        "Model": "cfevals.models.base",
+        "OpenAIModel": "cfevals.models.llm",
+        "parse_json_response": "cfevals.models.llm",
+        "LastValueModel": "cfevals.models.naive",
+    },
+)
@@ -1,36 +1,70 @@
 from __future__ import annotations
 
 import abc
+import copy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ForecastRequest:
-    history: list[float]
+    history: list[float] | np.ndarray
     horizon: int
-    timestamps: list[datetime] | None = None
-    features: dict[str, list[float]] | None = None
+    timestamps: list[datetime] | np.ndarray | None = None
+    features: dict[str, list[float] | np.ndarray] | None = None
     context_text: str | None = None
     metadata: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForecastResult:
-    point_forecast: list[float]
-    samples: list[list[float]] | None = None
-    quantiles: dict[str, list[float]] | None = None
+    # Payloads may be lists or ndarrays and are carried as given through validation
+    # and scoring; samples are [S, H] (or one flat length-H sample), quantile series
+    # are length H. Lists are produced only when results are serialized.
+    point_forecast: list[float] | np.ndarray
+    samples: list[list[float]] | np.ndarray | None = None
+    quantiles: dict[str, list[float] | np.ndarray] | None = None
     metadata: dict[str, Any] | None = None
 
 
 class Model(abc.ABC):
+    # Models that index histories positionally (len, [-1], np.asarray) can take
+    # ndarray views from columnar datasets; everything else receives lists, or
+    # LazyList views over those arrays that convert items as they are read.
+    accepts_arrays: bool = False
+    # Models that can extend a fit with newly observed points implement update();
+    # expanding-window backtests then pass only the points since the last fit.
+    supports_update: bool = False
+
     def reset(self) -> None:
         return None
 
     def fit(self, request: ForecastRequest) -> None:
         return None
 
+    def update(self, request: ForecastRequest) -> None:
+        # request.history (and timestamps/features) holds only the points appended
+        # since the previous fit() or update().
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental updates")
+
+    def clone(self) -> "Model":
+        # Used by threaded backtests so concurrent segments never share fitted state.
+        return copy.deepcopy(self)
+
     @abc.abstractmethod
     def predict(self, request: ForecastRequest) -> ForecastResult:
         raise NotImplementedError
+
+    def predict_batch(self, requests: list[ForecastRequest]) -> list[ForecastResult]:
+        return [self.predict(request) for request in requests]
+
+    async def apredict(self, request: ForecastRequest) -> ForecastResult:
+        # Blocking models run on the default executor so the event loop stays free.
+        # asyncio is imported here since only concurrent runs reach this.
+        import asyncio  # noqa: PLC0415
+
+        return await asyncio.to_thread(self.predict, request)
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.paths import default_cache_dir
+
+if TYPE_CHECKING:
+    import sqlite3
+
+CACHE_MODES = ("off", "read", "readwrite")
+
+# Bump when the key derivation or payload layout changes.
+_CACHE_VERSION = b"cfevals-forecast-cache/1"
+
+# Hits whose access times are written back in one transaction.
+_TOUCH_BATCH = 256
+
+
+def default_forecast_cache_path() -> str:
+    return os.path.join(default_cache_dir(), "forecasts.sqlite")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    def copy(self) -> "CacheStats":
+        return CacheStats(**self.as_dict())
+
+    def since(self, before: "CacheStats") -> dict[str, int]:
+        return {f.name: getattr(self, f.name) - getattr(before, f.name) for f in fields(self)}
+
+    def as_dict(self) -> dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def merge(self, other: "CacheStats") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+@dataclass
+class ForecastCache:
+    path: str = field(default_factory=default_forecast_cache_path)
+    max_bytes: int | None = None
+    # Opens the database read-only (e.g. a shared cache): no schema setup, no access
+    # times, and a missing file is an empty cache.
+    read_only: bool = False
+
+    def __post_init__(self) -> None:
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Hit keys and access times not yet written; flushed in batches, on put and on close.
+        self._touched: dict[str, float] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections do not survive pickling; worker processes reopen lazily.
+        return {"path": self.path, "max_bytes": self.max_bytes, "read_only": self.read_only}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self.max_bytes = state["max_bytes"]
+        self.read_only = state.get("read_only", False)
+        self.__post_init__()
+
+    def get(self, key: str, *, touch: bool = True) -> ForecastResult | None:
+        # `touch` records the hit for LRU eviction; access times are written in batches
+        # rather than as one transaction per hit.
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                self.stats.misses += 1
+                return None
+            row = conn.execute("SELECT payload FROM forecasts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            if touch and not self.read_only:
+                self._touched[key] = time.time()
+                if len(self._touched) >= _TOUCH_BATCH:
+                    self._flush_touched(conn)
+                    conn.commit()
+        return _decode_result(row[0])
+
+    def put(self, key: str, result: ForecastResult) -> None:
+        if self.read_only:
+            raise RuntimeError(f"forecast cache {self.path} is read-only")
+        payload = _encode_result(result)
+        with self._lock:
+            conn = self._connect()
+            assert conn is not None
+            # Other models and worker processes write the same file: the write lock is
+            # taken up front so the stored byte total stays in step with the rows.
+            conn.execute("BEGIN IMMEDIATE")
+            with conn:
+                # Pending access times go first so eviction sees the latest hits.
+                self._flush_touched(conn)
+                previous = conn.execute("SELECT size FROM forecasts WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO forecasts (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload), time.time()),
+                )
+                conn.execute(
+                    "UPDATE forecast_bytes SET total = total + ?",
+                    (len(payload) - (previous[0] if previous else 0),),
+                )
+                self.stats.writes += 1
+                self._evict(conn)
+
+    def flush(self) -> None:
+        # Writes pending access times; the runner calls this when a run ends.
+        with self._lock:
+            if self._conn is not None and self._touched:
+                with self._conn:
+                    self._flush_touched(self._conn)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        if self._touched:
+            conn.executemany(
+                "UPDATE forecasts SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        # Like numpy in request_digest, sqlite3 loads only once a cache is opened.
+        import sqlite3  # noqa: PLC0415
+
+        if self._conn is None and self.read_only:
+            if not os.path.exists(self.path):
+                return None
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS forecasts (key TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS forecasts_last_access ON forecasts (last_access)")
+            # Total payload size, kept next to the rows so eviction does not sum the table.
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS forecast_bytes (id INTEGER PRIMARY KEY CHECK (id = 0), "
+                "total INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO forecast_bytes SELECT 0, COALESCE(SUM(size), 0) FROM forecasts"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Runs inside put's transaction, so the total reflects every writer's rows.
+        if self.max_bytes is None:
+            return
+        excess = conn.execute("SELECT total FROM forecast_bytes").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        # Walks the last_access index only as far as needed.
+        keys: list[tuple[str]] = []
+        freed = 0
+        for key, size in conn.execute("SELECT key, size FROM forecasts ORDER BY last_access ASC"):
+            keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM forecasts WHERE key = ?", keys)
+        conn.execute("UPDATE forecast_bytes SET total = total - ?", (freed,))
+        self.stats.evictions += len(keys)
+
+
+@dataclass
+class CachedModel(Model):
+    model: Model
+    spec: dict[str, Any]
+    cache: ForecastCache = field(default_factory=ForecastCache)
+    mode: str = "readwrite"
+
+    def __post_init__(self) -> None:
+        if self.mode not in CACHE_MODES:
+            raise ValueError(f"cache mode must be one of {CACHE_MODES}, got {self.mode!r}")
+        self.accepts_arrays = self.model.accepts_arrays
+        self.supports_update = self.model.supports_update
+        self._spec_digest = hashlib.sha256(_canonical_json(self.spec)).digest()
+        self._fit_digest = b""
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def reset(self) -> None:
+        self._fit_digest = b""
+        self.model.reset()
+
+    def fit(self, request: ForecastRequest) -> None:
+        # Predictions of a fitted model depend on what it was fitted on.
+        self._fit_digest = request_digest(request)
+        self.model.fit(request)
+
+    def update(self, request: ForecastRequest) -> None:
+        # Chain the digest so the key still identifies every point the model has seen.
+        self._fit_digest = hashlib.sha256(self._fit_digest + request_digest(request)).digest()
+        self.model.update(request)
+
+    def clone(self) -> "CachedModel":
+        clone = CachedModel(model=self.model.clone(), spec=self.spec, cache=self.cache, mode=self.mode)
+        clone._fit_digest = self._fit_digest
+        return clone
+
+    def cache_key(self, request: ForecastRequest) -> str:
+        digest = hashlib.sha256(_CACHE_VERSION)
+        digest.update(self._spec_digest)
+        digest.update(self._fit_digest)
+        digest.update(request_digest(request))
+        return digest.hexdigest()
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        return self.predict_batch([request])[0]
+
+    def predict_batch(self, requests: list[ForecastRequest]) -> list[ForecastResult]:
+        keys = [self.cache_key(request) for request in requests]
+        results: list[ForecastResult | None] = [self._lookup(key) for key in keys]
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            computed = self.model.predict_batch([requests[idx] for idx in missing])
+            for idx, result in zip(missing, computed):
+                self._store(keys[idx], result)
+                results[idx] = result
+        return results
+
+    async def apredict(self, request: ForecastRequest) -> ForecastResult:
+        key = self.cache_key(request)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        result = await self.model.apredict(request)
+        self._store(key, result)
+        return result
+
+    def _lookup(self, key: str) -> ForecastResult | None:
+        if self.mode == "off":
+            return None
+        # Read mode never writes, not even access times.
+        return self.cache.get(key, touch=self.mode == "readwrite")
+
+    def _store(self, key: str, result: ForecastResult) -> None:
+        if self.mode == "readwrite":
+            self.cache.put(key, result)
+
+
+def request_digest(request: ForecastRequest) -> bytes:
+    # numpy is imported on first use so the CLI can read CACHE_MODES without it.
+    import numpy as np  # noqa: PLC0415
+
+    digest = hashlib.sha256()
+    _update(digest, _float_bytes(request.history))
+    _update(digest, str(int(request.horizon)).encode())
+    if request.timestamps is None:
+        _update(digest, b"")
+    else:
+        timestamps = np.asarray(request.timestamps, dtype="datetime64[us]")
+        _update(digest, timestamps.view(np.int64).tobytes())
+    features = request.features or {}
+    _update(digest, str(len(features)).encode())
+    for key in sorted(features):
+        _update(digest, key.encode())
+        _update(digest, _float_bytes(features[key]))
+    _update(digest, (request.context_text or "").encode())
+    _update(digest, _canonical_json(request.metadata))
+    return digest.digest()
+
+
+def _update(digest: Any, part: bytes) -> None:
+    # Length-prefix every part so adjacent fields cannot run into each other.
+    digest.update(len(part).to_bytes(8, "little"))
+    digest.update(part)
+
+
+def _float_bytes(values: Any) -> bytes:
+    import numpy as np  # noqa: PLC0415
+
+    return np.ascontiguousarray(values, dtype=np.float64).tobytes()
+
+
+def _canonical_json(payload: Any) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_json_default).encode()
+
+
+def _json_default(value: Any) -> Any:
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_result(result: ForecastResult) -> bytes:
+    payload = {
+        "point_forecast": result.point_forecast,
+        "samples": result.samples,
+        "quantiles": result.quantiles,
+        "metadata": result.metadata,
+    }
+    return json.dumps(payload, separators=(",", ":"), default=_json_default).encode()
+
+
+def _decode_result(payload: bytes) -> ForecastResult:
+    data = json.loads(payload)
+    return ForecastResult(
+        point_forecast=data["point_forecast"],
+        samples=data["samples"],
+        quantiles=data["quantiles"],
+        metadata=data["metadata"],
+    )
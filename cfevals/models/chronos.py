@@ -12,6 +12,8 @@ from cfevals.models.base import ForecastRequest, ForecastResult, Model
 class ChronosModel(Model):
     model_name: str = "amazon/chronos-t5-small"
 
+    accepts_arrays = True
+
     def __post_init__(self) -> None:
         if importlib.util.find_spec("chronos") is None:
             raise RuntimeError("chronos-forecasting is not installed")
@@ -19,9 +21,36 @@ class ChronosModel(Model):
 
         self.pipeline = ChronosPipeline.from_pretrained(self.model_name)
 
+    def clone(self) -> "ChronosModel":
+        # Inference-only and never fitted, so threads can share the loaded pipeline.
+        return self
+
     def predict(self, request: ForecastRequest) -> ForecastResult:
-        history = np.asarray(request.history, dtype=float)
-        forecast = self.pipeline.predict(history, prediction_length=request.horizon)
-        values = forecast.mean(axis=0).tolist()
-        samples = forecast.tolist()
-        return ForecastResult(point_forecast=[float(v) for v in values], samples=samples)
+        return self.predict_batch([request])[0]
+
+    def predict_batch(self, requests: list[ForecastRequest]) -> list[ForecastResult]:
+        import torch  # noqa: PLC0415
+
+        results: list[ForecastResult | None] = [None] * len(requests)
+        # The pipeline takes a single prediction_length per call, so batch by horizon.
+        by_horizon: dict[int, list[int]] = {}
+        for idx, request in enumerate(requests):
+            by_horizon.setdefault(request.horizon, []).append(idx)
+        for horizon, indices in by_horizon.items():
+            context = torch.as_tensor(left_pad([requests[idx].history for idx in indices]))
+            forecast = self.pipeline.predict(context, prediction_length=horizon)
+            forecast = np.asarray(forecast, dtype=float)
+            for idx, samples in zip(indices, forecast):
+                results[idx] = ForecastResult(point_forecast=samples.mean(axis=0), samples=samples)
+        return results
+
+
+def left_pad(histories: list, pad_value: float = np.nan) -> np.ndarray:
+    # Chronos treats NaN as missing, so ragged histories align on their most
+    # recent observation.
+    width = max((len(history) for history in histories), default=0)
+    batch = np.full((len(histories), width), pad_value, dtype=np.float32)
+    for row, history in enumerate(histories):
+        if len(history):
+            batch[row, width - len(history) :] = np.asarray(history, dtype=np.float32)
+    return batch
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import os
+import random
 import re
+import time
 from dataclasses import dataclass
 from typing import Any
 
 from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.models.ratelimit import AsyncRateLimiter
+
+# Rough prompt-size estimate used for token rate limiting before usage is known.
+_CHARS_PER_TOKEN = 4
 
 
 def parse_json_response(text: str) -> dict[str, Any]:
@@ -24,6 +31,13 @@ def parse_json_response(text: str) -> dict[str, Any]:
 class OpenAIModel(Model):
     model: str = "gpt-4o-mini"
     max_retries: int = 2
+    base_url: str | None = None
+    api_retries: int = 5
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    completion_tokens_estimate: int = 512
 
     def __post_init__(self) -> None:
         if importlib.util.find_spec("openai") is None:
@@ -32,39 +46,125 @@ class OpenAIModel(Model):
             raise RuntimeError("OPENAI_API_KEY is not set")
         from openai import OpenAI  # noqa: PLC0415
 
-        self.client = OpenAI()
+        # Retries are handled here with jittered backoff, not by the client.
+        self.client = OpenAI(base_url=self.base_url, max_retries=0)
+        self._async_client: Any = None
+        self._limiter = AsyncRateLimiter(self.requests_per_minute, self.tokens_per_minute)
+
+    def clone(self) -> "OpenAIModel":
+        # Stateless between calls; sharing keeps one connection pool and rate limiter.
+        return self
 
     def predict(self, request: ForecastRequest) -> ForecastResult:
         messages = _build_messages(request)
         last_error = None
         for _ in range(self.max_retries + 1):
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0,
-            )
+            response = self._create(messages)
             content = response.choices[0].message.content or ""
             try:
-                payload = parse_json_response(content)
-                point = payload.get("point_forecast") or payload.get("point")
-                samples = payload.get("samples")
-                quantiles = payload.get("quantiles")
-                if point is None:
-                    raise ValueError("missing point_forecast in response")
-                return ForecastResult(
-                    point_forecast=[float(v) for v in point],
-                    samples=samples,
-                    quantiles=quantiles,
-                    metadata={"raw": payload},
-                )
+                return _parse_result(content)
+            except Exception as exc:  # noqa: BLE001
+                last_error = exc
+                messages = messages + _repair_messages(content)
+        raise RuntimeError(f"LLM response parsing failed: {last_error}")
+
+    async def apredict(self, request: ForecastRequest) -> ForecastResult:
+        messages = _build_messages(request)
+        last_error = None
+        for _ in range(self.max_retries + 1):
+            response = await self._acreate(messages)
+            content = response.choices[0].message.content or ""
+            try:
+                return _parse_result(content)
             except Exception as exc:  # noqa: BLE001
                 last_error = exc
-                messages = messages + [
-                    {"role": "assistant", "content": content},
-                    {"role": "user", "content": "Return ONLY valid JSON with point_forecast."},
-                ]
+                messages = messages + _repair_messages(content)
         raise RuntimeError(f"LLM response parsing failed: {last_error}")
 
+    def _create(self, messages: list[dict[str, str]]) -> Any:
+        for attempt in range(self.api_retries + 1):
+            try:
+                return self.client.chat.completions.create(model=self.model, messages=messages, temperature=0)
+            except Exception as exc:  # noqa: BLE001
+                if attempt >= self.api_retries or not _is_retryable(exc):
+                    raise
+                time.sleep(self._backoff(attempt, exc))
+        raise AssertionError("unreachable")
+
+    async def _acreate(self, messages: list[dict[str, str]]) -> Any:
+        if self._async_client is None:
+            from openai import AsyncOpenAI  # noqa: PLC0415
+
+            self._async_client = AsyncOpenAI(base_url=self.base_url, max_retries=0)
+        prompt_chars = sum(len(m["content"]) for m in messages)
+        estimate = prompt_chars // _CHARS_PER_TOKEN + self.completion_tokens_estimate
+        for attempt in range(self.api_retries + 1):
+            await self._limiter.acquire(estimate)
+            try:
+                response = await self._async_client.chat.completions.create(
+                    model=self.model, messages=messages, temperature=0
+                )
+            except Exception as exc:  # noqa: BLE001
+                if attempt >= self.api_retries or not _is_retryable(exc):
+                    raise
+                await asyncio.sleep(self._backoff(attempt, exc))
+                continue
+            usage = getattr(response, "usage", None)
+            if usage is not None and getattr(usage, "total_tokens", None):
+                self._limiter.settle(estimate, usage.total_tokens)
+            return response
+        raise AssertionError("unreachable")
+
+    def _backoff(self, attempt: int, exc: Exception) -> float:
+        retry_after = _retry_after(exc)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # Full jitter keeps concurrent callers from retrying in lockstep.
+        return random.uniform(0.0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+def _parse_result(content: str) -> ForecastResult:
+    payload = parse_json_response(content)
+    point = payload.get("point_forecast") or payload.get("point")
+    samples = payload.get("samples")
+    quantiles = payload.get("quantiles")
+    if point is None:
+        raise ValueError("missing point_forecast in response")
+    return ForecastResult(
+        point_forecast=[float(v) for v in point],
+        samples=samples,
+        quantiles=quantiles,
+        metadata={"raw": payload},
+    )
+
+
+def _repair_messages(content: str) -> list[dict[str, str]]:
+    return [
+        {"role": "assistant", "content": content},
+        {"role": "user", "content": "Return ONLY valid JSON with point_forecast."},
+    ]
+
+
+def _is_retryable(exc: Exception) -> bool:
+    from openai import APIConnectionError, APIStatusError  # noqa: PLC0415
+
+    if isinstance(exc, APIConnectionError):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return False
+
+
+def _retry_after(exc: Exception) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
 
 def _build_messages(request: ForecastRequest) -> list[dict[str, str]]:
     lines = [
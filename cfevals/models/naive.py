@@ -9,8 +9,10 @@ from cfevals.models.base import ForecastRequest, ForecastResult, Model
 class LastValueModel(Model):
     fallback_value: float = 0.0
 
+    accepts_arrays = True
+
     def predict(self, request: ForecastRequest) -> ForecastResult:
-        if request.history:
+        if len(request.history):
             value = float(request.history[-1])
         else:
             value = self.fallback_value
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Bucket:
+    per_minute: float
+    level: float = field(init=False)
+    updated: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.level = self.per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        rate = self.per_minute / 60.0
+        self.level = min(self.per_minute, self.level + (now - self.updated) * rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        # Requests larger than the bucket wait for a full bucket instead of forever.
+        needed = min(amount, self.per_minute) - self.level
+        return max(needed, 0.0) * 60.0 / self.per_minute
+
+
+@dataclass
+class AsyncRateLimiter:
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+    def __post_init__(self) -> None:
+        self._requests = _Bucket(self.requests_per_minute) if self.requests_per_minute else None
+        self._tokens = _Bucket(self.tokens_per_minute) if self.tokens_per_minute else None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                delay = 0.0
+                if self._requests is not None:
+                    self._requests.refill(now)
+                    delay = max(delay, self._requests.wait_time(1))
+                if self._tokens is not None:
+                    self._tokens.refill(now)
+                    delay = max(delay, self._tokens.wait_time(tokens))
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            if self._requests is not None:
+                self._requests.level -= 1
+            if self._tokens is not None:
+                self._tokens.level -= tokens
+
+    def settle(self, estimated: int, actual: int) -> None:
+        # Charge the difference once the API reports real usage; the bucket may go
+        # negative, which delays the next acquire accordingly.
+        if self._tokens is not None:
+            self._tokens.level -= actual - estimated
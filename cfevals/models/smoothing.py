@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from cfevals.benchmarks.base import to_list
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+
+
+@dataclass
+class ExponentialSmoothingModel(Model):
+    # Simple exponential smoothing, or Holt's linear trend when beta is set. The
+    # smoothing recursion consumes points in order, so update() with the appended
+    # points leaves exactly the state a full fit on the whole history would.
+    alpha: float = 0.3
+    beta: float | None = None
+    fallback_value: float = 0.0
+
+    accepts_arrays = True
+    supports_update = True
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {self.alpha}")
+        if self.beta is not None and not 0.0 < self.beta <= 1.0:
+            raise ValueError(f"beta must be in (0, 1] or None, got {self.beta}")
+        self.reset()
+
+    def reset(self) -> None:
+        self._level: float | None = None
+        self._trend = 0.0
+        self._observed = 0
+
+    def fit(self, request: ForecastRequest) -> None:
+        self.reset()
+        self.update(request)
+
+    def update(self, request: ForecastRequest) -> None:
+        self._level, self._trend, self._observed = _smooth(
+            to_list(request.history), self._level, self._trend, self._observed, self.alpha, self.beta
+        )
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        level, trend = self._level, self._trend
+        if level is None:
+            # Never fitted: smooth the request's own history without keeping the state.
+            level, trend, _ = _smooth(to_list(request.history), None, 0.0, 0, self.alpha, self.beta)
+        if level is None:
+            return ForecastResult(point_forecast=[self.fallback_value] * request.horizon)
+        return ForecastResult(point_forecast=[level + step * trend for step in range(1, request.horizon + 1)])
+
+
+def _smooth(
+    values: list[float],
+    level: float | None,
+    trend: float,
+    observed: int,
+    alpha: float,
+    beta: float | None,
+) -> tuple[float | None, float, int]:
+    for value in values:
+        value = float(value)
+        if math.isnan(value):
+            continue
+        observed += 1
+        if level is None:
+            level = value
+            continue
+        if beta is not None and observed == 2:
+            trend = value - level
+        previous = level
+        level = alpha * value + (1.0 - alpha) * (level + trend)
+        if beta is not None:
+            trend = beta * (level - previous) + (1.0 - beta) * trend
+    return level, trend, observed
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import uuid
+from typing import Callable
+
+# Rounds of moving a stale target aside before giving up on a contended directory.
+_REPLACE_ATTEMPTS = 5
+
+
+def default_cache_dir() -> str:
+    return os.environ.get("CFEVALS_CACHE", os.path.expanduser("~/.cfevals/cache"))
+
+
+def replace_directory(path: str, write: Callable[[str], None], is_valid: Callable[[str], bool]) -> None:
+    # Builds a cache directory with write(tmp) in a private sibling and renames it
+    # into place, so readers never see a partial directory. Concurrent writers are
+    # expected: when the target already exists and is_valid accepts it, the other
+    # writer won and its directory is kept; a stale target is renamed aside before
+    # removal, so nothing is ever deleted under a writer's rename.
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    try:
+        write(tmp_path)
+        for _ in range(_REPLACE_ATTEMPTS):
+            try:
+                os.rename(tmp_path, path)
+                return
+            except OSError:
+                if not os.path.lexists(path):
+                    raise
+            if is_valid(path):
+                return
+            stale = f"{path}.stale-{uuid.uuid4().hex}"
+            try:
+                os.rename(path, stale)
+            except FileNotFoundError:
+                continue
+            if os.path.isdir(stale):
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                os.remove(stale)
+        raise RuntimeError(f"could not replace {path}: it keeps being rewritten by other processes")
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from cfevals.benchmarks.synthetic import SyntheticScenarioBenchmark, SyntheticTimeSeriesBenchmark
+from cfevals.engine import Runner, WalkForwardConfig
+from cfevals.metrics.probabilistic import crps_matrix, rcrps_matrix
+from cfevals.metrics.significance import BootstrapConfig, bootstrap_interval
+from cfevals.models.naive import LastValueModel
+from cfevals.record import LocalRecorder
+
+PERF_FORMAT_VERSION = 1
+
+# Forecast sample matrices are drawn from a fixed pool so large scenario counts
+# do not need [scenarios, horizon, samples] in memory.
+_SAMPLE_POOL = 16
+
+# Resamples per bootstrap op, over one score per walk-forward window.
+_BOOTSTRAP_RESAMPLES = 10_000
+
+
+@dataclass(frozen=True)
+class PerfSizes:
+    points: int = 1_000
+    # Walk-forward windows for the end-to-end run, and as_of queries.
+    windows: int = 1_000
+    scenarios: int = 10
+    samples: int = 100
+    horizon: int = 12
+    events: int = 10_000
+
+
+PRESETS = {
+    "small": PerfSizes(),
+    "medium": PerfSizes(points=100_000, windows=10_000, scenarios=10_000, events=100_000),
+    "large": PerfSizes(points=1_000_000, windows=100_000, scenarios=100_000, samples=1_000, events=1_000_000),
+}
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    name: str
+    ops: int
+    seconds: list[float]
+
+    @property
+    def best(self) -> float:
+        return min(self.seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "ops": self.ops,
+            "seconds": self.seconds,
+            "best": self.best,
+            "median": statistics.median(self.seconds),
+            "ops_per_second": self.ops / self.best if self.best > 0 else None,
+        }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_seconds_per_op: float
+    seconds_per_op: float
+    ratio: float
+    regressed: bool
+
+
+def run_suite(
+    sizes: PerfSizes,
+    *,
+    repeat: int = 3,
+    cases: list[str] | None = None,
+) -> dict[str, Any]:
+    selected = cases or list(CASES)
+    unknown = sorted(set(selected) - set(CASES))
+    if unknown:
+        raise ValueError(f"unknown perf cases: {unknown}")
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="cfevals-perf-") as workdir:
+        for name in selected:
+            # Setup (data generation) is excluded; only the returned callable is timed.
+            work = CASES[name](sizes, Path(workdir) / name)
+            seconds = []
+            ops = 0
+            for _ in range(repeat):
+                started = time.perf_counter()
+                ops = work()
+                seconds.append(time.perf_counter() - started)
+            results[name] = CaseResult(name=name, ops=ops, seconds=seconds).as_dict()
+    return {
+        "format_version": PERF_FORMAT_VERSION,
+        "sizes": asdict(sizes),
+        "repeat": repeat,
+        "environment": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "cases": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], *, tolerance: float = 0.25
+) -> list[Comparison]:
+    # Per-op time of the best repeat, the least noisy of the repeats.
+    comparisons = []
+    for name, case in current["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+        before = reference["best"] / max(reference["ops"], 1)
+        after = case["best"] / max(case["ops"], 1)
+        ratio = after / before if before > 0 else float("inf")
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline_seconds_per_op=before,
+                seconds_per_op=after,
+                ratio=ratio,
+                regressed=ratio > 1.0 + tolerance,
+            )
+        )
+    return comparisons
+
+
+def resolve_sizes(preset: str, overrides: dict[str, int | None]) -> PerfSizes:
+    if preset not in PRESETS:
+        raise ValueError(f"preset must be one of {sorted(PRESETS)}, got {preset!r}")
+    return replace(PRESETS[preset], **{k: v for k, v in overrides.items() if v is not None})
+
+
+def _walk_forward_windows(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    dataset = SyntheticTimeSeriesBenchmark(num_points=sizes.points).load()
+
+    def work() -> int:
+        windows = dataset.walk_forward_windows(horizon=sizes.horizon, step=1, min_train_size=sizes.horizon)
+        return sum(1 for _ in windows)
+
+    return work
+
+
+def _as_of(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    dataset = SyntheticTimeSeriesBenchmark(num_points=sizes.points).load()
+    positions = np.linspace(0, sizes.points - 1, num=sizes.windows).astype(int)
+    queries = [timestamp.item() for timestamp in dataset.timestamps[positions]]
+
+    def work() -> int:
+        for timestamp in queries:
+            dataset.as_of(timestamp)
+        return len(queries)
+
+    return work
+
+
+def _score_case(sizes: PerfSizes, *, roi: bool) -> Callable[[], int]:
+    rng = np.random.default_rng(0)
+    pool = rng.normal(size=(_SAMPLE_POOL, sizes.horizon, sizes.samples))
+    targets = rng.normal(size=(_SAMPLE_POOL, sizes.horizon))
+
+    def work() -> int:
+        for idx in range(sizes.scenarios):
+            slot = idx % _SAMPLE_POOL
+            if roi:
+                rcrps_matrix(pool[slot], targets[slot], roi=(-1.0, 1.0))
+            else:
+                crps_matrix(pool[slot], targets[slot])
+        return sizes.scenarios
+
+    return work
+
+
+def _crps(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    return _score_case(sizes, roi=False)
+
+
+def _rcrps(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    return _score_case(sizes, roi=True)
+
+
+def _bootstrap(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    scores = np.random.default_rng(0).gamma(2.0, size=sizes.windows)
+    config = BootstrapConfig(resamples=_BOOTSTRAP_RESAMPLES)
+
+    def work() -> int:
+        bootstrap_interval(scores, config)
+        return 1
+
+    return work
+
+
+def _recorder_case(sizes: PerfSizes, workdir: Path, *, flush_every: int | None) -> Callable[[], int]:
+    workdir.mkdir(parents=True, exist_ok=True)
+    path = workdir / "events.jsonl"
+    payload = {"as_of": "2020-01-01", "future": [1.0] * sizes.horizon, "forecast": [1.0] * sizes.horizon}
+
+    def work() -> int:
+        path.unlink(missing_ok=True)
+        recorder = LocalRecorder(str(path), flush_every=flush_every)
+        for idx in range(sizes.events):
+            recorder.record_event("walk_forward_window", payload, sample_id=str(idx))
+        recorder.close()
+        return sizes.events
+
+    return work
+
+
+def _recorder_flush_each(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    return _recorder_case(sizes, workdir, flush_every=1)
+
+
+def _recorder_buffered(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    return _recorder_case(sizes, workdir, flush_every=None)
+
+
+def _runner_time_series(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    benchmark = SyntheticTimeSeriesBenchmark(num_points=sizes.points)
+    # The windows are taken from the end of the series, with the longest histories.
+    min_train_size = max(1, sizes.points - sizes.horizon - sizes.windows + 1)
+    config = WalkForwardConfig(
+        horizon=sizes.horizon, min_train_size=min_train_size, max_windows=sizes.windows, batch_size=64
+    )
+
+    def work() -> int:
+        output = Runner().run(
+            benchmark_id="perf.time_series",
+            benchmark=benchmark,
+            model_id="naive",
+            model=LastValueModel(),
+            output_dir=workdir,
+            backtest_config=config,
+        )
+        return output.num_samples
+
+    return work
+
+
+def _runner_scenario(sizes: PerfSizes, workdir: Path) -> Callable[[], int]:
+    benchmark = SyntheticScenarioBenchmark(num_samples=sizes.scenarios, horizon=sizes.horizon)
+
+    def work() -> int:
+        output = Runner().run(
+            benchmark_id="perf.scenario",
+            benchmark=benchmark,
+            model_id="naive",
+            model=LastValueModel(),
+            output_dir=workdir,
+        )
+        return output.num_samples
+
+    return work
+
+
+CASES: dict[str, Callable[[PerfSizes, Path], Callable[[], int]]] = {
+    "walk_forward_windows": _walk_forward_windows,
+    "as_of": _as_of,
+    "crps": _crps,
+    "rcrps": _rcrps,
+    "bootstrap": _bootstrap,
+    "recorder_flush_each": _recorder_flush_each,
+    "recorder_buffered": _recorder_buffered,
+    "runner_time_series": _runner_time_series,
+    "runner_scenario": _runner_scenario,
+}
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import gzip
+import importlib.util
+import io
 import json
 import os
+import queue
 import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+COMPRESSIONS = ("gzip", "zstd")
+_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_FLUSH = object()
 
 
 class RecorderBase:
@@ -30,29 +40,202 @@ class NullRecorder(RecorderBase):
 @dataclass
 class LocalRecorder(RecorderBase):
     path: str
+    # Events per flush; None defers flushing to flush_interval or close().
+    flush_every: int | None = 1
+    flush_interval: float | None = None
+    background: bool = False
+    compression: str | None = None
 
     def __post_init__(self) -> None:
         super().__init__()
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        self._fh = open(self.path, "a", encoding="utf-8")
+        if self.compression is not None and self.compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS} or None, got {self.compression!r}")
+        if self.flush_every is not None and self.flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1 or None, got {self.flush_every}")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._fh = _open_events(self.path, "a", self.compression)
         self._lock = threading.Lock()
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
+        self._ts_second = -1
+        self._ts_prefix = ""
+        self._queue: queue.Queue[Any] | None = None
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        if self.background:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._drain, name="cfevals-recorder", daemon=True)
+            self._writer.start()
 
     def record_event(self, event_type: str, payload: dict[str, Any], *, sample_id: str | None = None) -> None:
-        event = {
-            "event_type": event_type,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "sample_id": sample_id or self._sample_id,
-            "payload": payload,
-        }
-        line = json.dumps(event)
         with self._lock:
-            self._fh.write(line + "\n")
-            self._fh.flush()
+            event = {
+                "event_type": event_type,
+                "timestamp": self._timestamp(),
+                "sample_id": sample_id or self._sample_id,
+                "payload": payload,
+            }
+            line = json.dumps(event, default=json_default) + "\n"
+            if self._queue is not None:
+                self._queue.put(line)
+                return
+            self._buffer.append(line)
+            if self._flush_due():
+                self._write_buffer()
+
+    def flush(self) -> None:
+        if self._queue is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+            return
+        with self._lock:
+            self._write_buffer()
 
     def close(self) -> None:
         with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._queue is not None and self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+        with self._lock:
+            self._write_buffer()
             self._fh.close()
 
+    def _flush_due(self) -> bool:
+        if self.flush_every is not None and len(self._buffer) >= self.flush_every:
+            return True
+        if self.flush_interval is not None:
+            return time.monotonic() - self._last_flush >= self.flush_interval
+        return False
+
+    def _write_buffer(self) -> None:
+        if not self._buffer:
+            return
+        self._fh.write("".join(self._buffer))
+        self._fh.flush()
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def _drain(self) -> None:
+        # The writer thread owns the buffer and file handle until close(), and
+        # writes lines in the order they were queued.
+        assert self._queue is not None
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._write_buffer()
+                continue
+            try:
+                if item is None:
+                    self._write_buffer()
+                    return
+                if item is _FLUSH:
+                    self._write_buffer()
+                    continue
+                self._buffer.append(item)
+                if self._flush_due():
+                    self._write_buffer()
+            finally:
+                self._queue.task_done()
+
+    def _timestamp(self) -> str:
+        # Formatting a datetime per event is measurable on cheap models; only the
+        # sub-second part changes between most consecutive events.
+        now = time.time()
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{self._ts_prefix}.{int((now - second) * 1_000_000):06d}Z"
+
+
+@dataclass(frozen=True)
+class RecorderConfig:
+    flush_every: int | None = 1
+    flush_interval: float | None = None
+    background: bool = False
+    compression: str | None = None
+
+    def events_path(self, output_dir: Path) -> Path:
+        return output_dir / ("events.jsonl" + _SUFFIXES.get(self.compression or "", ""))
+
+    def open(self, output_dir: Path) -> LocalRecorder:
+        return LocalRecorder(
+            str(self.events_path(output_dir)),
+            flush_every=self.flush_every,
+            flush_interval=self.flush_interval,
+            background=self.background,
+            compression=self.compression,
+        )
+
+
+def json_default(value: Any) -> Any:
+    # ndarray payloads and numpy scalars become plain lists and floats only here,
+    # when they are written out.
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iter_events(path: str | Path) -> Iterator[dict[str, Any]]:
+    with _open_events(str(path), "r", _compression_for(path)) as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def recover_events(path: str | Path) -> list[dict[str, Any]]:
+    # Reads the events a crashed run managed to write. Only the tail may be damaged:
+    # a partially written final line, or a compressed stream cut off mid-frame.
+    # Anything undecodable before that is corruption and raises.
+    events: list[dict[str, Any]] = []
+    partial: json.JSONDecodeError | None = None
+    try:
+        with _open_events(str(path), "r", _compression_for(path)) as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                if partial is not None:
+                    raise partial
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError as exc:
+                    partial = exc
+    except EOFError:
+        pass
+    return events
+
+
+def rewrite_events(path: str | Path, events: list[dict[str, Any]]) -> None:
+    tmp_path = f"{path}.tmp"
+    with _open_events(tmp_path, "w", _compression_for(path)) as fh:
+        fh.writelines(json.dumps(event, default=json_default) + "\n" for event in events)
+    os.replace(tmp_path, path)
+
+
+def _compression_for(path: str | Path) -> str | None:
+    return next((name for name, suffix in _SUFFIXES.items() if str(path).endswith(suffix)), None)
+
+
+def _open_events(path: str, mode: str, compression: str | None) -> IO[str]:
+    if compression is None:
+        return open(path, mode, encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if importlib.util.find_spec("zstandard") is None:
+        raise RuntimeError("zstandard is not installed")
+    import zstandard  # noqa: PLC0415
+
+    if mode == "r":
+        # Appends start new zstd frames, so read across frame boundaries.
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return zstandard.open(path, mode + "t", encoding="utf-8")
+
 
 _thread_local = threading.local()
 
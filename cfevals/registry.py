@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
 import os
 from dataclasses import dataclass, field
 from typing import Any
 
-import yaml
+from cfevals.paths import default_cache_dir
 
+# Bump when the index layout changes; older indexes are then rebuilt.
+REGISTRY_INDEX_VERSION = 1
 
 DEFAULT_REGISTRY_PATHS = [
     os.path.join(os.path.dirname(__file__), "registry"),
@@ -19,7 +22,8 @@ class Registry:
     models: dict[str, dict[str, Any]] = field(default_factory=dict)
     benchmark_sets: dict[str, dict[str, Any]] = field(default_factory=dict)
 
-    def load(self, paths: list[str] | None = None) -> "Registry":
+    def load(self, paths: list[str] | None = None, *, index_path: str | None = None) -> "Registry":
+        index = _RegistryIndex.read(index_path or default_registry_index_path())
         for base in paths or DEFAULT_REGISTRY_PATHS:
             if not os.path.isdir(base):
                 continue
@@ -29,10 +33,8 @@ class Registry:
                 for fname in files:
                     if not fname.endswith(".yaml"):
                         continue
-                    full_path = os.path.join(root, fname)
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        payload = yaml.safe_load(f) or {}
-                    self._register_payload(payload)
+                    self._register_payload(index.payload(os.path.join(root, fname)))
+        index.save()
         return self
 
     def _register_payload(self, payload: dict[str, Any] | list[Any]) -> None:
@@ -66,3 +68,69 @@ class Registry:
 
     def get_benchmark_set(self, set_id: str) -> dict[str, Any]:
         return self.benchmark_sets[set_id]
+
+
+def default_registry_index_path() -> str:
+    return os.path.join(default_cache_dir(), "registry_index.json")
+
+
+@dataclass
+class _RegistryIndex:
+    # Parsed registry files keyed by path and validated against (mtime_ns, size), so
+    # unchanged YAML is neither re-parsed nor is yaml imported on every CLI start.
+    path: str
+    entries: dict[str, dict[str, Any]]
+    seen: set[str] = field(default_factory=set)
+    dirty: bool = False
+
+    @classmethod
+    def read(cls, path: str) -> "_RegistryIndex":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return cls(path=path, entries={})
+        if not isinstance(payload, dict) or payload.get("version") != REGISTRY_INDEX_VERSION:
+            return cls(path=path, entries={})
+        return cls(path=path, entries=payload.get("files", {}))
+
+    def payload(self, file_path: str) -> Any:
+        self.seen.add(file_path)
+        stat = os.stat(file_path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        entry = self.entries.get(file_path)
+        if entry is not None and entry.get("signature") == signature:
+            return entry["payload"]
+        import yaml  # noqa: PLC0415
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            payload = yaml.safe_load(f) or {}
+        self.entries[file_path] = {"signature": signature, "payload": payload}
+        self.dirty = True
+        return payload
+
+    def save(self) -> None:
+        # Only files from this load are kept, which also drops deleted ones. Other
+        # registry path lists still share the index; they just re-parse on a switch.
+        if not self.dirty and self.seen == set(self.entries):
+            return
+        files = {path: self.entries[path] for path in sorted(self.seen) if _round_trips(self.entries[path])}
+        text = json.dumps({"version": REGISTRY_INDEX_VERSION, "files": files})
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # A read-only cache directory only costs the parse.
+            return
+
+
+def _round_trips(entry: dict[str, Any]) -> bool:
+    # YAML that JSON cannot represent exactly (unquoted dates, non-string keys) is not
+    # indexed; those files are parsed on every load instead.
+    try:
+        return json.loads(json.dumps(entry)) == entry
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch):
+    # Keeps the registry index, forecast cache and dataset caches out of ~/.cfevals.
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path_factory.mktemp("cfevals-cache")))
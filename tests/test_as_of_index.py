@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+
+from cfevals.benchmarks.base import TimeSeriesDataset, TimeSeriesPoint
+
+
+def _points(n=12):
+    start = datetime(2022, 1, 1)
+    return [
+        TimeSeriesPoint(
+            timestamp=start + timedelta(days=i),
+            value=float(i),
+            features={"f": float(i) * 10} if i % 3 else None,
+        )
+        for i in range(n)
+    ]
+
+
+def _linear_as_of(points, timestamp):
+    history = [p for p in points if p.timestamp <= timestamp]
+    features = {}
+    for p in history:
+        for key, value in (p.features or {}).items():
+            features.setdefault(key, []).append(value)
+    return [p.value for p in history], features
+
+
+def test_as_of_matches_linear_scan_on_unsorted_input():
+    points = _points()
+    dataset = TimeSeriesDataset(points=list(reversed(points)))
+    for offset in (-1, 0, 4, 11, 20):
+        cutoff = datetime(2022, 1, 1) + timedelta(days=offset, hours=1)
+        history, features = _linear_as_of(points, cutoff)
+        as_of = dataset.as_of(cutoff)
+        assert as_of.history == history
+        assert as_of.features == features
+
+
+def test_as_of_many_matches_single_lookups():
+    dataset = TimeSeriesDataset(points=_points())
+    cutoffs = [datetime(2022, 1, 1) + timedelta(days=d) for d in (7, -3, 2, 7, 30)]
+    batched = dataset.as_of_many(cutoffs)
+    assert batched == [dataset.as_of(cutoff) for cutoff in cutoffs]
+
+    columnar = dataset.to_columnar()
+    for cutoff, expected in zip(cutoffs, columnar.as_of_many(cutoffs)):
+        assert expected.history.tolist() == dataset.as_of(cutoff).history
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from cfevals.benchmarks.base import ScenarioSample, TimeSeriesDataset, TimeSeriesPoint
+from cfevals.engine.backtest import WalkForwardBacktester, WalkForwardConfig
+from cfevals.engine.scenario import ScenarioConfig, ScenarioEvaluator
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.record import NullRecorder
+
+
+class RecordingModel(Model):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+        self.level = 0.0
+
+    def fit(self, request: ForecastRequest) -> None:
+        self.calls.append(("fit", len(request.history)))
+        self.level = float(request.history[-1])
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        return ForecastResult(point_forecast=[self.level] * request.horizon)
+
+    def predict_batch(self, requests: list[ForecastRequest]) -> list[ForecastResult]:
+        self.calls.append(("predict_batch", len(requests)))
+        return super().predict_batch(requests)
+
+
+def test_backtest_batches_do_not_span_refits():
+    start = datetime(2020, 1, 1)
+    points = [TimeSeriesPoint(timestamp=start + timedelta(days=i), value=float(i)) for i in range(30)]
+    dataset = TimeSeriesDataset(points=points)
+    config = WalkForwardConfig(horizon=2, min_train_size=5, retrain_frequency=5, batch_size=3)
+
+    model = RecordingModel()
+    batched = WalkForwardBacktester().run(dataset, model, config, recorder=NullRecorder())
+    unbatched = WalkForwardBacktester().run(
+        dataset, RecordingModel(), WalkForwardConfig(horizon=2, min_train_size=5, retrain_frequency=5),
+        recorder=NullRecorder(),
+    )
+    assert batched == unbatched
+    assert model.calls[:4] == [("fit", 5), ("predict_batch", 3), ("predict_batch", 2), ("fit", 10)]
+
+
+def test_scenario_evaluator_batches_samples():
+    samples = [
+        ScenarioSample(sample_id=f"s{i}", history=[1.0] * (i + 1), future=[1.0, 2.0]) for i in range(5)
+    ]
+    model = RecordingModel()
+    config = ScenarioConfig(batch_size=2)
+    results = ScenarioEvaluator().run(samples, model, recorder=NullRecorder(), config=config)
+    assert [r.sample_id for r in results] == [s.sample_id for s in samples]
+    assert model.calls == [("predict_batch", 2), ("predict_batch", 2), ("predict_batch", 1)]
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from cfevals.engine.runner import COMPLETION_MARKER, RunOutput
+from cfevals.engine.scheduler import Job, JobScheduler
+
+
+def fake_job(job: Job) -> RunOutput:
+    if job.benchmark_id == "broken":
+        raise ValueError("boom")
+    job.output_dir.mkdir(parents=True, exist_ok=True)
+    (job.output_dir / COMPLETION_MARKER).write_text("")
+    return RunOutput(benchmark_id=job.benchmark_id, model_id=job.model_id, metrics={"mae": 0.0}, num_samples=1)
+
+
+def _jobs(root: Path) -> list[Job]:
+    return [
+        Job(benchmark_id=benchmark_id, model_id=model_id, output_dir=root / benchmark_id / model_id)
+        for benchmark_id in ("a", "b", "broken")
+        for model_id in ("m1", "m2")
+    ]
+
+
+def test_scheduler_runs_jobs_in_pool_and_reports_failures(tmp_path):
+    progress = []
+    outcomes = JobScheduler(run_job=fake_job, workers=3).run(
+        _jobs(tmp_path), on_outcome=lambda outcome, state: progress.append(state)
+    )
+    assert [outcome.job for outcome in outcomes] == _jobs(tmp_path)
+    assert [outcome.status for outcome in outcomes] == ["done"] * 4 + ["failed"] * 2
+    assert "boom" in outcomes[-1].error
+    assert progress[-1].finished == 6 and progress[-1].failed == 2
+
+
+def test_resume_skips_only_completed_jobs(tmp_path):
+    jobs = _jobs(tmp_path)
+    # A half-finished run leaves a directory behind without the marker.
+    jobs[1].output_dir.mkdir(parents=True)
+    fake_job(jobs[0])
+    outcomes = JobScheduler(run_job=fake_job, resume=True).run(jobs)
+    assert [outcome.status for outcome in outcomes[:3]] == ["skipped", "done", "done"]
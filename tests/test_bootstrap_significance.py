@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import pytest
+
+from cfevals.benchmarks.synthetic import SyntheticTimeSeriesBenchmark
+from cfevals.engine import Runner, WalkForwardConfig
+from cfevals.metrics.significance import (
+    BootstrapConfig,
+    block_bootstrap_means,
+    bootstrap_interval,
+    diebold_mariano,
+)
+from cfevals.models.naive import LastValueModel
+from cfevals.models.smoothing import ExponentialSmoothingModel
+
+SCORES = np.random.default_rng(3).gamma(2.0, size=2_000)
+
+
+def test_block_bootstrap_is_seeded_and_brackets_the_mean():
+    first = block_bootstrap_means(SCORES, resamples=500, block_length=12, seed=1)
+    assert np.array_equal(first, block_bootstrap_means(SCORES, resamples=500, block_length=12, seed=1))
+    interval = bootstrap_interval(SCORES, BootstrapConfig(resamples=500))
+    assert interval["lower"] < SCORES.mean() < interval["upper"]
+    assert interval["block_length"] == 13  # ceil(2000 ** (1/3))
+    # A block as long as the series only rotates it, so every resample keeps the mean.
+    whole = block_bootstrap_means(SCORES, resamples=20, block_length=SCORES.size)
+    np.testing.assert_allclose(whole, SCORES.mean())
+
+
+def test_blocks_widen_intervals_for_dependent_scores():
+    # A slowly drifting series: iid resampling understates the variance of its mean.
+    drift = np.cumsum(np.random.default_rng(0).normal(size=5_000))
+    iid = bootstrap_interval(drift, BootstrapConfig(resamples=500, block_length=1))
+    blocks = bootstrap_interval(drift, BootstrapConfig(resamples=500, block_length=200))
+    assert blocks["upper"] - blocks["lower"] > 3 * (iid["upper"] - iid["lower"])
+
+
+def test_diebold_mariano_detects_a_consistent_difference():
+    noise = np.random.default_rng(5).normal(scale=0.1, size=500)
+    better = SCORES[:500] - 0.05 + noise
+    test = diebold_mariano(SCORES[:500], better)
+    assert test["mean_diff"] < 0 and test["statistic"] < 0 and test["p_value"] < 0.01
+    assert diebold_mariano(better, SCORES[:500])["statistic"] == pytest.approx(-test["statistic"])
+    same = diebold_mariano(SCORES[:500], SCORES[:500])
+    assert same["statistic"] == 0.0 and same["p_value"] == 1.0
+    with pytest.raises(ValueError):
+        diebold_mariano(SCORES[:3], SCORES[:4])
+
+
+def test_runner_reports_intervals_and_paired_tests(tmp_path):
+    outputs = Runner(bootstrap=BootstrapConfig(resamples=200)).run_many(
+        benchmark_id="bench",
+        benchmark=SyntheticTimeSeriesBenchmark(num_points=150),
+        models={"naive": LastValueModel(), "holt": ExponentialSmoothingModel(alpha=0.5, beta=0.1)},
+        output_root=tmp_path,
+        backtest_config=WalkForwardConfig(horizon=3, min_train_size=30),
+    )
+    payload = json.loads((tmp_path / "naive" / "results.json").read_text())
+    assert set(payload["intervals"]) == set(payload["metrics"])
+    for key, interval in payload["intervals"].items():
+        assert interval["mean"] == pytest.approx(payload["metrics"][key])
+        assert interval["lower"] <= interval["mean"] <= interval["upper"]
+    assert "95% CI" in (tmp_path / "naive" / "results.md").read_text()
+
+    comparison = json.loads((tmp_path / "comparison.json").read_text())
+    tests = comparison["tests"]["naive"]["holt"]
+    assert set(tests) == set(outputs["naive"].metrics)
+    assert tests["mae"]["mean_diff"] == pytest.approx(comparison["deltas"]["naive"]["holt"]["mae"])
+    assert tests["mae"]["count"] == outputs["naive"].num_samples
+    assert "Diebold-Mariano" in (tmp_path / "comparison.md").read_text()
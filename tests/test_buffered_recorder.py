@@ -0,0 +1,43 @@
+import pytest
+
+from cfevals.record import LocalRecorder, RecorderConfig, iter_events
+
+
+def test_deferred_flush_writes_on_close(tmp_path):
+    path = tmp_path / "events.jsonl"
+    recorder = LocalRecorder(str(path), flush_every=None)
+    for idx in range(5):
+        recorder.record_event("tick", {"idx": idx})
+    assert path.read_text() == ""
+    recorder.close()
+    assert [event["payload"]["idx"] for event in iter_events(path)] == list(range(5))
+
+
+def test_background_writer_preserves_order(tmp_path):
+    path = tmp_path / "events.jsonl"
+    recorder = LocalRecorder(str(path), flush_every=7, background=True)
+    for idx in range(100):
+        recorder.record_event("tick", {"idx": idx}, sample_id=str(idx))
+    recorder.flush()
+    assert len(list(iter_events(path))) == 100
+    recorder.close()
+    events = list(iter_events(path))
+    assert [event["payload"]["idx"] for event in events] == list(range(100))
+    assert all(event["timestamp"].endswith("Z") for event in events)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_compressed_events_round_trip(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    config = RecorderConfig(flush_every=2, compression=compression)
+    for run in range(2):
+        recorder = config.open(tmp_path)
+        for idx in range(3):
+            recorder.record_event("tick", {"run": run, "idx": idx})
+        recorder.close()
+    path = config.events_path(tmp_path)
+    assert path.name != "events.jsonl"
+    assert [(event["payload"]["run"], event["payload"]["idx"]) for event in iter_events(path)] == [
+        (run, idx) for run in range(2) for idx in range(3)
+    ]
@@ -0,0 +1,79 @@
+import numpy as np
+
+from cfevals.benchmarks.context_is_key import ContextIsKeyBenchmark
+from cfevals.engine.runner import Runner
+from cfevals.engine.scenario import ScenarioConfig
+from cfevals.models.naive import LastValueModel
+
+ROWS = [
+    {
+        "sample_id": "cik-a",
+        "history": [1.0, 2.0, 3.0],
+        "future": [4.0, 5.0],
+        "context": "rates rise — ünïcode",
+        "roi": [0.0, 1.0],
+    },
+    {"sample_id": "cik-b", "history": [10.0], "future": [9.0, 8.0, 7.0], "context": None, "roi": None},
+    {"sample_id": "cik-c", "history": [], "future": [1.0], "context": "", "roi": [2.0, 3.0]},
+]
+
+
+def _fake_dataset(monkeypatch, calls):
+    def fake_load_dataset(name, split, cache_dir=None, **kwargs):
+        calls.append(kwargs)
+        return list(ROWS)
+
+    monkeypatch.setattr("datasets.load_dataset", fake_load_dataset)
+
+
+def test_store_is_built_once_and_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    calls = []
+    _fake_dataset(monkeypatch, calls)
+    direct = ContextIsKeyBenchmark().load()
+
+    first = ContextIsKeyBenchmark(use_store=True).load()
+    second = ContextIsKeyBenchmark(use_store=True).load()
+    assert len(calls) == 2  # the direct load and the one-time conversion
+    assert len(second) == len(direct) == 3
+
+    for stored, expected in zip(second, direct):
+        assert stored.sample_id == expected.sample_id
+        assert stored.context_text == expected.context_text
+        assert stored.roi == expected.roi
+        assert stored.metadata == expected.metadata
+        np.testing.assert_array_equal(stored.history, expected.history)
+        np.testing.assert_array_equal(stored.future, expected.future)
+    assert isinstance(first[0].history, np.memmap)
+    assert not first[0].history.flags.writeable
+    assert first[0].metadata is first[1].metadata
+
+
+def test_store_slices_and_iterates(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    calls = []
+    _fake_dataset(monkeypatch, calls)
+    limited = ContextIsKeyBenchmark(use_store=True, max_samples=2).load()
+    assert [sample.sample_id for sample in limited] == ["cik-a", "cik-b"]
+    assert limited[-1].sample_id == "cik-b"
+    streamed = list(ContextIsKeyBenchmark(use_store=True).iter_samples())
+    assert [sample.sample_id for sample in streamed] == ["cik-a", "cik-b", "cik-c"]
+    assert calls == [{}]  # built from one full load, never streamed
+
+
+def test_store_scores_match_direct_load(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path / "cache"))
+    _fake_dataset(monkeypatch, [])
+    config = ScenarioConfig()
+    outputs = [
+        Runner().run(
+            benchmark_id="benchmark.cik.test",
+            benchmark=ContextIsKeyBenchmark(use_store=use_store, max_samples=2),
+            model_id="model.naive.last.v1",
+            model=LastValueModel(),
+            output_dir=tmp_path / f"out-{use_store}",
+            scenario_config=config,
+        )
+        for use_store in (False, True)
+    ]
+    assert outputs[0].metrics == outputs[1].metrics
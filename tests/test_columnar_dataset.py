@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from cfevals.benchmarks.base import LazyList, TimeSeriesDataset, TimeSeriesPoint
+from cfevals.engine.backtest import WalkForwardBacktester, WalkForwardConfig
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.models.naive import LastValueModel
+from cfevals.record import NullRecorder
+
+
+def _dataset(n=30):
+    start = datetime(2021, 1, 1)
+    points = [
+        TimeSeriesPoint(timestamp=start + timedelta(days=i), value=float(i), features={"f": 100.0 + i})
+        for i in range(n)
+    ]
+    return TimeSeriesDataset(points=points)
+
+
+def test_columnar_windows_match_list_windows():
+    dataset = _dataset()
+    columnar = dataset.to_columnar()
+    kwargs = dict(horizon=3, step=2, min_train_size=5, max_train_size=8)
+    expected = list(dataset.walk_forward_windows(**kwargs))
+    actual = list(columnar.walk_forward_windows(**kwargs))
+    assert len(actual) == len(expected)
+    for exp, act in zip(expected, actual):
+        assert act.as_of == exp.as_of
+        assert act.history.tolist() == exp.history
+        assert act.history_timestamps.tolist() == exp.history_timestamps
+        assert act.future_features["f"].tolist() == exp.future_features["f"]
+        assert act.window_index == exp.window_index
+
+
+def test_columnar_windows_are_readonly_views():
+    columnar = _dataset().to_columnar()
+    window = next(columnar.walk_forward_windows(horizon=2, step=1, min_train_size=5))
+    assert np.shares_memory(window.history, columnar.values)
+    assert np.shares_memory(window.history_features["f"], columnar.feature_matrix)
+    assert not window.future.flags.writeable
+
+
+def test_list_models_receive_lazy_lists_from_columnar():
+    seen = []
+
+    class ListModel(Model):
+        def predict(self, request: ForecastRequest) -> ForecastResult:
+            seen.append(request)
+            return ForecastResult(point_forecast=[request.history[-1]] * request.horizon)
+
+    dataset = _dataset()
+    columnar = dataset.to_columnar()
+    config = WalkForwardConfig(horizon=2, min_train_size=5, max_windows=4)
+    results = WalkForwardBacktester().run(columnar, ListModel(), config, recorder=NullRecorder())
+    baseline = WalkForwardBacktester().run(dataset, LastValueModel(), config, recorder=NullRecorder())
+    assert {type(request.history) for request in seen} == {LazyList}
+    # Views over the series, not converted copies; items read back as Python scalars.
+    assert np.shares_memory(np.asarray(seen[-1].history), columnar.values)
+    assert type(seen[-1].history[-1]) is float
+    assert seen[-1].history == [point.value for point in dataset.points[: len(seen[-1].history)]]
+    assert isinstance(seen[-1].timestamps[0], datetime)
+    assert [r.metrics for r in results] == [r.metrics for r in baseline]
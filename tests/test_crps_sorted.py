@@ -0,0 +1,34 @@
+import numpy as np
+
+from cfevals.metrics.probabilistic import crps, crps_matrix, quantile_crps, rcrps, rcrps_matrix
+
+
+def _pairwise_crps(samples, target):
+    arr = np.asarray(samples, dtype=float)
+    return np.mean(np.abs(arr - target)) - 0.5 * np.mean(np.abs(arr[:, None] - arr[None, :]))
+
+
+def test_sorted_crps_matches_pairwise_definition():
+    rng = np.random.default_rng(0)
+    samples = rng.normal(size=(12, 257))
+    targets = rng.normal(size=12)
+    expected = [_pairwise_crps(row, target) for row, target in zip(samples, targets)]
+    np.testing.assert_allclose(crps_matrix(samples, targets), expected, rtol=1e-12, atol=1e-12)
+    assert np.isclose(crps(samples[0].tolist(), targets[0]), expected[0])
+
+
+def test_rcrps_matrix_applies_roi_penalty():
+    samples = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
+    targets = [5.0, 2.0]
+    scores = rcrps_matrix(samples, targets, roi=(0.0, 4.0))
+    assert np.isclose(scores[0], rcrps([1.0, 2.0, 3.0], 5.0, roi=(0.0, 4.0)))
+    assert np.isclose(scores[0] - scores[1], crps([1.0, 2.0, 3.0], 5.0) - crps([1.0, 2.0, 3.0], 2.0) + 1.0)
+
+
+def test_quantile_crps_approaches_sample_crps():
+    rng = np.random.default_rng(1)
+    draws = np.sort(rng.normal(size=20000))
+    levels = np.linspace(0.01, 0.99, 99)
+    quantiles = np.quantile(draws, levels)[:, None]
+    approx = quantile_crps(quantiles, levels, [0.3])[0]
+    assert abs(approx - crps(draws, 0.3)) < 0.02
@@ -0,0 +1,97 @@
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cfevals.benchmarks.shared import DatasetCache, SharedColumnar, dataset_key
+from cfevals.benchmarks.synthetic import SyntheticScenarioBenchmark, SyntheticTimeSeriesBenchmark
+from cfevals.engine import Runner, WalkForwardBacktester, WalkForwardConfig
+from cfevals.models.smoothing import ExponentialSmoothingModel
+from cfevals.record import NullRecorder
+
+
+class CountingBenchmark(SyntheticTimeSeriesBenchmark):
+    loads = 0
+
+    def load(self):
+        type(self).loads += 1
+        return super().load()
+
+
+def test_cache_keys_on_class_and_args(monkeypatch, tmp_path):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    cache = DatasetCache()
+    CountingBenchmark.loads = 0
+    first = cache.load(CountingBenchmark(num_points=50))
+    assert cache.load(CountingBenchmark(num_points=50)) is first
+    cache.load(CountingBenchmark(num_points=60))
+    assert CountingBenchmark.loads == 2 and (cache.hits, cache.misses) == (1, 2)
+    plain = SyntheticTimeSeriesBenchmark(num_points=50)
+    assert dataset_key(CountingBenchmark(num_points=50)) != dataset_key(plain)
+    samples = cache.load(SyntheticScenarioBenchmark(num_samples=3))
+    samples.clear()
+    assert len(cache.load(SyntheticScenarioBenchmark(num_samples=3))) == 3
+
+
+def test_runner_reuses_cached_dataset(tmp_path):
+    runner = Runner(dataset_cache=DatasetCache())
+    CountingBenchmark.loads = 0
+    config = WalkForwardConfig(horizon=2, min_train_size=20)
+    for name in ("a", "b"):
+        runner.run(
+            benchmark_id=name,
+            benchmark=CountingBenchmark(num_points=40),
+            model_id="holt",
+            model=ExponentialSmoothingModel(),
+            output_dir=tmp_path / name,
+            backtest_config=config,
+        )
+    assert CountingBenchmark.loads == 1
+
+
+def test_shared_columnar_round_trips_through_pickle():
+    dataset = SyntheticTimeSeriesBenchmark(num_points=30, num_features=2).load()
+    with SharedColumnar.export(dataset) as shared:
+        attached = pickle.loads(pickle.dumps(shared)).attach()
+        assert (attached.values == dataset.values).all()
+        assert (attached.timestamps == dataset.timestamps).all()
+        assert np.array_equal(attached.feature_matrix, dataset.feature_matrix)
+        assert attached.feature_names == dataset.feature_names
+
+
+def test_process_backtest_attaches_to_shared_dataset():
+    dataset = SyntheticTimeSeriesBenchmark(num_points=80).load()
+    model = ExponentialSmoothingModel(alpha=0.4)
+
+    def run(executor):
+        config = WalkForwardConfig(horizon=3, min_train_size=30, executor=executor, workers=2)
+        return WalkForwardBacktester().run(dataset, model, config, recorder=NullRecorder())
+
+    assert run("processes") == run("serial")
+
+
+class BlockingBenchmark(SyntheticTimeSeriesBenchmark):
+    def load(self):
+        # num_points=50 waits for the num_points=60 load, which one global lock would deadlock.
+        if self.num_points == 50:
+            assert OTHER_LOADED.wait(timeout=5)
+        data = super().load()
+        if self.num_points == 60:
+            OTHER_LOADED.set()
+        return data
+
+
+OTHER_LOADED = threading.Event()
+
+
+def test_loads_of_different_data_do_not_block_each_other(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    OTHER_LOADED.clear()
+    cache = DatasetCache()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        slow = [executor.submit(cache.load, BlockingBenchmark(num_points=50)) for _ in range(2)]
+        fast = executor.submit(cache.load, BlockingBenchmark(num_points=60))
+        assert len(fast.result(timeout=5).values) == 60
+        first, second = (future.result(timeout=5) for future in slow)
+    assert first is second and (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,115 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from cfevals.cli import cfeval
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.models.cache import CachedModel, ForecastCache
+
+
+class CountingModel(Model):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        self.calls += 1
+        return ForecastResult(point_forecast=[float(request.history[-1]) + 0.1] * request.horizon)
+
+
+SPEC = {"id": "model.counting.v1", "class": "tests:CountingModel", "args": {}}
+
+
+def test_cache_hits_across_model_instances(tmp_path):
+    path = str(tmp_path / "forecasts.sqlite")
+    request = ForecastRequest(history=[1.0, 2.0, 3.0], horizon=2, context_text="ctx")
+
+    first = CachedModel(model=CountingModel(), spec=SPEC, cache=ForecastCache(path))
+    result = first.predict(request)
+    second = CachedModel(model=CountingModel(), spec=SPEC, cache=ForecastCache(path))
+    array_request = ForecastRequest(history=np.array([1.0, 2.0, 3.0]), horizon=2, context_text="ctx")
+    assert second.predict(array_request) == result
+    assert second.model.calls == 0
+    assert second.stats.hits == 1
+
+    other_spec = {**SPEC, "args": {"x": 1}}
+    other = CachedModel(model=CountingModel(), spec=other_spec, cache=ForecastCache(path))
+    other.predict(request)
+    assert other.model.calls == 1
+
+
+def test_read_mode_does_not_write(tmp_path):
+    cache = ForecastCache(str(tmp_path / "forecasts.sqlite"))
+    model = CachedModel(model=CountingModel(), spec=SPEC, cache=cache, mode="read")
+    request = ForecastRequest(history=[1.0], horizon=1)
+    model.predict(request)
+    model.predict(request)
+    assert model.model.calls == 2
+    assert cache.stats.writes == 0
+
+
+def test_lru_eviction_respects_max_bytes(tmp_path):
+    cache = ForecastCache(str(tmp_path / "forecasts.sqlite"), max_bytes=200)
+    model = CachedModel(model=CountingModel(), spec=SPEC, cache=cache)
+    requests = [ForecastRequest(history=[float(i)], horizon=3) for i in range(10)]
+    model.predict_batch(requests)
+    assert cache.stats.evictions > 0
+    model.model.calls = 0
+    model.predict(requests[-1])
+    assert model.model.calls == 0
+
+
+def test_byte_budget_is_shared_by_every_cache_on_a_file(tmp_path):
+    path = str(tmp_path / "forecasts.sqlite")
+    caches = [ForecastCache(path, max_bytes=300) for _ in range(2)]
+    for i in range(10):
+        model = CachedModel(model=CountingModel(), spec=SPEC, cache=caches[i % 2])
+        model.predict(ForecastRequest(history=[float(i)], horizon=3))
+    conn = sqlite3.connect(path)
+    total = conn.execute("SELECT total FROM forecast_bytes").fetchone()[0]
+    assert total == conn.execute("SELECT SUM(size) FROM forecasts").fetchone()[0]
+    assert 0 < total <= 300
+
+
+@pytest.mark.parametrize("executor", ["serial", "processes"])
+def test_cli_runs_persist_and_count_cache_hits(tmp_path, monkeypatch, executor):
+    monkeypatch.chdir(tmp_path)
+    argv = ["benchmark.synthetic.timeseries.v1", "--model", "model.naive.last.v1", "--cache", "readwrite"]
+    argv += ["--max-windows", "20", "--executor", executor, "--workers", "2", "--no-catalog"]
+    cfeval.main([*argv, "--run-id", "first"])
+    path = cfeval.build_model({"class": "cfevals.models.naive:LastValueModel"}, cache="readwrite").cache.path
+    first = dict(sqlite3.connect(path).execute("SELECT key, last_access FROM forecasts"))
+
+    cfeval.main([*argv, "--run-id", "second"])
+    output_dir = tmp_path / "outputs" / "benchmark.synthetic.timeseries.v1" / "second" / "model.naive.last.v1"
+    payload = json.loads((output_dir / "results.json").read_text())
+    assert payload["cache"]["hits"] == payload["num_samples"] == len(first)
+    assert payload["cache"]["misses"] == 0
+    second = dict(sqlite3.connect(path).execute("SELECT key, last_access FROM forecasts"))
+    assert all(second[key] > accessed for key, accessed in first.items())
+
+
+def test_read_mode_hits_leave_the_database_untouched(tmp_path):
+    path = str(tmp_path / "forecasts.sqlite")
+    request = ForecastRequest(history=[1.0, 2.0], horizon=2)
+    writer = ForecastCache(path)
+    result = CachedModel(model=CountingModel(), spec=SPEC, cache=writer).predict(request)
+    writer.close()
+    accessed = sqlite3.connect(path).execute("SELECT last_access FROM forecasts").fetchall()
+
+    reader = ForecastCache(path, read_only=True)
+    model = CachedModel(model=CountingModel(), spec=SPEC, cache=reader, mode="read")
+    assert model.predict(request) == result
+    assert model.model.calls == 0 and reader.stats.hits == 1
+    reader.close()
+    assert sqlite3.connect(path).execute("SELECT last_access FROM forecasts").fetchall() == accessed
+
+    missing = CachedModel(
+        model=CountingModel(),
+        spec=SPEC,
+        cache=ForecastCache(str(tmp_path / "absent.sqlite"), read_only=True),
+        mode="read",
+    )
+    missing.predict(request)
+    assert missing.model.calls == 1 and not (tmp_path / "absent.sqlite").exists()
@@ -0,0 +1,105 @@
+import json
+import os
+import time
+
+import numpy as np
+
+from cfevals.benchmarks.fred import FredUnrateBenchmark
+from cfevals.paths import replace_directory
+
+
+def _fake_fetch(calls):
+    def fetch(self):
+        calls.append(self.cache_key())
+        timestamps = np.array(["2020-01-01", "2020-02-01", "2020-03-01"], dtype="datetime64[us]")
+        covariate = np.array([1.0, 2.0, 3.0]) if self.covariate_series else None
+        return timestamps, np.array([4.0, 4.1, 4.2]), covariate
+
+    return fetch
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_legacy_json_cache_is_migrated_and_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    calls: list[str] = []
+    monkeypatch.setattr(FredUnrateBenchmark, "_fetch", _fake_fetch(calls))
+    index = ["2019-12-01", "2020-01-01", "2020-02-01", "2020-03-01"]
+    payload = {"index": index, "target": [3.4, 3.5, None, 3.7], "covariate": [99.0, 100.0, 101.0, 102.0]}
+    (tmp_path / "fred_unrate.json").write_text(json.dumps(payload))
+    benchmark = FredUnrateBenchmark(target_series="UNRATE", start_date="2020-01-01")
+    benchmark.load()
+    os.remove(tmp_path / "fred_unrate.json")
+
+    dataset = benchmark.load()
+    assert _is_memory_mapped(dataset.values)
+    # Trimmed to the start date; missing observations are dropped, as on fetch.
+    assert dataset.values.tolist() == [3.5, 3.7]
+    assert dataset.feature_names == ()
+    meta = json.loads((tmp_path / benchmark.cache_key() / "meta.json").read_text())
+    assert meta["covariate_series"] is None and meta["start_date"] == "2020-01-01"
+    assert calls == []
+
+
+def test_legacy_json_cache_is_not_trusted_for_other_requests(tmp_path, monkeypatch):
+    # The legacy file records neither its covariate nor the start date it was fetched from.
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    calls: list[str] = []
+    monkeypatch.setattr(FredUnrateBenchmark, "_fetch", _fake_fetch(calls))
+    payload = {"index": ["2020-01-01"], "target": [3.5], "covariate": [100.0]}
+    (tmp_path / "fred_unrate.json").write_text(json.dumps(payload))
+    FredUnrateBenchmark(covariate_series="USEPUNEWSINDXM", start_date="2020-01-01").load()
+    FredUnrateBenchmark(start_date="2019-01-01").load()
+    assert len(calls) == 2
+
+
+def test_cache_key_covers_covariate_and_start_date(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    calls: list[str] = []
+    monkeypatch.setattr(FredUnrateBenchmark, "_fetch", _fake_fetch(calls))
+    FredUnrateBenchmark().load()
+    FredUnrateBenchmark().load()
+    dataset = FredUnrateBenchmark(covariate_series="USEPUNEWSINDXM").load()
+    FredUnrateBenchmark(start_date="2000-01-01").load()
+    assert len(calls) == 3
+    assert dataset.feature_names == ("covariate",)
+
+
+def test_stale_or_mismatched_cache_is_refetched(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    calls: list[str] = []
+    monkeypatch.setattr(FredUnrateBenchmark, "_fetch", _fake_fetch(calls))
+    benchmark = FredUnrateBenchmark(max_age_days=1.0)
+    benchmark.load()
+    meta_path = tmp_path / benchmark.cache_key() / "meta.json"
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps({**meta, "fetched_at": time.time() - 2 * 86400}))
+    benchmark.load()
+    assert len(calls) == 2
+
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps({**meta, "target_series": "PAYEMS"}))
+    benchmark.load()
+    assert len(calls) == 3
+
+
+def test_replace_directory_keeps_a_valid_target_and_replaces_a_stale_one(tmp_path):
+    target = tmp_path / "cache"
+    target.mkdir()
+    (target / "owner").write_text("other")
+
+    def write(path):
+        with open(os.path.join(path, "owner"), "w") as f:
+            f.write("self")
+
+    replace_directory(str(target), write, lambda path: True)
+    assert (target / "owner").read_text() == "other"
+    replace_directory(str(target), write, lambda path: False)
+    assert (target / "owner").read_text() == "self"
+    assert sorted(os.listdir(tmp_path)) == ["cache"]
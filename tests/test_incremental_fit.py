@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from cfevals.benchmarks.base import TimeSeriesDataset, TimeSeriesPoint
+from cfevals.engine.backtest import WalkForwardBacktester, WalkForwardConfig
+from cfevals.models.base import ForecastRequest
+from cfevals.models.smoothing import ExponentialSmoothingModel
+from cfevals.record import NullRecorder
+
+
+class CountingSmoothing(ExponentialSmoothingModel):
+    def reset(self) -> None:
+        super().reset()
+        self.points_seen = 0
+
+    def fit(self, request: ForecastRequest) -> None:
+        super().fit(request)
+        self.points_seen = len(request.history)
+
+    def update(self, request: ForecastRequest) -> None:
+        super().update(request)
+        self.points_seen += len(request.history)
+
+
+class FullRefitSmoothing(CountingSmoothing):
+    supports_update = False
+
+
+def _dataset(columnar: bool):
+    rng = np.random.default_rng(0)
+    start = datetime(2000, 1, 1)
+    values = np.cumsum(rng.normal(size=120))
+    points = [
+        TimeSeriesPoint(timestamp=start + timedelta(days=idx), value=float(value))
+        for idx, value in enumerate(values)
+    ]
+    dataset = TimeSeriesDataset(points=points)
+    return dataset.to_columnar() if columnar else dataset
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("executor", ["serial", "threads"])
+def test_updates_match_full_refits_on_expanding_windows(columnar, executor):
+    config = WalkForwardConfig(
+        horizon=3, min_train_size=20, retrain_frequency=3, executor=executor, workers=2
+    )
+    dataset = _dataset(columnar)
+    incremental = WalkForwardBacktester().run(
+        dataset, CountingSmoothing(alpha=0.4, beta=0.2), config, recorder=NullRecorder()
+    )
+    full = WalkForwardBacktester().run(
+        dataset, FullRefitSmoothing(alpha=0.4, beta=0.2), config, recorder=NullRecorder()
+    )
+    assert incremental == full
+
+
+def test_bounded_windows_fall_back_to_fit():
+    model = CountingSmoothing()
+    config = WalkForwardConfig(horizon=2, min_train_size=20, max_train_size=30)
+    WalkForwardBacktester().run(_dataset(False), model, config, recorder=NullRecorder())
+    assert model.points_seen == 30
+
+    model = CountingSmoothing()
+    WalkForwardBacktester().run(
+        _dataset(False), model, WalkForwardConfig(horizon=2, min_train_size=20), recorder=NullRecorder()
+    )
+    # Every point up to the last training window is consumed exactly once.
+    assert model.points_seen == 118
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from cfevals.registry import Registry
+
+ROOT = Path(__file__).resolve().parents[1]
+
+LIST_AND_CHECK = """
+import sys
+sys.argv = ["cfeval", "--list"]
+from cfevals.cli.cfeval import main
+main()
+heavy = sorted({"numpy", "pandas", "yaml", "asyncio", "sqlite3"} & set(sys.modules))
+print("HEAVY", ",".join(heavy))
+"""
+
+
+def _run(code, cache_dir):
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "CFEVALS_CACHE": str(cache_dir)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def test_package_imports_do_not_pull_heavy_modules(tmp_path):
+    code = (
+        "import sys, cfevals, cfevals.engine, cfevals.models, cfevals.benchmarks, cfevals.cli.cfeval\n"
+        "print(sorted({'numpy', 'yaml', 'asyncio', 'sqlite3'} & set(sys.modules)))\n"
+        "from cfevals.models import LastValueModel\n"
+        "from cfevals.engine import Runner\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    assert _run(code, tmp_path).split() == ["[]", "True"]
+
+
+def test_list_uses_registry_index_after_first_run(tmp_path):
+    first = _run(LIST_AND_CHECK, tmp_path)
+    assert "model.naive.last.v1" in first and "benchmark.synthetic.timeseries.v1 (time_series)" in first
+    assert (tmp_path / "registry_index.json").exists()
+    second = _run(LIST_AND_CHECK, tmp_path)
+    assert second.splitlines()[-1] == "HEAVY "
+    assert second.splitlines()[:-1] == first.splitlines()[:-1]
+
+
+def test_registry_index_picks_up_edits(tmp_path):
+    registry_dir = tmp_path / "registry"
+    registry_dir.mkdir()
+    spec = registry_dir / "m.yaml"
+    spec.write_text("id: model.a\ntype: model\nclass: x:A\n")
+    index_path = str(tmp_path / "index.json")
+    assert "model.a" in Registry().load([str(registry_dir)], index_path=index_path).models
+    spec.write_text("id: model.bb\ntype: model\nclass: x:B\n")
+    os.utime(spec, ns=(0, 0))
+    models = Registry().load([str(registry_dir)], index_path=index_path).models
+    assert list(models) == ["model.bb"]
+    spec.unlink()
+    assert Registry().load([str(registry_dir)], index_path=index_path).models == {}
+
+
+def test_registry_index_skips_files_json_cannot_represent(tmp_path):
+    registry_dir = tmp_path / "registry"
+    registry_dir.mkdir()
+    (registry_dir / "a.yaml").write_text("id: model.a\ntype: model\nclass: x:A\nargs: {1: one}\n")
+    (registry_dir / "b.yaml").write_text("id: model.b\ntype: model\nclass: x:B\n")
+    index_path = tmp_path / "index.json"
+    Registry().load([str(registry_dir)], index_path=str(index_path))
+    assert [Path(path).name for path in json.loads(index_path.read_text())["files"]] == ["b.yaml"]
+    models = Registry().load([str(registry_dir)], index_path=str(index_path)).models
+    assert models["model.a"]["args"] == {1: "one"}
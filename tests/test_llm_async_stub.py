@@ -0,0 +1,101 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cfevals.benchmarks.base import ScenarioSample
+from cfevals.engine.scenario import ScenarioConfig, ScenarioEvaluator
+from cfevals.record import NullRecorder
+
+pytest.importorskip("openai")
+
+from cfevals.models.llm import OpenAIModel  # noqa: E402
+
+
+class StubState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+
+def _make_handler(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            return None
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with state.lock:
+                state.requests += 1
+                first = state.requests == 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                if first:
+                    self._send(429, {"error": {"message": "slow down", "type": "rate_limit"}})
+                    return
+                time.sleep(0.05)
+                prompt = body["messages"][-1]["content"]
+                last = float(re.search(r"History: \[.*?([\d.]+)\]", prompt).group(1))
+                content = json.dumps({"point_forecast": [last, last], "samples": [[last, last]]})
+                self._send(
+                    200,
+                    {
+                        "id": "cmpl",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "finish_reason": "stop",
+                                "message": {"role": "assistant", "content": content},
+                            }
+                        ],
+                    },
+                )
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+        def _send(self, status, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def test_async_openai_against_stub_server(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    state = StubState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        model = OpenAIModel(
+            base_url=f"http://127.0.0.1:{server.server_port}/v1",
+            backoff_base=0.01,
+            requests_per_minute=6000,
+        )
+        samples = [
+            ScenarioSample(sample_id=f"s{i}", history=[1.0, float(i)], future=[float(i), float(i)])
+            for i in range(8)
+        ]
+        results = ScenarioEvaluator().run(
+            samples, model, recorder=NullRecorder(), config=ScenarioConfig(max_concurrency=4)
+        )
+    finally:
+        server.shutdown()
+    assert [r.sample_id for r in results] == [s.sample_id for s in samples]
+    assert all(r.metric == 0.0 for r in results)
+    assert state.requests == len(samples) + 1
+    assert state.max_in_flight > 1
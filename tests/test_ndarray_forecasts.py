@@ -0,0 +1,51 @@
+import json
+
+import numpy as np
+import pytest
+
+from cfevals.benchmarks.base import ScenarioSample
+from cfevals.engine import ScenarioEvaluator
+from cfevals.engine.validation import normalize_samples, validate_forecast_result
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.record import LocalRecorder, NullRecorder, iter_events
+
+SAMPLES = np.random.default_rng(0).normal(size=(200, 4))
+
+
+class SampleModel(Model):
+    def __init__(self, as_lists: bool) -> None:
+        self.as_lists = as_lists
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        if self.as_lists:
+            return ForecastResult(point_forecast=SAMPLES.mean(axis=0).tolist(), samples=SAMPLES.tolist())
+        return ForecastResult(point_forecast=SAMPLES.mean(axis=0), samples=SAMPLES)
+
+
+def _score(model):
+    sample = ScenarioSample(sample_id="s", history=[0.0, 1.0], future=[0.5, 0.0, -0.5, 1.0], roi=(0.0, 1.0))
+    return ScenarioEvaluator().run([sample], model, recorder=NullRecorder())[0].metric
+
+
+def test_ndarray_samples_score_like_lists():
+    assert _score(SampleModel(as_lists=False)) == pytest.approx(_score(SampleModel(as_lists=True)))
+
+
+def test_ndarray_samples_are_not_copied():
+    result = ForecastResult(point_forecast=SAMPLES[0], samples=SAMPLES)
+    assert np.shares_memory(normalize_samples(result, 4, context="test"), SAMPLES)
+    assert not hasattr(result, "__dict__") and not hasattr(ForecastRequest([1.0], 1), "__dict__")
+
+
+def test_ndarray_samples_shape_is_validated():
+    result = ForecastResult(point_forecast=np.zeros(4), samples=np.zeros((10, 3)))
+    with pytest.raises(ValueError, match=r"samples shape \(10, 3\)"):
+        validate_forecast_result(result, 4, context="test")
+
+
+def test_ndarray_payloads_serialize_as_lists(tmp_path):
+    recorder = LocalRecorder(str(tmp_path / "events.jsonl"))
+    recorder.record_event("forecast", {"samples": SAMPLES[:2], "value": np.float64(1.5)})
+    recorder.close()
+    payload = next(iter_events(tmp_path / "events.jsonl"))["payload"]
+    assert payload == json.loads(json.dumps({"samples": SAMPLES[:2].tolist(), "value": 1.5}))
@@ -0,0 +1,97 @@
+import json
+
+import numpy as np
+import pytest
+
+from cfevals.benchmarks.fred import FredPanelBenchmark, FredUnrateBenchmark
+from cfevals.benchmarks.panel import PanelDataset
+from cfevals.engine import Runner, WalkForwardConfig
+from cfevals.models.naive import LastValueModel
+from cfevals.record import iter_events
+
+
+def _monthly(start: str, count: int) -> np.ndarray:
+    first = np.datetime64(start, "M")
+    return np.arange(first, first + np.timedelta64(count, "M")).astype("datetime64[us]")
+
+
+@pytest.fixture
+def fetches(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path / "cache"))
+    calls: list[list[str]] = []
+    starts = {"AAUR": ("2000-01", 30), "BBUR": ("2000-07", 20), "CCUR": ("2001-01", 4)}
+
+    def fetch(self, series_ids):
+        calls.append(list(series_ids))
+        return {
+            series_id: (_monthly(*starts[series_id]), np.arange(starts[series_id][1], dtype=float), None)
+            for series_id in series_ids
+        }
+
+    monkeypatch.setattr(FredPanelBenchmark, "_fetch", fetch)
+    return calls
+
+
+def test_panel_loads_in_bulk_and_shares_one_array(fetches):
+    FredPanelBenchmark(series=["AAUR", "BBUR"]).load()
+    panel = FredPanelBenchmark(series=["AAUR", "BBUR", "CCUR"]).load()
+    assert fetches == [["AAUR", "BBUR"], ["CCUR"]]
+    assert panel.values.shape == (54,)
+    assert panel.offsets.tolist() == [0, 30, 50, 54]
+    series = panel.series(1)
+    assert series.values.tolist() == list(map(float, range(20)))
+    assert series.timestamps[0] == np.datetime64("2000-07-01")
+    assert np.shares_memory(series.values, panel.values)
+
+
+def test_series_on_different_grids_are_not_padded():
+    quarterly = _monthly("2000-01", 12)[::3]
+    panel = PanelDataset.from_series(
+        {"monthly": (_monthly("2000-02", 6), np.arange(6.0)), "quarterly": (quarterly, np.ones(4))}
+    )
+    assert not np.isnan(panel.values).any()
+    assert panel.series(1).timestamps.tolist() == quarterly.tolist()
+    assert len(panel.series(0)) == 6
+
+
+def test_runner_reports_per_series_and_pooled_metrics(fetches, tmp_path):
+    output_dir = tmp_path / "out"
+    output = Runner().run(
+        benchmark_id="panel",
+        benchmark=FredPanelBenchmark(series=["AAUR", "BBUR", "CCUR"]),
+        model_id="naive",
+        model=LastValueModel(),
+        output_dir=output_dir,
+        backtest_config=WalkForwardConfig(horizon=2, min_train_size=10),
+    )
+    payload = json.loads((output_dir / "results.json").read_text())
+    assert payload["num_series"] == 3
+    assert {key: entry["num_samples"] for key, entry in payload["series"].items()} == {
+        "AAUR": 19,
+        "BBUR": 9,
+        "CCUR": 0,
+    }
+    assert output.num_samples == 28
+    # The naive forecast misses a unit-step ramp by 1 at step one and 2 at step two.
+    assert payload["metrics"]["mae"] == pytest.approx(1.5)
+    events = iter_events(output_dir / "events.jsonl")
+    sample_ids = [event["sample_id"] for event in events if event["event_type"] == "walk_forward_window"]
+    assert len(set(sample_ids)) == 28 and sample_ids[0].startswith("AAUR/")
+    assert "| BBUR | 9 |" in (output_dir / "results.md").read_text()
+
+
+def test_panel_members_share_the_single_series_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path))
+    requests: list[list[str]] = []
+
+    def fetch_series(series_ids, start_date):
+        requests.append(list(series_ids))
+        return {series_id: (_monthly("2000-01", 3), np.array([1.0, 2.0, 3.0])) for series_id in series_ids}
+
+    monkeypatch.setattr("cfevals.benchmarks.fred._fetch_series", fetch_series)
+    FredPanelBenchmark(series=["AAUR", "BBUR"]).load()
+    single = FredUnrateBenchmark(target_series="BBUR").load()
+    with_covariate = FredUnrateBenchmark(target_series="BBUR", covariate_series="AAUR").load()
+    assert requests == [["AAUR", "BBUR"], ["BBUR", "AAUR"]]
+    assert single.values.tolist() == [1.0, 2.0, 3.0]
+    assert with_covariate.features["covariate"].tolist() == [1.0, 2.0, 3.0]
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from cfevals.benchmarks.base import TimeSeriesDataset, TimeSeriesPoint
+from cfevals.engine.backtest import WalkForwardBacktester, WalkForwardConfig
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.record import NullRecorder
+
+
+class FitLengthModel(Model):
+    def __init__(self) -> None:
+        self.fitted_length = 0
+
+    def fit(self, request: ForecastRequest) -> None:
+        self.fitted_length = len(request.history)
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        return ForecastResult(point_forecast=[float(self.fitted_length)] * request.horizon)
+
+
+def _dataset():
+    start = datetime(2020, 1, 1)
+    points = [TimeSeriesPoint(timestamp=start + timedelta(days=i), value=float(i % 7)) for i in range(60)]
+    return TimeSeriesDataset(points=points)
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes"])
+@pytest.mark.parametrize("allow_retrain", [True, False])
+def test_parallel_backtest_matches_serial(executor, allow_retrain):
+    dataset = _dataset()
+    base = dict(horizon=3, min_train_size=10, retrain_frequency=4, allow_retrain=allow_retrain)
+    serial = WalkForwardBacktester().run(
+        dataset, FitLengthModel(), WalkForwardConfig(**base), recorder=NullRecorder()
+    )
+    parallel = WalkForwardBacktester().run(
+        dataset,
+        FitLengthModel(),
+        WalkForwardConfig(**base, executor=executor, workers=3),
+        recorder=NullRecorder(),
+    )
+    assert parallel == serial
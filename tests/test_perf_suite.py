@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from cfevals.benchmarks.synthetic import SyntheticScenarioBenchmark, SyntheticTimeSeriesBenchmark
+from cfevals.cli import cfevalperf
+from cfevals.perf import CASES, PerfSizes, compare, run_suite
+
+TINY = PerfSizes(points=200, windows=20, scenarios=5, samples=16, horizon=4, events=50)
+
+
+def test_synthetic_benchmarks_are_seeded():
+    first = SyntheticTimeSeriesBenchmark(num_points=100, num_features=2, seed=3).load()
+    second = SyntheticTimeSeriesBenchmark(num_points=100, num_features=2, seed=3).load()
+    assert len(first) == 100 and first.feature_names == ("feature_0", "feature_1")
+    assert (first.values == second.values).all()
+    samples = SyntheticScenarioBenchmark(num_samples=3, history_length=10, horizon=2).load()
+    assert [len(s.history) for s in samples] == [10, 10, 10]
+    assert all(len(s.future) == 2 for s in samples)
+
+
+def test_suite_reports_every_case():
+    report = run_suite(TINY, repeat=2)
+    assert set(report["cases"]) == set(CASES)
+    assert report["cases"]["runner_time_series"]["ops"] == TINY.windows
+    assert report["cases"]["runner_scenario"]["ops"] == TINY.scenarios
+    assert all(len(case["seconds"]) == 2 for case in report["cases"].values())
+    json.dumps(report)
+
+
+def test_compare_flags_slower_cases():
+    current = {"cases": {"crps": {"ops": 10, "best": 2.0}, "as_of": {"ops": 10, "best": 1.0}}}
+    baseline = {"cases": {"crps": {"ops": 10, "best": 1.0}, "as_of": {"ops": 20, "best": 2.0}}}
+    by_name = {item.name: item for item in compare(current, baseline, tolerance=0.25)}
+    assert by_name["crps"].regressed and by_name["crps"].ratio == pytest.approx(2.0)
+    assert not by_name["as_of"].regressed
+
+
+def test_cli_exits_nonzero_on_regression(tmp_path):
+    output = tmp_path / "perf.json"
+    argv = ["--points", "200", "--windows", "20", "--case", "as_of", "--repeat", "1", "--output", str(output)]
+    cfevalperf.main(argv)
+    report = json.loads(output.read_text())
+    report["cases"]["as_of"]["best"] /= 100.0
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+    with pytest.raises(SystemExit) as exc:
+        cfevalperf.main([*argv, "--baseline", str(baseline)])
+    assert exc.value.code == 1
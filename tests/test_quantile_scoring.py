@@ -0,0 +1,95 @@
+import json
+
+import numpy as np
+import pytest
+
+from cfevals.benchmarks.base import ScenarioBenchmark, ScenarioSample
+from cfevals.cli.cfeval import build_scenario_config
+from cfevals.engine import Runner, ScenarioConfig, ScenarioEvaluator
+from cfevals.metrics.probabilistic import quantile_crps
+from cfevals.metrics.quantile import parse_quantile_keys, pinball_loss, weighted_interval_score
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.record import NullRecorder
+from cfevals.registry import Registry
+
+QUANTILES = {"0.9": [2.0, 3.0], "0.1": [0.0, 1.0], "0.5": [1.0, 2.0]}
+SAMPLE = ScenarioSample(sample_id="s", history=[1.0], future=[1.5, 4.0], roi=(0.0, 3.0))
+
+
+class QuantileModel(Model):
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        return ForecastResult(point_forecast=QUANTILES["0.5"], quantiles=QUANTILES)
+
+
+class SingleSampleBenchmark(ScenarioBenchmark):
+    def load(self):
+        return [SAMPLE]
+
+
+def test_pinball_and_wis_match_definitions():
+    values = np.asarray([[0.0], [1.0], [2.0]])
+    levels = [0.1, 0.5, 0.9]
+    loss = pinball_loss(values, levels, [3.0])
+    np.testing.assert_allclose(loss[:, 0], [0.3, 1.0, 0.9])
+    # Interval score at alpha=0.2 for [0, 2] and y=3, then WIS = (0.5|y-m| + a/2 IS) / 1.5.
+    interval = (2.0 - 0.0) + 2.0 / 0.2 * (3.0 - 2.0)
+    expected = (0.5 * 2.0 + 0.1 * interval) / 1.5
+    assert weighted_interval_score(values, levels, [3.0])[0] == pytest.approx(expected)
+    # Unsorted levels are reordered with their rows.
+    assert weighted_interval_score(values[::-1], levels[::-1], [3.0])[0] == pytest.approx(expected)
+
+
+def test_quantile_keys_are_parsed_once_per_key_set():
+    levels = parse_quantile_keys(QUANTILES)
+    assert levels.keys == ("0.1", "0.5", "0.9")
+    assert parse_quantile_keys(["0.5", "0.9", "0.1"]) is levels
+    with pytest.raises(ValueError, match="numeric"):
+        parse_quantile_keys(["low", "high"])
+
+
+def test_sample_scoring_accepts_percent_quantile_keys():
+    class PercentQuantiles(Model):
+        def predict(self, request: ForecastRequest) -> ForecastResult:
+            quantiles = {"90": QUANTILES["0.9"], "10": QUANTILES["0.1"], "50": QUANTILES["0.5"]}
+            return ForecastResult(point_forecast=QUANTILES["0.5"], quantiles=quantiles)
+
+    percent = ScenarioEvaluator().run([SAMPLE], PercentQuantiles(), recorder=NullRecorder())[0]
+    levels = ScenarioEvaluator().run([SAMPLE], QuantileModel(), recorder=NullRecorder())[0]
+    assert percent.metric == pytest.approx(levels.metric)
+
+
+def test_quantile_scoring_skips_sample_expansion():
+    config = ScenarioConfig(scoring="quantiles")
+    result = ScenarioEvaluator().run([SAMPLE], QuantileModel(), recorder=NullRecorder(), config=config)[0]
+    values = np.asarray([QUANTILES[key] for key in ("0.1", "0.5", "0.9")])
+    crps = float(np.mean(quantile_crps(values, [0.1, 0.5, 0.9], SAMPLE.future)))
+    assert result.quantile_metrics["quantile_crps"] == pytest.approx(crps)
+    assert result.metric == pytest.approx(crps + 0.5)  # ROI penalty: 4.0 is 1.0 above the region
+    legacy = ScenarioEvaluator().run([SAMPLE], QuantileModel(), recorder=NullRecorder())[0]
+    assert legacy.quantile_metrics is None and legacy.metric != pytest.approx(result.metric)
+
+
+def test_quantile_metrics_are_reported_and_resumed(tmp_path):
+    config = ScenarioConfig(scoring="quantiles", track_variance=True)
+    kwargs = {
+        "benchmark_id": "benchmark.q",
+        "model_id": "model.q",
+        "model": QuantileModel(),
+        "output_dir": tmp_path,
+        "scenario_config": config,
+    }
+    benchmark = SingleSampleBenchmark()
+    first = Runner().run(benchmark=benchmark, **kwargs)
+    assert set(first.metrics) == {"rcrps", "pinball", "wis", "quantile_crps"}
+    assert set(json.loads((tmp_path / "results.json").read_text())["metric_stats"]) == set(first.metrics)
+    resumed = Runner().run(benchmark=benchmark, resume=True, **kwargs)
+    assert resumed.metrics == first.metrics
+
+
+def test_scoring_is_selected_from_the_registry_spec():
+    spec = Registry().load().get_benchmark("benchmark.cik.quantiles.v1")
+    config = build_scenario_config(spec, {})
+    assert config.scoring == "quantiles"
+    assert config.quantile_levels == (0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95)
+    with pytest.raises(ValueError, match="scoring"):
+        ScenarioConfig(scoring="intervals")
@@ -0,0 +1,93 @@
+import json
+import sqlite3
+
+import pytest
+
+from cfevals.benchmarks.synthetic import SyntheticScenarioBenchmark, SyntheticTimeSeriesBenchmark
+from cfevals.catalog import ResultsCatalog
+from cfevals.cli.cfeval import main
+from cfevals.engine import Runner, WalkForwardConfig
+from cfevals.metrics.significance import BootstrapConfig
+from cfevals.models.naive import LastValueModel
+from cfevals.models.smoothing import ExponentialSmoothingModel
+
+CONFIG = WalkForwardConfig(horizon=3, min_train_size=30)
+
+
+def _models():
+    return {"naive": LastValueModel(), "holt": ExponentialSmoothingModel(alpha=0.5, beta=0.1)}
+
+
+def _run(root, runner, run_id="run-1"):
+    return runner.run_many(
+        benchmark_id="bench",
+        benchmark=SyntheticTimeSeriesBenchmark(num_points=120),
+        models=_models(),
+        output_root=root / "bench" / run_id,
+        backtest_config=CONFIG,
+    )
+
+
+def test_runner_catalogues_metrics_and_scores(tmp_path):
+    catalog = ResultsCatalog(str(tmp_path / "catalog.sqlite"))
+    outputs = _run(tmp_path, Runner(catalog=catalog, bootstrap=BootstrapConfig(resamples=100)))
+
+    board = catalog.leaderboard("bench", "mae")
+    assert [row["model_id"] for row in board] == sorted(outputs, key=lambda key: outputs[key].metrics["mae"])
+    assert board[0]["run_id"] == "run-1" and board[0]["lower"] <= board[0]["value"] <= board[0]["upper"]
+
+    diff = catalog.sample_diff("bench", "mae", "naive", "holt", limit=None)
+    assert len(diff) == outputs["naive"].num_samples
+    mean_diff = sum(row["diff"] for row in diff) / len(diff)
+    assert mean_diff == pytest.approx(outputs["holt"].metrics["mae"] - outputs["naive"].metrics["mae"])
+    assert abs(diff[0]["diff"]) >= abs(diff[-1]["diff"])
+
+    # A rerun into the same directories replaces its rows; a newer run_id leads the board.
+    _run(tmp_path, Runner(catalog=catalog))
+    _run(tmp_path, Runner(catalog=catalog), run_id="run-2")
+    with sqlite3.connect(catalog.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 4
+    assert {row["run_id"] for row in catalog.leaderboard("bench", "mae")} == {"run-2"}
+    assert {row["run_id"] for row in catalog.leaderboard("bench", "mae", run_id="run-1")} == {"run-1"}
+
+
+def test_backfill_matches_live_catalogue(tmp_path):
+    live = ResultsCatalog(str(tmp_path / "live.sqlite"))
+    _run(tmp_path / "outputs", Runner(catalog=live))
+    Runner(catalog=live).run(
+        benchmark_id="scenarios",
+        benchmark=SyntheticScenarioBenchmark(num_samples=5),
+        model_id="naive",
+        model=LastValueModel(),
+        output_dir=tmp_path / "outputs" / "scenarios" / "run-1" / "naive",
+    )
+    (tmp_path / "outputs" / "bench" / "partial" / "naive").mkdir(parents=True)
+    (tmp_path / "outputs" / "bench" / "partial" / "naive" / "results.json").write_text("{}")
+
+    main(["backfill", str(tmp_path / "outputs")])
+    backfilled = ResultsCatalog(str(tmp_path / "outputs" / "catalog.sqlite"))
+    for benchmark_id, metric in (("bench", "mae"), ("scenarios", "rcrps")):
+        expected = live.leaderboard(benchmark_id, metric)
+        actual = backfilled.leaderboard(benchmark_id, metric)
+        assert [(row["model_id"], row["value"]) for row in actual] == [
+            (row["model_id"], row["value"]) for row in expected
+        ]
+    assert backfilled.sample_diff("bench", "rmse", "naive", "holt") == live.sample_diff(
+        "bench", "rmse", "naive", "holt"
+    )
+
+
+def test_report_prints_leaderboard_and_diffs(tmp_path, capsys):
+    catalog = ResultsCatalog(str(tmp_path / "catalog.sqlite"))
+    outputs = _run(tmp_path, Runner(catalog=catalog))
+    main(["report", "bench", "--metric", "mae", "--catalog", catalog.path])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[:2] == ["model", "run_id"] and len(lines) == 3
+    main(["report", "bench", "--diff", "naive", "holt", "--limit", "5", "--catalog", catalog.path])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 6 and lines[1].split()[0] in {
+        event["sample_id"]
+        for event in map(json.loads, (tmp_path / "bench" / "run-1" / "naive" / "events.jsonl").open())
+        if event["event_type"] == "walk_forward_window"
+    }
+    assert outputs["naive"].num_samples > 5
@@ -0,0 +1,125 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from cfevals.benchmarks.base import (
+    ScenarioBenchmark,
+    ScenarioSample,
+    TimeSeriesBenchmark,
+    TimeSeriesDataset,
+    TimeSeriesPoint,
+)
+from cfevals.engine import Runner, ScenarioConfig, WalkForwardConfig
+from cfevals.models.base import ForecastRequest, ForecastResult, Model
+from cfevals.record import RecorderConfig, iter_events
+
+
+class SyntheticBenchmark(TimeSeriesBenchmark):
+    def load(self) -> TimeSeriesDataset:
+        start = datetime(2020, 1, 1)
+        points = [TimeSeriesPoint(timestamp=start + timedelta(days=i), value=float(i % 5)) for i in range(40)]
+        return TimeSeriesDataset(points=points)
+
+
+class SyntheticScenarios(ScenarioBenchmark):
+    def load(self) -> list[ScenarioSample]:
+        return [
+            ScenarioSample(sample_id=f"s{i}", history=[float(i)], future=[float(i) + 0.5]) for i in range(9)
+        ]
+
+
+class FitLengthModel(Model):
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.fitted_length = 0
+        self.fail_after = fail_after
+        self.predictions = 0
+
+    def reset(self) -> None:
+        self.fitted_length = 0
+
+    def fit(self, request: ForecastRequest) -> None:
+        self.fitted_length = len(request.history)
+
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        if self.fail_after is not None and self.predictions >= self.fail_after:
+            raise RuntimeError("simulated outage")
+        self.predictions += 1
+        value = float(self.fitted_length + len(request.history))
+        return ForecastResult(point_forecast=[value] * request.horizon)
+
+
+def _run(benchmark, model, output_dir, *, resume=False, executor="serial"):
+    runner = Runner(recorder_config=RecorderConfig(flush_every=None))
+    return runner.run(
+        benchmark_id="bench",
+        benchmark=benchmark,
+        model_id="model",
+        model=model,
+        output_dir=output_dir,
+        backtest_config=WalkForwardConfig(
+            horizon=2, min_train_size=5, retrain_frequency=4, executor=executor, workers=2
+        ),
+        scenario_config=ScenarioConfig(batch_size=2),
+        resume=resume,
+    )
+
+
+def _window_payloads(path):
+    return [event["payload"] for event in iter_events(path) if event["event_type"] == "walk_forward_window"]
+
+
+@pytest.mark.parametrize("executor", ["serial", "threads"])
+def test_resumed_backtest_matches_uninterrupted_run(tmp_path, executor):
+    expected = _run(SyntheticBenchmark(), FitLengthModel(), tmp_path / "full")
+
+    output_dir = tmp_path / "resumed"
+    with pytest.raises(RuntimeError, match="simulated outage"):
+        _run(SyntheticBenchmark(), FitLengthModel(fail_after=14), output_dir)
+    events_path = output_dir / "events.jsonl"
+    assert len(list(iter_events(events_path))) == 14
+    with events_path.open("a") as fh:
+        fh.write('{"event_type": "walk_forward_wi')
+
+    model = FitLengthModel()
+    resumed = _run(SyntheticBenchmark(), model, output_dir, resume=True, executor=executor)
+    assert resumed == expected
+    if executor == "serial":
+        assert model.predictions == expected.num_samples - 14
+    assert json.loads((output_dir / "results.json").read_text())["resumed_samples"] == 14
+    assert _window_payloads(events_path) == _window_payloads(tmp_path / "full" / "events.jsonl")
+
+
+def test_resumed_scenarios_skip_completed_samples(tmp_path):
+    expected = _run(SyntheticScenarios(), FitLengthModel(), tmp_path / "full")
+    output_dir = tmp_path / "resumed"
+    with pytest.raises(RuntimeError):
+        _run(SyntheticScenarios(), FitLengthModel(fail_after=5), output_dir)
+    model = FitLengthModel()
+    assert _run(SyntheticScenarios(), model, output_dir, resume=True) == expected
+    assert model.predictions == 5
+
+
+def test_resume_refuses_corrupt_events_and_keeps_them(tmp_path):
+    with pytest.raises(RuntimeError):
+        _run(SyntheticBenchmark(), FitLengthModel(fail_after=6), tmp_path)
+    events_path = tmp_path / "events.jsonl"
+    lines = events_path.read_text().splitlines(keepends=True)
+    lines[2] = lines[2][:10] + "\n"
+    events_path.write_text("".join(lines))
+    with pytest.raises(json.JSONDecodeError):
+        _run(SyntheticBenchmark(), FitLengthModel(), tmp_path, resume=True)
+    assert events_path.read_text() == "".join(lines)
+
+
+class InterruptedModel(FitLengthModel):
+    def predict(self, request: ForecastRequest) -> ForecastResult:
+        if self.predictions >= 6:
+            raise KeyboardInterrupt
+        return super().predict(request)
+
+
+def test_interrupted_backtest_records_every_prediction_made(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        _run(SyntheticBenchmark(), InterruptedModel(), tmp_path)
+    assert len(_window_payloads(tmp_path / "events.jsonl")) == 6
@@ -0,0 +1,115 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from cfevals.benchmarks.base import TimeSeriesDataset, TimeSeriesPoint
+from cfevals.benchmarks.synthetic import SyntheticScenarioBenchmark, SyntheticTimeSeriesBenchmark
+from cfevals.engine import Runner, ScenarioConfig, WalkForwardBacktester, WalkForwardConfig
+from cfevals.models.naive import LastValueModel
+from cfevals.models.smoothing import ExponentialSmoothingModel
+
+
+class CountingBenchmark(SyntheticTimeSeriesBenchmark):
+    loads = 0
+
+    def load(self):
+        type(self).loads += 1
+        return super().load()
+
+
+class CountingScenarios(SyntheticScenarioBenchmark):
+    passes = 0
+    pulled = 0
+
+    def iter_samples(self):
+        type(self).passes += 1
+        for sample in super().iter_samples():
+            type(self).pulled += 1
+            yield sample
+
+
+class LeadCheckingModel(LastValueModel):
+    # Fails if the stream is read far ahead of this model's predictions (one round and
+    # one batch is expected), e.g. by materializing all 500 samples.
+    def __init__(self):
+        super().__init__()
+        self.predictions = 0
+
+    def predict(self, request):
+        self.predictions += 1
+        assert CountingScenarios.pulled - self.predictions <= 100
+        return super().predict(request)
+
+
+def _models():
+    return {"naive": LastValueModel(), "holt": ExponentialSmoothingModel(alpha=0.5, beta=0.1)}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_many_matches_single_runs(tmp_path, workers):
+    config = WalkForwardConfig(horizon=3, min_train_size=20, batch_size=8)
+    CountingBenchmark.loads = 0
+    outputs = Runner().run_many(
+        benchmark_id="bench",
+        benchmark=CountingBenchmark(num_points=120),
+        models=_models(),
+        output_root=tmp_path / "many",
+        backtest_config=config,
+        workers=workers,
+    )
+    assert CountingBenchmark.loads == 1
+    for model_id, model in _models().items():
+        single = Runner().run(
+            benchmark_id="bench",
+            benchmark=SyntheticTimeSeriesBenchmark(num_points=120),
+            model_id=model_id,
+            model=model,
+            output_dir=tmp_path / "single" / model_id,
+            backtest_config=config,
+        )
+        assert outputs[model_id] == single
+        assert (tmp_path / "many" / model_id / ".complete").exists()
+    comparison = json.loads((tmp_path / "many" / "comparison.json").read_text())
+    assert list(comparison["models"]) == ["naive", "holt"]
+    mae = {model_id: output.metrics["mae"] for model_id, output in outputs.items()}
+    assert comparison["deltas"]["naive"]["holt"]["mae"] == pytest.approx(mae["holt"] - mae["naive"])
+    assert "| naive | holt |" in (tmp_path / "many" / "comparison.md").read_text()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_many_shares_one_stream_in_lockstep(tmp_path, workers):
+    CountingScenarios.passes = CountingScenarios.pulled = 0
+    models = {"naive": LeadCheckingModel(), "holt": ExponentialSmoothingModel(alpha=0.5, beta=0.1)}
+    config = ScenarioConfig(streaming=True, batch_size=4)
+    outputs = Runner().run_many(
+        benchmark_id="scenarios",
+        benchmark=CountingScenarios(num_samples=500),
+        models=models,
+        output_root=tmp_path / "many",
+        scenario_config=config,
+        workers=workers,
+    )
+    assert CountingScenarios.passes == 1 and CountingScenarios.pulled == 500
+    for model_id, model in _models().items():
+        single = Runner().run(
+            benchmark_id="scenarios",
+            benchmark=SyntheticScenarioBenchmark(num_samples=500),
+            model_id=model_id,
+            model=model,
+            output_dir=tmp_path / "single" / model_id,
+            scenario_config=config,
+        )
+        assert outputs[model_id] == single
+
+
+def test_prepare_regenerates_list_backed_windows():
+    start = datetime(2020, 1, 1)
+    points = [TimeSeriesPoint(timestamp=start + timedelta(days=i), value=float(i)) for i in range(60)]
+    config = WalkForwardConfig(horizon=2, min_train_size=10)
+    prepared = WalkForwardBacktester().prepare(TimeSeriesDataset(points=points), config)
+    assert not isinstance(prepared.windows, list)
+    first, second = list(prepared.windows), list(prepared.windows)
+    assert len(first) == len(second) == 49 and first[-1].history == second[-1].history
+    columnar = WalkForwardBacktester().prepare(TimeSeriesDataset(points=points).to_columnar(), config)
+    assert isinstance(columnar.windows, list)
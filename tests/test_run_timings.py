@@ -0,0 +1,54 @@
+import json
+import sys
+from datetime import datetime, timedelta
+
+from cfevals.benchmarks.base import TimeSeriesBenchmark, TimeSeriesDataset, TimeSeriesPoint
+from cfevals.cli import cfeval
+from cfevals.engine import Runner, WalkForwardConfig
+from cfevals.models.naive import LastValueModel
+from cfevals.record import iter_events
+
+
+class SyntheticBenchmark(TimeSeriesBenchmark):
+    def load(self) -> TimeSeriesDataset:
+        start = datetime(2020, 1, 1)
+        points = [TimeSeriesPoint(timestamp=start + timedelta(days=i), value=float(i % 3)) for i in range(50)]
+        return TimeSeriesDataset(points=points)
+
+
+def test_results_include_stage_timings(tmp_path):
+    output = Runner().run(
+        benchmark_id="bench",
+        benchmark=SyntheticBenchmark(),
+        model_id="naive",
+        model=LastValueModel(),
+        output_dir=tmp_path,
+        backtest_config=WalkForwardConfig(horizon=2, min_train_size=10, batch_size=4),
+    )
+    timings = json.loads((tmp_path / "results.json").read_text())["timings"]
+    stages = timings["stages"]
+    assert {"load", "fit", "predict", "validate", "score", "record"} <= set(stages)
+    # Predict latencies are per window even when windows are batched.
+    assert stages["predict"]["count"] == output.num_samples
+    assert stages["record"]["count"] == output.num_samples
+    assert 0.0 <= stages["predict"]["wall"]["p50"] <= stages["predict"]["wall"]["p95"]
+    assert stages["predict"]["wall"]["p95"] <= stages["predict"]["wall"]["max"]
+    assert timings["peak_rss_bytes"] > 0 and timings["wall_seconds"] > 0
+    events = list(iter_events(tmp_path / "events.jsonl"))
+    assert events[-1]["event_type"] == "timings"
+
+
+def test_profile_flag_writes_prof_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CFEVALS_CACHE", str(tmp_path / "cache"))
+    (tmp_path / "cache").mkdir()
+    index = [f"{1976 + i // 12}-{i % 12 + 1:02d}-01" for i in range(24)]
+    payload = {"index": index, "target": [float(i) for i in range(24)], "covariate": None}
+    (tmp_path / "cache" / "fred_unrate.json").write_text(json.dumps(payload))
+    argv = ["cfeval", "benchmark.fred.unrate.v1", "--model", "model.naive.last.v1", "--run-id", "prof"]
+    argv += ["--min-train-size", "12", "--horizon", "2", "--profile"]
+    monkeypatch.setattr(sys, "argv", argv)
+    cfeval.main()
+    output_dir = tmp_path / "outputs" / "benchmark.fred.unrate.v1" / "prof" / "model.naive.last.v1"
+    assert (output_dir / "profile.prof").stat().st_size > 0
+    assert (output_dir / "results.json").exists()
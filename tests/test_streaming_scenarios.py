@@ -0,0 +1,53 @@
+import json
+
+from cfevals.benchmarks.base import ScenarioBenchmark, ScenarioSample
+from cfevals.benchmarks.context_is_key import ContextIsKeyBenchmark
+from cfevals.engine.runner import Runner
+from cfevals.engine.scenario import ScenarioConfig
+from cfevals.models.naive import LastValueModel
+
+
+class ObservedBenchmark(ScenarioBenchmark):
+    def __init__(self, events_path):
+        self.events_path = events_path
+        self.events_seen = []
+
+    def load(self):
+        raise AssertionError("streaming runs must not call load()")
+
+    def iter_samples(self):
+        for idx in range(4):
+            lines = self.events_path.read_text().splitlines() if self.events_path.exists() else []
+            self.events_seen.append(len(lines))
+            yield ScenarioSample(sample_id=f"s{idx}", history=[float(idx)], future=[float(idx) + 1.0])
+
+
+def test_streaming_run_records_before_pulling_next_sample(tmp_path):
+    output_dir = tmp_path / "out"
+    benchmark = ObservedBenchmark(output_dir / "events.jsonl")
+    output = Runner().run(
+        benchmark_id="benchmark.observed",
+        benchmark=benchmark,
+        model_id="model.naive.last.v1",
+        model=LastValueModel(),
+        output_dir=output_dir,
+        scenario_config=ScenarioConfig(streaming=True, track_variance=True),
+    )
+    assert benchmark.events_seen == [0, 1, 2, 3]
+    assert output.num_samples == 4
+    payload = json.loads((output_dir / "results.json").read_text())
+    assert payload["metric_stats"]["rcrps"]["count"] == 4
+    assert payload["metrics"]["rcrps"] == 1.0
+
+
+def test_cik_iter_samples_uses_streaming_dataset(monkeypatch):
+    calls = {}
+
+    def fake_load_dataset(name, split, cache_dir=None, streaming=False):
+        calls["streaming"] = streaming
+        return iter([{"sample_id": f"cik-{i}", "history": [1.0], "future": [2.0]} for i in range(5)])
+
+    monkeypatch.setattr("datasets.load_dataset", fake_load_dataset)
+    samples = list(ContextIsKeyBenchmark(max_samples=3).iter_samples())
+    assert calls["streaming"] is True
+    assert [s.sample_id for s in samples] == ["cik-0", "cik-1", "cik-2"]
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from cfevals.benchmarks.base import TimeSeriesDataset, TimeSeriesPoint
+from cfevals.engine.backtest import WalkForwardBacktester, WalkForwardConfig
+from cfevals.metrics.point import MaseScale, mae, mase, point_metrics, rmse, smape
+from cfevals.models.naive import LastValueModel
+from cfevals.record import NullRecorder
+
+
+def test_point_metrics_match_scalar_functions():
+    rng = np.random.default_rng(1)
+    series = rng.normal(size=200)
+    series[[40, 41, 90]] = np.nan
+    actual = rng.normal(size=(50, 4))
+    actual[3] = 0.0
+    predicted = rng.normal(size=(50, 4))
+    predicted[3] = 0.0
+    hi = rng.integers(0, 200, size=50)
+    lo = np.maximum(hi - rng.integers(0, 60, size=50), 0)
+
+    metrics = point_metrics(actual, predicted, MaseScale.from_series(series).between(lo, hi))
+    for row in range(50):
+        assert metrics["mae"][row] == pytest.approx(mae(actual[row], predicted[row]))
+        assert metrics["rmse"][row] == pytest.approx(rmse(actual[row], predicted[row]))
+        assert metrics["smape"][row] == pytest.approx(smape(actual[row], predicted[row]))
+        expected = mase(actual[row], predicted[row], series[lo[row] : hi[row]])
+        assert metrics["mase"][row] == pytest.approx(expected, nan_ok=True)
+
+
+@pytest.mark.parametrize("max_train_size", [None, 15])
+@pytest.mark.parametrize("executor", ["serial", "threads"])
+def test_backtest_metrics_match_per_window_computation(max_train_size, executor):
+    start = datetime(2020, 1, 1)
+    values = [float((i * 7) % 11) for i in range(80)]
+    points = [TimeSeriesPoint(timestamp=start + timedelta(days=i), value=v) for i, v in enumerate(values)]
+    config = WalkForwardConfig(
+        horizon=3, step=2, min_train_size=10, max_train_size=max_train_size, executor=executor, workers=2
+    )
+    results = WalkForwardBacktester().run(
+        TimeSeriesDataset(points=points), LastValueModel(), config, recorder=NullRecorder()
+    )
+    windows = TimeSeriesDataset(points=points).walk_forward_windows(
+        horizon=3, step=2, min_train_size=10, max_train_size=max_train_size
+    )
+    for result, window in zip(results, windows, strict=True):
+        assert result.metrics["mae"] == pytest.approx(mae(window.future, result.forecast))
+        assert result.metrics["mase"] == pytest.approx(mase(window.future, result.forecast, window.history))